@@ -1,10 +1,13 @@
 import json
 from sources.linked_list import LinkedList, generate_random_linked_list
 from sources.pythagoras_tree import render_tree
-from sources.dijkstra_search import paths_dijkstra, create_transportation_network, draw_graph_with_path
+from sources.dijkstra_search import bidirectional_dijkstra, create_transportation_network, draw_graph_with_path
+from sources.compare_dijkstra import (print_point_to_point_results, print_queue_results,
+                                      run_point_to_point_benchmarks, run_queue_benchmarks)
 from sources.pyramid_visualizer import draw_heap
 from sources.binary_tree_bfs_dfs_animation import show_tree_traversal_visualizer
-from sources.calories_to_price_optimizer import greedy_algorithm, dynamic_programming
+from sources.calories_to_price_optimizer import greedy_algorithm, dynamic_programming, compare_performance
+from sources.benchmark_runner import print_results as print_benchmark_results
 from sources.dices_with_monte_carlo.monte_carlo_dices_analysis import run_analysis
 
 from sources.validation_utils import get_int_value, get_list_values, get_mix_max_values
@@ -19,6 +22,8 @@ def main():
         print("5. Binary Tree BFS/DFS Animation")
         print("6. Calories to Price Optimization")
         print("7. Monte Carlo Simulation for Two Dice Sums")
+        print("8. Dijkstra Priority Queue Benchmark")
+        print("9. Dijkstra Single-Pair Query Benchmark")
         print("0. Exit")
         print("******************************")
         choice = input("Select an option: ")
@@ -111,16 +116,12 @@ def main():
             start_station_name = f"S_{start_station}"
             target_station_name = f"S_{target_station}"
 
-            shortest_paths = paths_dijkstra(transportation_network, start_station_name)
-            for node, (distance, path) in shortest_paths.items():
-                print(f"From {start_station_name} to {node}: distance = {distance}, path = {' -> '.join(path)}")
-
+            shortest = bidirectional_dijkstra(transportation_network, start_station_name, target_station_name)
             print(f"\nShortest path from {start_station_name} to {target_station_name}: "
-                  f"{' -> '.join(shortest_paths[target_station_name][1])}, "
-                  f"distance = {shortest_paths[target_station_name][0]}")
+                  f"{' -> '.join(shortest.path)}, distance = {shortest.distance} "
+                  f"({shortest.settled} of {num_stations} stations settled)")
 
-            _, path_to_target = shortest_paths[target_station_name]
-            draw_graph_with_path(transportation_network, path_to_target,
+            draw_graph_with_path(transportation_network, shortest.path,
                                  title=f"Shortest path from {start_station_name} to {target_station_name}")
         elif choice == '4':
             import random
@@ -144,7 +145,9 @@ def main():
             print("Dynamic Programming Result:")
             print(f"Chosen items: {dyn_res.chosen}")
             print(f"Total Cost: {dyn_res.total_cost}")
-            print(f"Total Calories: {dyn_res.total_calories}")
+            print(f"Total Calories: {dyn_res.total_calories}\n")
+            print("Performance (per call):")
+            print_benchmark_results(compare_performance(data, [budget]))
         elif choice == '7':
             throws_array = input("Enter number of simulated throws "
                                  "(space separated, default '100 1000 10000 1000000'): ") or "100 1000 10000 1000000"
@@ -164,6 +167,14 @@ def main():
                 print(f"\nRunning simulation with N={num_rolls:,} rolls (seed={seed})...")
                 run_analysis(num_rolls, seed=seed)
 
+        elif choice == '8':
+            num_stations = get_int_value("Enter the number of stations [1000]: ", default_value=1000,
+                                         diapason=(10, 5000))
+            print_queue_results(run_queue_benchmarks(num_stations, [0.01, 0.05, 0.2, 0.5]))
+
+        elif choice == '9':
+            print_point_to_point_results(run_point_to_point_benchmarks([10**3, 10**4, 10**5]))
+
         elif choice == '0':
             print("Exiting the program.")
             break
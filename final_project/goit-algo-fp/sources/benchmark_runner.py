@@ -0,0 +1,147 @@
+import csv
+import json
+import statistics
+import timeit
+from dataclasses import dataclass, asdict, fields
+from pathlib import Path
+from typing import Callable, Dict, List
+
+
+@dataclass
+class BenchmarkStats:
+    """Timing of one benchmark; all times are seconds per single call."""
+    name: str
+    number: int
+    repeats: int
+    median: float
+    q1: float
+    q3: float
+    min: float
+    max: float
+
+    @property
+    def iqr(self) -> float:
+        return self.q3 - self.q1
+
+
+@dataclass
+class BaselineComparison:
+    name: str
+    baseline_median: float
+    current_median: float
+    change: float
+    regression: bool
+
+
+def calibrate(timer: timeit.Timer, min_time: float = 0.02, max_number: int = 10**6) -> int:
+    """
+    Find how many calls make one measurement last at least min_time
+    (the 1, 2, 5, 10, 20, 50, ... sequence used by `timeit.Timer.autorange`).
+    """
+    number = 1
+    while number < max_number:
+        for factor in (1, 2, 5):
+            candidate = number * factor
+            if timer.timeit(candidate) >= min_time:
+                return candidate
+        number *= 10
+    return max_number
+
+
+def run_benchmark(func: Callable[[], object], name: str = "", repeats: int = 7, warmup: int = 1,
+                  number: int | None = None, min_time: float = 0.02) -> BenchmarkStats:
+    """
+    Time func() with warmup runs and repeated measurements.
+
+    When number is None, the number of calls per measurement is calibrated so a
+    single measurement lasts at least min_time; this keeps fast functions well above
+    timer resolution. The median and quartiles of the per-call times are reported.
+    """
+    if repeats < 2:
+        raise ValueError("At least 2 repeats are needed to estimate the spread")
+
+    timer = timeit.Timer(func)
+    if number is None:
+        number = calibrate(timer, min_time)
+
+    for _ in range(warmup):
+        timer.timeit(number)
+
+    samples = sorted(timer.timeit(number) / number for _ in range(repeats))
+    q1, median, q3 = statistics.quantiles(samples, n=4, method='inclusive')
+
+    return BenchmarkStats(name=name or getattr(func, '__name__', 'benchmark'), number=number, repeats=repeats,
+                          median=median, q1=q1, q3=q3, min=samples[0], max=samples[-1])
+
+
+def save_results(results: List[BenchmarkStats], path) -> None:
+    """Save results as JSON or CSV, depending on the file extension."""
+    path = Path(path)
+    rows = [asdict(result) for result in results]
+
+    if path.suffix == '.csv':
+        with path.open('w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=[field.name for field in fields(BenchmarkStats)])
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        path.write_text(json.dumps(rows, indent=2))
+
+
+def load_results(path) -> Dict[str, BenchmarkStats]:
+    path = Path(path)
+
+    if path.suffix == '.csv':
+        with path.open(newline='') as f:
+            rows = list(csv.DictReader(f))
+    else:
+        rows = json.loads(path.read_text())
+
+    results = {}
+    for row in rows:
+        result = BenchmarkStats(
+            name=row['name'],
+            number=int(row['number']),
+            repeats=int(row['repeats']),
+            **{key: float(row[key]) for key in ('median', 'q1', 'q3', 'min', 'max')}
+        )
+        results[result.name] = result
+    return results
+
+
+def compare_with_baseline(results: List[BenchmarkStats], baseline: Dict[str, BenchmarkStats],
+                          tolerance: float = 0.10) -> List[BaselineComparison]:
+    """
+    Compare results with a saved baseline by name. A benchmark is a regression when its
+    median is more than `tolerance` slower and its interquartile range lies entirely
+    above the baseline's, so ordinary noise is not flagged.
+    """
+    comparisons = []
+
+    for result in results:
+        previous = baseline.get(result.name)
+        if previous is None:
+            continue
+
+        change = result.median / previous.median - 1 if previous.median > 0 else 0.0
+        regression = change > tolerance and result.q1 > previous.q3
+        comparisons.append(BaselineComparison(result.name, previous.median, result.median, change, regression))
+
+    return comparisons
+
+
+def print_results(results: List[BenchmarkStats]) -> None:
+    print(f"{'Benchmark':<40} | {'Median':>12} | {'IQR':>12} | {'Calls x repeats':>16}")
+    print("-" * 90)
+    for result in results:
+        print(f"{result.name:<40} | {result.median:>11.9f}s | {result.iqr:>11.9f}s | "
+              f"{f'{result.number} x {result.repeats}':>16}")
+
+
+def print_baseline_comparison(comparisons: List[BaselineComparison]) -> None:
+    print(f"{'Benchmark':<40} | {'Baseline':>12} | {'Current':>12} | {'Change':>8} |")
+    print("-" * 90)
+    for comparison in comparisons:
+        flag = "REGRESSION" if comparison.regression else ""
+        print(f"{comparison.name:<40} | {comparison.baseline_median:>11.9f}s | {comparison.current_median:>11.9f}s | "
+              f"{comparison.change:>+7.1%} | {flag}")
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import Dict, List, Tuple
 
+from .benchmark_runner import BenchmarkStats, run_benchmark
+
 
 Items = Dict[str, Dict[str, int]]
 
@@ -95,6 +97,18 @@ def dynamic_programming(items: Items, budget: int) -> SelectionResult:
     return SelectionResult(chosen=chosen, total_cost=total_cost, total_calories=total_calories)
 
 
+def compare_performance(items: Items, budgets: List[int]) -> List[BenchmarkStats]:
+    """
+    Time greedy and dynamic programming solutions for every budget
+    (median of repeated, automatically calibrated measurements).
+    """
+    results: List[BenchmarkStats] = []
+    for budget in budgets:
+        results.append(run_benchmark(lambda: greedy_algorithm(items, budget), name=f"greedy/{budget}"))
+        results.append(run_benchmark(lambda: dynamic_programming(items, budget), name=f"dynamic/{budget}"))
+    return results
+
+
 if __name__ == "__main__":
     items = {
         "pizza": {"cost": 50, "calories": 300},
@@ -0,0 +1,122 @@
+import random
+from dataclasses import dataclass
+from typing import Dict, List
+
+from .addressable_heap import PRIORITY_QUEUES
+from .benchmark_runner import run_benchmark
+from .dijkstra_search import (
+    bidirectional_dijkstra,
+    create_transportation_network,
+    dijkstra_path,
+    paths_dijkstra,
+    shortest_path_tree,
+)
+
+# 'lazy' is heapq with stale entries, the others are the addressable heaps
+QUEUE_NAMES = ['lazy', *PRIORITY_QUEUES]
+
+
+@dataclass
+class QueueBenchmarkResult:
+    stations: int
+    connections: int
+    times: Dict[str, float]  # seconds per run from one start station
+    peak_queue_sizes: Dict[str, int]
+
+
+@dataclass
+class PointToPointBenchmarkResult:
+    stations: int
+    connections: int
+    pair_count: int
+    times: Dict[str, float]  # seconds for all pairs
+    mean_settled: Dict[str, float]  # nodes settled per query
+
+
+def run_queue_benchmarks(stations: int, densities: List[float], repeats: int = 3,
+                         seed: int = 42) -> List[QueueBenchmarkResult]:
+    """
+    Dijkstra from S_1 with every priority queue on random weighted networks of the given
+    edge densities (share of all possible station pairs that are connected).
+    """
+    results = []
+
+    for density in densities:
+        random.seed(seed)
+        connections = int(density * stations * (stations - 1) / 2)
+        graph = create_transportation_network(stations, connections, weights=True)
+
+        times, peak_queue_sizes = {}, {}
+        for name in QUEUE_NAMES:
+            queue = None if name == 'lazy' else name
+            peak_queue_sizes[name] = shortest_path_tree(graph, "S_1", queue).peak_queue_size
+            times[name] = run_benchmark(lambda: shortest_path_tree(graph, "S_1", queue), name=name,
+                                        repeats=repeats, warmup=0, number=1).median
+        results.append(QueueBenchmarkResult(stations, graph.number_of_edges(), times, peak_queue_sizes))
+
+    return results
+
+
+def print_queue_results(results: List[QueueBenchmarkResult]) -> None:
+    print("\n" + "=" * 100)
+    print(f"DIJKSTRA PRIORITY QUEUES ON {results[0].stations} STATIONS (seconds per run / peak queue entries)")
+    print("=" * 100)
+    print(f"{'Connections':>11} | " + " | ".join(f"{name:>18}" for name in QUEUE_NAMES))
+    print("-" * 100)
+
+    for result in results:
+        print(f"{result.connections:>11} | " + " | ".join(
+            f"{result.times[name]:>9.4f}s / {result.peak_queue_sizes[name]:>6}" for name in QUEUE_NAMES))
+
+
+def run_point_to_point_benchmarks(sizes: List[int], pair_count: int = 20, average_degree: int = 4,
+                                  repeats: int = 3, seed: int = 42) -> List[PointToPointBenchmarkResult]:
+    """
+    Answer pair_count random start -> target queries on a sparse random network of each
+    size: with paths_dijkstra (every distance and path from start, as main.py did), with
+    dijkstra_path (stops at target) and with bidirectional_dijkstra.
+    """
+    results = []
+
+    for stations in sizes:
+        random.seed(seed)
+        graph = create_transportation_network(stations, stations * average_degree // 2, weights=True)
+        pairs = [(f"S_{random.randint(1, stations)}", f"S_{random.randint(1, stations)}") for _ in range(pair_count)]
+
+        queries = {
+            'all paths': lambda: [paths_dijkstra(graph, start)[target] for start, target in pairs],
+            'early exit': lambda: [dijkstra_path(graph, start, target) for start, target in pairs],
+            'bidirectional': lambda: [bidirectional_dijkstra(graph, start, target) for start, target in pairs],
+        }
+        times = {name: run_benchmark(func, name=name, repeats=repeats, warmup=0, number=1).median
+                 for name, func in queries.items()}
+        mean_settled = {
+            'all paths': sum(shortest_path_tree(graph, start).settled for start, _ in pairs) / pair_count,
+            'early exit': sum(dijkstra_path(graph, *pair).settled for pair in pairs) / pair_count,
+            'bidirectional': sum(bidirectional_dijkstra(graph, *pair).settled for pair in pairs) / pair_count,
+        }
+        results.append(PointToPointBenchmarkResult(stations, graph.number_of_edges(), pair_count, times,
+                                                   mean_settled))
+
+    return results
+
+
+def print_point_to_point_results(results: List[PointToPointBenchmarkResult]) -> None:
+    print("\n" + "=" * 100)
+    print(f"SINGLE-PAIR QUERIES ({results[0].pair_count} random pairs: seconds for all / nodes settled per query)")
+    print("=" * 100)
+    names = list(results[0].times)
+    print(f"{'Stations':>9} | " + " | ".join(f"{name:>21}" for name in names) + f" | {'speedup':>13}")
+    print("-" * 100)
+
+    for result in results:
+        baseline = result.times['all paths']
+        speedups = "/".join(f"{baseline / result.times[name]:.1f}" for name in names[1:])
+        print(f"{result.stations:>9} | " + " | ".join(
+            f"{result.times[name]:>9.3f}s / {result.mean_settled[name]:>9.0f}" for name in names)
+            + f" | {speedups + 'x':>13}")
+
+
+if __name__ == "__main__":
+    print_queue_results(run_queue_benchmarks(1000, [0.01, 0.05, 0.2, 0.5]))
+    print_point_to_point_results(run_point_to_point_benchmarks([10**3, 10**4, 10**5]))
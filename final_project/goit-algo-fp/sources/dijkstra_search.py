@@ -3,19 +3,36 @@ import matplotlib.pyplot as plt
 import networkx as nx
 import random
 
+from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from .addressable_heap import make_priority_queue
 
-def paths_dijkstra(graph: nx.Graph, start: str) -> Dict[str, Tuple[float, List[str]]]:
+
+@dataclass
+class ShortestPathTree:
+    """Result of one Dijkstra run: distances and predecessors of every node, plus queue statistics."""
+    start: Any
+    distances: Dict[Any, float]
+    predecessors: Dict[Any, Any]
+    settled: int  # nodes whose final distance was taken from the queue
+    peak_queue_size: int  # largest number of entries in the queue, stale ones included
+
+    def path_to(self, target) -> List[Any]:
+        if self.distances[target] == float("inf"):
+            return []
+        return _follow(self.predecessors, target)
+
+
+def shortest_path_tree(graph: nx.Graph, start: str, queue: str | None = None) -> ShortestPathTree:
     """
-    Dijkstra (binary heap) that returns for each node:
-      (shortest_distance_from_start, path_as_list_of_nodes)
+    Dijkstra from start over the whole graph.
 
-    Notes:
-    - Works for nx.Graph and nx.DiGraph.
-    - Requires non-negative edge weights.
-    - Uses "lazy deletion" for heap entries (skip outdated distances).
-    - Avoids pushing full paths into the heap (stores predecessors instead).
+    queue=None uses heapq with lazy deletion: an improved distance pushes a new entry and
+    outdated ones are skipped when popped, so on dense graphs the heap holds up to one
+    entry per edge. A name from PRIORITY_QUEUES ('binary', '4-ary', 'pairing') uses an
+    addressable heap instead, where an improved distance is a decrease_key and the queue
+    never holds more than one entry per node.
     """
     if start not in graph:
         raise KeyError(f"Start node {start!r} is not in the graph.")
@@ -28,36 +45,182 @@ def paths_dijkstra(graph: nx.Graph, start: str) -> Dict[str, Tuple[float, List[s
 
     dist: Dict[str, float] = {node: float("inf") for node in graph.nodes}
     prev: Dict[str, str | None] = {node: None for node in graph.nodes}
-
     dist[start] = 0.0
-    heap: List[Tuple[float, str]] = [(0.0, start)]  # (distance, node)
+    settled = 0
 
-    while heap:
-        current_dist, u = heapq.heappop(heap)
+    if queue is None:
+        heap: List[Tuple[float, str]] = [(0.0, start)]  # (distance, node)
+        peak = 1
 
-        if current_dist != dist[u]:
-            continue
+        while heap:
+            current_dist, u = heapq.heappop(heap)
+
+            if current_dist != dist[u]:
+                continue
+            settled += 1
+
+            for v in graph.neighbors(u):
+                w = graph[u][v].get("weight", 1)
+                cand = current_dist + w
+                if cand < dist[v]:
+                    dist[v] = cand
+                    prev[v] = u
+                    heapq.heappush(heap, (cand, v))
+            if len(heap) > peak:
+                peak = len(heap)
+
+        return ShortestPathTree(start, dist, prev, settled, peak)
+
+    pq = make_priority_queue(queue)
+    pq.push(start, 0.0)
+    peak = 1
+
+    while pq:
+        u, current_dist = pq.pop()
+        settled += 1
 
         for v in graph.neighbors(u):
             w = graph[u][v].get("weight", 1)
             cand = current_dist + w
             if cand < dist[v]:
+                dist[v] = cand
+                prev[v] = u
+                pq.push_or_decrease(v, cand)
+        if len(pq) > peak:
+            peak = len(pq)
+
+    return ShortestPathTree(start, dist, prev, settled, peak)
+
+
+def paths_dijkstra(graph: nx.Graph, start: str, queue: str | None = None) -> Dict[str, Tuple[float, List[str]]]:
+    """
+    Dijkstra (binary heap) that returns for each node:
+      (shortest_distance_from_start, path_as_list_of_nodes)
+
+    Notes:
+    - Works for nx.Graph and nx.DiGraph.
+    - Requires non-negative edge weights.
+    - Uses "lazy deletion" for heap entries (skip outdated distances) by default;
+      queue='binary' / '4-ary' / 'pairing' selects an addressable heap with decrease_key
+      (see shortest_path_tree).
+    - Avoids pushing full paths into the heap (stores predecessors instead).
+    """
+    tree = shortest_path_tree(graph, start, queue)
+    return {node: (tree.distances[node], tree.path_to(node)) for node in graph.nodes}
+
+
+@dataclass
+class ShortestPath:
+    """Answer of a single start -> target query."""
+    distance: float  # inf when target is unreachable
+    path: List[Any]  # empty when target is unreachable
+    settled: int  # nodes taken from the queue(s) with their final distance
+
+
+def _edge_weight(data: Dict[str, Any]) -> float:
+    w = data.get("weight", 1)
+    if w < 0:
+        raise ValueError("Dijkstra's algorithm requires non-negative edge weights.")
+    return w
+
+
+def dijkstra_path(graph: nx.Graph, start: str, target: str) -> ShortestPath:
+    """
+    Dijkstra from start that stops as soon as target is settled: nodes farther from start
+    than target are never expanded, and only the requested path is built.
+    Negative weights are reported when they are reached, not by a scan of every edge.
+    """
+    for node in (start, target):
+        if node not in graph:
+            raise KeyError(f"Node {node!r} is not in the graph.")
+
+    dist: Dict[Any, float] = {start: 0.0}
+    prev: Dict[Any, Any] = {start: None}
+    done = set()
+    heap: List[Tuple[float, Any]] = [(0.0, start)]
+
+    while heap:
+        current_dist, u = heapq.heappop(heap)
+        if u in done:
+            continue
+        done.add(u)
+        if u == target:
+            return ShortestPath(current_dist, _follow(prev, target), len(done))
+
+        for v, data in graph[u].items():
+            cand = current_dist + _edge_weight(data)
+            if cand < dist.get(v, float("inf")):
                 dist[v] = cand
                 prev[v] = u
                 heapq.heappush(heap, (cand, v))
 
-    def build_path(target: str) -> List[str]:
-        if dist[target] == float("inf"):
-            return []
-        path: List[str] = []
-        cur: str | None = target
-        while cur is not None:
-            path.append(cur)
-            cur = prev[cur]
-        path.reverse()
-        return path
+    return ShortestPath(float("inf"), [], len(done))
+
 
-    return {node: (dist[node], build_path(node)) for node in graph.nodes}
+def bidirectional_dijkstra(graph: nx.Graph, start: str, target: str) -> ShortestPath:
+    """
+    Two Dijkstra searches, forward from start and backward from target (along incoming
+    edges for an nx.DiGraph), each step advancing the side whose queue head is closer.
+    Every edge that reaches a node already labelled by the other side is a candidate
+    path; the search stops once the two queue heads together are no shorter than the
+    best candidate. On graphs that grow in all directions the two balls of radius d/2
+    hold far fewer nodes than the single ball of radius d.
+    """
+    for node in (start, target):
+        if node not in graph:
+            raise KeyError(f"Node {node!r} is not in the graph.")
+    if start == target:
+        return ShortestPath(0.0, [start], 1)
+
+    backward_edges = graph.pred if graph.is_directed() else graph.adj
+    # index 0 is the forward search, 1 the backward one
+    edges = (graph.adj, backward_edges)
+    dist: Tuple[Dict[Any, float], Dict[Any, float]] = ({start: 0.0}, {target: 0.0})
+    prev: Tuple[Dict[Any, Any], Dict[Any, Any]] = ({start: None}, {target: None})
+    done = (set(), set())
+    heaps: Tuple[List[Tuple[float, Any]], List[Tuple[float, Any]]] = ([(0.0, start)], [(0.0, target)])
+    best, meeting = float("inf"), None
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        other = 1 - side
+
+        current_dist, u = heapq.heappop(heaps[side])
+        if u in done[side]:
+            continue
+        done[side].add(u)
+
+        for v, data in edges[side][u].items():
+            cand = current_dist + _edge_weight(data)
+            if cand < dist[side].get(v, float("inf")):
+                dist[side][v] = cand
+                prev[side][v] = u
+                heapq.heappush(heaps[side], (cand, v))
+            if v in dist[other] and cand + dist[other][v] < best:
+                best, meeting = cand + dist[other][v], v
+
+    settled = len(done[0]) + len(done[1])
+    if meeting is None:
+        return ShortestPath(float("inf"), [], settled)
+
+    path = _follow(prev[0], meeting)
+    node = prev[1][meeting]
+    while node is not None:
+        path.append(node)
+        node = prev[1][node]
+    return ShortestPath(best, path, settled)
+
+
+def _follow(prev: Dict[Any, Any], target) -> List[Any]:
+    path: List[Any] = []
+    cur = target
+    while cur is not None:
+        path.append(cur)
+        cur = prev[cur]
+    path.reverse()
+    return path
 
 
 def draw_graph_with_path(
@@ -176,10 +339,14 @@ def create_transportation_network(num_stations: int, num_connections: int, weigh
     for i in range(num_stations):
         graph.add_node(f"S_{i+1}")
 
-    while graph.number_of_edges() < num_connections:
+    # number_of_edges() walks every node, so keep the count here instead
+    edges = 0
+    while edges < num_connections:
         station_a = f"S_{random.randint(1, num_stations)}"
         station_b = f"S_{random.randint(1, num_stations)}"
         if station_a != station_b:
+            if not graph.has_edge(station_a, station_b):
+                edges += 1
             graph.add_edge(station_a, station_b, weight=random.randint(1, 10) if weights else 1)
 
     return graph
@@ -0,0 +1,124 @@
+import heapq
+import random
+
+import pytest
+
+from sources.addressable_heap import PRIORITY_QUEUES, AddressableHeap, PairingHeap, make_priority_queue
+
+
+@pytest.fixture(params=sorted(PRIORITY_QUEUES))
+def heap(request):
+    return make_priority_queue(request.param)
+
+
+class TestPriorityQueues:
+    def test_make_priority_queue(self):
+        assert isinstance(make_priority_queue('binary'), AddressableHeap)
+        assert make_priority_queue('4-ary').arity == 4
+        assert isinstance(make_priority_queue('pairing'), PairingHeap)
+        with pytest.raises(ValueError):
+            make_priority_queue('fibonacci')
+
+    def test_arity_below_two(self):
+        with pytest.raises(ValueError):
+            AddressableHeap(1)
+
+    def test_empty(self, heap):
+        assert len(heap) == 0
+        assert not heap
+        with pytest.raises(IndexError):
+            heap.pop()
+        with pytest.raises(IndexError):
+            heap.peek()
+
+    def test_pops_in_priority_order(self, heap):
+        priorities = list(range(50))
+        random.Random(1).shuffle(priorities)
+        for item, priority in enumerate(priorities):
+            heap.push(item, priority)
+        assert len(heap) == 50
+        assert heap.peek()[1] == 0
+        assert [heap.pop()[1] for _ in range(50)] == list(range(50))
+
+    def test_duplicate_push(self, heap):
+        heap.push('a', 1)
+        with pytest.raises(ValueError):
+            heap.push('a', 0)
+        assert len(heap) == 1
+
+    def test_decrease_key(self, heap):
+        for item, priority in [('a', 5), ('b', 3), ('c', 8), ('d', 4)]:
+            heap.push(item, priority)
+        heap.decrease_key('c', 1)
+        assert heap.priority('c') == 1
+        assert heap.peek() == ('c', 1)
+        heap.decrease_key('a', 5)  # equal priority is allowed
+        with pytest.raises(ValueError):
+            heap.decrease_key('b', 10)
+        assert heap.priority('b') == 3
+        with pytest.raises(KeyError):
+            heap.decrease_key('x', 0)
+        assert [heap.pop() for _ in range(4)] == [('c', 1), ('b', 3), ('d', 4), ('a', 5)]
+
+    def test_push_or_decrease(self, heap):
+        assert heap.push_or_decrease('a', 5)
+        assert not heap.push_or_decrease('a', 7)
+        assert not heap.push_or_decrease('a', 5)
+        assert heap.push_or_decrease('a', 2)
+        assert heap.priority('a') == 2
+        assert len(heap) == 1
+
+    def test_handle_invalid_after_pop(self, heap):
+        heap.push('a', 1)
+        heap.push('b', 2)
+        assert heap.pop() == ('a', 1)
+        assert 'a' not in heap
+        assert 'b' in heap
+        with pytest.raises(KeyError):
+            heap.priority('a')
+        with pytest.raises(KeyError):
+            heap.decrease_key('a', 0)
+        # a popped item can be queued again
+        heap.push('a', 0)
+        assert heap.pop() == ('a', 0)
+        assert heap.pop() == ('b', 2)
+
+    def test_random_operations_match_heapq(self, heap):
+        # reference: heapq with lazy deletion plus a dict of the current priorities
+        rng = random.Random(42)
+        current = {}
+        reference = []
+
+        for step in range(5000):
+            operation = rng.random()
+            if operation < 0.4 or not current:
+                item = rng.randrange(300)
+                priority = rng.randrange(1000)
+                if item in current:
+                    with pytest.raises(ValueError):
+                        heap.push(item, priority)
+                    continue
+                heap.push(item, priority)
+                current[item] = priority
+                heapq.heappush(reference, (priority, item))
+            elif operation < 0.7:
+                item = rng.choice(list(current))
+                priority = rng.randrange(current[item] + 1)
+                heap.decrease_key(item, priority)
+                current[item] = priority
+                heapq.heappush(reference, (priority, item))
+            else:
+                while reference[0][1] not in current or current[reference[0][1]] != reference[0][0]:
+                    heapq.heappop(reference)
+                item, priority = heap.pop()
+                # ties may come out in any order, so only the priority has to match
+                assert priority == reference[0][0]
+                assert current.pop(item) == priority
+                assert item not in heap
+
+            assert len(heap) == len(current)
+            for item in rng.sample(list(current), min(3, len(current))):
+                assert heap.priority(item) == current[item]
+
+        drained = [heap.pop()[1] for _ in range(len(current))]
+        assert drained == sorted(current.values())
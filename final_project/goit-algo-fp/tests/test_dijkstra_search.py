@@ -0,0 +1,132 @@
+import random
+
+import pytest
+
+nx = pytest.importorskip("networkx")
+pytest.importorskip("matplotlib")
+
+from sources.dijkstra_search import (
+    ShortestPath,
+    bidirectional_dijkstra,
+    create_transportation_network,
+    dijkstra_path,
+    paths_dijkstra,
+)
+
+QUERIES = [dijkstra_path, bidirectional_dijkstra]
+
+
+def path_weight(graph, path):
+    return sum(graph[u][v].get("weight", 1) for u, v in zip(path, path[1:]))
+
+
+def random_graphs():
+    random.seed(42)
+    yield create_transportation_network(30, 45, weights=True)
+    yield create_transportation_network(150, 300, weights=True)
+    yield create_transportation_network(40, 400, weights=True)
+    graph = create_transportation_network(50, 60, weights=True)
+    graph.add_node("Isolated")
+    yield graph
+
+
+@pytest.mark.parametrize("query", QUERIES)
+class TestSinglePairDijkstra:
+    def test_matches_networkx(self, query):
+        rng = random.Random(1)
+        for graph in random_graphs():
+            nodes = list(graph.nodes)
+            for _ in range(40):
+                start, target = rng.choice(nodes), rng.choice(nodes)
+                expected = nx.single_source_dijkstra_path_length(graph, start)
+                result = query(graph, start, target)
+                if target not in expected:
+                    assert result.distance == float("inf")
+                    assert result.path == []
+                    continue
+                assert result.distance == expected[target]
+                assert result.path[0] == start and result.path[-1] == target
+                assert path_weight(graph, result.path) == result.distance
+
+    def test_matches_paths_dijkstra(self, query):
+        random.seed(5)
+        graph = create_transportation_network(60, 90, weights=True)
+        all_paths = paths_dijkstra(graph, "S_1")
+        for target, (distance, _) in all_paths.items():
+            assert query(graph, "S_1", target).distance == distance
+
+    def test_source_is_target(self, query):
+        graph = nx.Graph()
+        graph.add_weighted_edges_from([("A", "B", 1)])
+        result = query(graph, "A", "A")
+        assert result.distance == 0
+        assert result.path == ["A"]
+
+    def test_unreachable_target(self, query):
+        graph = nx.Graph()
+        graph.add_weighted_edges_from([("A", "B", 1), ("B", "C", 2), ("D", "E", 1)])
+        graph.add_node("F")
+        for target in ("D", "F"):
+            result = query(graph, "A", target)
+            assert result.distance == float("inf")
+            assert result.path == []
+
+    def test_zero_weight_edges(self, query):
+        graph = nx.Graph()
+        graph.add_weighted_edges_from([("A", "B", 0), ("B", "C", 0), ("C", "D", 0), ("A", "D", 1)])
+        result = query(graph, "A", "D")
+        assert result.distance == 0
+        assert result.path == ["A", "B", "C", "D"]
+
+    def test_zero_weight_ties(self, query):
+        graph = nx.Graph()
+        graph.add_weighted_edges_from([("A", "B", 0), ("B", "C", 1), ("A", "C", 1), ("C", "D", 0)])
+        result = query(graph, "A", "D")
+        assert result.distance == 1
+        assert path_weight(graph, result.path) == 1
+
+    def test_directed_graph(self, query):
+        graph = nx.DiGraph()
+        graph.add_weighted_edges_from([("A", "B", 1), ("B", "C", 1), ("C", "A", 1), ("A", "C", 5)])
+        result = query(graph, "A", "C")
+        assert isinstance(result, ShortestPath)
+        assert (result.distance, result.path) == (2, ["A", "B", "C"])
+        assert query(graph, "C", "B").path == ["C", "A", "B"]
+        graph.add_node("D")
+        graph.add_edge("D", "A", weight=1)
+        assert query(graph, "A", "D").path == []
+
+    def test_random_directed_graphs(self, query):
+        rng = random.Random(3)
+        for _ in range(20):
+            graph = nx.gnm_random_graph(40, 120, seed=rng.randrange(10**6), directed=True)
+            for u, v in graph.edges:
+                graph[u][v]["weight"] = rng.randint(0, 10)
+            start, target = rng.randrange(40), rng.randrange(40)
+            try:
+                expected = nx.dijkstra_path_length(graph, start, target)
+            except nx.NetworkXNoPath:
+                expected = float("inf")
+            assert query(graph, start, target).distance == expected
+
+    def test_negative_weight(self, query):
+        graph = nx.Graph()
+        graph.add_weighted_edges_from([("A", "B", 1), ("B", "C", -1)])
+        with pytest.raises(ValueError):
+            query(graph, "A", "C")
+
+    def test_unknown_node(self, query):
+        graph = nx.Graph([("A", "B")])
+        with pytest.raises(KeyError):
+            query(graph, "A", "Z")
+
+
+class TestBidirectionalSettlesFewerNodes:
+    def test_fewer_than_one_sided(self):
+        random.seed(42)
+        graph = create_transportation_network(2000, 4000, weights=True)
+        one_sided = bidirectional = 0
+        for i in range(2, 22):
+            one_sided += dijkstra_path(graph, "S_1", f"S_{i * 90}").settled
+            bidirectional += bidirectional_dijkstra(graph, "S_1", f"S_{i * 90}").settled
+        assert bidirectional < one_sided
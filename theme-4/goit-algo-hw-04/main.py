@@ -1,11 +1,12 @@
 from sources.sorting_algorithms import (
-            generate_random_list,
-            measure_time,
-            merge_sort,
-            insertion_sort,
+            INPUT_GENERATORS,
+            compare_sorts,
+            print_comparison,
+            tune_cutoff,
         )
 
-from sources.merge_lists import merge_k_lists
+from sources.merge_lists import compare_merge_k, merge_k_iterables, merge_k_lists, print_merge_k_comparison
+from sources.external_sort import print_external_sort_results, run_external_sort_benchmarks
 
 
 def main():
@@ -13,6 +14,8 @@ def main():
         print("\n************ MENU ************")
         print("1. Compare Sorting Algorithms")
         print("2. Merge K Sorted Lists")
+        print("3. External Sort Benchmark")
+        print("4. Merge K Lists Benchmark")
         print("0. Exit")
         print("******************************")
 
@@ -26,23 +29,33 @@ def main():
             else:
                 print(f"Using default size: {size}")
 
-            arr = generate_random_list(size)
+            cutoff = tune_cutoff()
+            print(f"Hybrid merge sort cutoff tuned on this machine: {cutoff}")
 
-            merge_time = measure_time(merge_sort, arr)
-            insertion_time = measure_time(insertion_sort, arr)
-            timsort_time = measure_time(sorted, arr)
-
-            print(f"Array Size: {size}")
-            print(f"Merge Sort Time: {merge_time:.6f} seconds")
-            print(f"Insertion Sort Time: {insertion_time:.6f} seconds")
-            print(f"Timsort (built-in sorted) Time: {timsort_time:.6f} seconds")
-            print("-" * 40)
+            for input_kind, generate in INPUT_GENERATORS.items():
+                print_comparison(f"Input: {input_kind}, Array Size: {size}", compare_sorts(generate(size), cutoff))
 
         elif choice == '2':
             lists = [[1, 4, 5], [1, 3, 4], [2, 6]]
             print("Merging the following sorted lists:", lists)
             merged_list = merge_k_lists(lists)
             print("Sorted List:", merged_list)
+            print("Lazy heap merge without duplicates:", list(merge_k_iterables(lists, unique=True)))
+        elif choice == '3':
+            size_mb = 100
+            size_input = input(f"Enter size of the file to sort in MB (default {size_mb}): ")
+            if size_input.isdigit():
+                size_mb = int(size_input)
+            memory_mb = 64
+            memory_input = input(f"Enter memory budget in MB (default {memory_mb}): ")
+            if memory_input.isdigit():
+                memory_mb = int(memory_input)
+
+            results = run_external_sort_benchmarks([size_mb * 2**20], worker_counts=[1, 2, 4],
+                                                   memory_limit=memory_mb * 2**20)
+            print_external_sort_results(results)
+        elif choice == '4':
+            print_merge_k_comparison(compare_merge_k([10, 100, 1000, 10000]))
         elif choice == '0':
             print("Exiting the program.")
             break
@@ -0,0 +1,206 @@
+import heapq
+import os
+import random
+import tempfile
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List
+
+# input, runs and output are raw native-endian signed 64-bit integers
+ITEM_TYPECODE = 'q'
+ITEM_SIZE = array(ITEM_TYPECODE).itemsize
+
+# a chunk is sorted as a list of int objects: ~8 bytes in the array, 8 for the list
+# pointer and 32 for the int object, plus the array written back. Used to turn the
+# memory budget into a chunk length.
+SORT_BYTES_PER_ITEM = 64
+
+MAX_BUFFER_ITEMS = 1 << 20
+
+
+@dataclass
+class ExternalSortStats:
+    items: int
+    runs: int
+    merge_passes: int
+    chunk_items: int
+    sort_time: float
+    merge_time: float
+
+
+def write_random_ints(path, count: int, seed: int | None = None, block_items: int = 1 << 20) -> None:
+    """Synthetic input: count random 64-bit integers, written in blocks to keep memory flat."""
+    rng = random.Random(seed)
+    with open(path, 'wb') as f:
+        for start in range(0, count, block_items):
+            size = min(block_items, count - start)
+            array(ITEM_TYPECODE, (rng.getrandbits(63) - (1 << 62) for _ in range(size))).tofile(f)
+
+
+def read_ints(path, buffer_items: int = 1 << 16, offset: int = 0, count: int | None = None) -> Iterator[int]:
+    """Yield the integers stored in path, reading buffer_items at a time."""
+    with open(path, 'rb') as f:
+        f.seek(offset * ITEM_SIZE)
+        remaining = count
+        while remaining is None or remaining > 0:
+            block = array(ITEM_TYPECODE)
+            size = buffer_items if remaining is None else min(buffer_items, remaining)
+            try:
+                block.fromfile(f, size)
+            except EOFError:
+                pass  # fromfile keeps the items it could read before the end of the file
+            if not block:
+                return
+            if remaining is not None:
+                remaining -= len(block)
+            yield from block
+
+
+def write_ints(path, values: Iterable[int], buffer_items: int = 1 << 16) -> int:
+    """Write values to path in blocks of buffer_items; return how many were written."""
+    written = 0
+    block = array(ITEM_TYPECODE)
+    with open(path, 'wb') as f:
+        for value in values:
+            block.append(value)
+            if len(block) >= buffer_items:
+                block.tofile(f)
+                written += len(block)
+                block = array(ITEM_TYPECODE)
+        block.tofile(f)
+        written += len(block)
+    return written
+
+
+def sort_chunk(input_path, offset: int, count: int, run_path) -> str:
+    """Worker: read count items starting at item offset, sort them and write a run file."""
+    block = array(ITEM_TYPECODE)
+    with open(input_path, 'rb') as f:
+        f.seek(offset * ITEM_SIZE)
+        block.fromfile(f, count)
+
+    values = block.tolist()
+    del block
+    values.sort()
+    with open(run_path, 'wb') as f:
+        array(ITEM_TYPECODE, values).tofile(f)
+    return run_path
+
+
+def merge_run_files(run_paths: List[str], output_path, buffer_items: int) -> int:
+    """k-way merge of sorted run files through a heap, with buffered reads and writes."""
+    readers = [read_ints(path, buffer_items) for path in run_paths]
+    return write_ints(output_path, heapq.merge(*readers), buffer_items)
+
+
+def external_sort(input_path, output_path, memory_limit: int = 256 * 2**20, workers: int | None = None,
+                  fan_in: int = 64, temp_dir=None) -> ExternalSortStats:
+    """
+    Sort a file of 64-bit integers that may be larger than memory.
+
+    1. The input is cut into chunks sized so that `workers` chunks being sorted at the
+       same time fit in memory_limit. Each worker process reads its own byte range,
+       sorts it and writes a sorted run to a temporary file, so no data is pickled.
+    2. The runs are merged with a heap, at most fan_in at a time. Like merge_k_lists,
+       which merges halves until one list is left, groups of runs are merged into
+       longer runs pass by pass until one pass can merge all of them into output_path.
+       The read buffers of the fan_in runs and the write buffer share memory_limit.
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+
+    workers = workers or os.cpu_count() or 1
+    total = os.path.getsize(input_path) // ITEM_SIZE
+    chunk_items = max(1, memory_limit // (workers * SORT_BYTES_PER_ITEM))
+    buffer_items = max(1024, min(MAX_BUFFER_ITEMS, memory_limit // ((fan_in + 1) * ITEM_SIZE)))
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        start = time.perf_counter()
+        tasks = [(input_path, offset, min(chunk_items, total - offset), os.path.join(directory, f"run-{index}.bin"))
+                 for index, offset in enumerate(range(0, total, chunk_items))]
+        if workers == 1 or len(tasks) <= 1:
+            runs = [sort_chunk(*task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                runs = list(pool.map(sort_chunk, *zip(*tasks)))
+        sort_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        merge_passes = 1
+        while len(runs) > fan_in:
+            merged = []
+            for index in range(0, len(runs), fan_in):
+                group = runs[index:index + fan_in]
+                path = os.path.join(directory, f"merge-{merge_passes}-{index}.bin")
+                merge_run_files(group, path, buffer_items)
+                for run in group:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+            merge_passes += 1
+
+        merge_run_files(runs, output_path, buffer_items)
+        merge_time = time.perf_counter() - start
+
+    return ExternalSortStats(items=total, runs=len(tasks), merge_passes=merge_passes, chunk_items=chunk_items,
+                             sort_time=sort_time, merge_time=merge_time)
+
+
+def is_sorted_file(path, buffer_items: int = 1 << 16) -> bool:
+    previous = None
+    for value in read_ints(path, buffer_items):
+        if previous is not None and value < previous:
+            return False
+        previous = value
+    return True
+
+
+@dataclass
+class ExternalSortBenchmarkResult:
+    size_bytes: int
+    workers: int
+    stats: ExternalSortStats
+
+    @property
+    def throughput(self) -> float:
+        """MB sorted per second."""
+        return self.size_bytes / 2**20 / (self.stats.sort_time + self.stats.merge_time)
+
+
+def run_external_sort_benchmarks(sizes_bytes: List[int], worker_counts: List[int],
+                                 memory_limit: int = 256 * 2**20, temp_dir=None) -> List[ExternalSortBenchmarkResult]:
+    """Sort synthetic files of every size with every worker count; the input is generated once per size."""
+    results = []
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        input_path = os.path.join(directory, "input.bin")
+        output_path = os.path.join(directory, "output.bin")
+
+        for size_bytes in sizes_bytes:
+            write_random_ints(input_path, size_bytes // ITEM_SIZE, seed=size_bytes)
+            for workers in worker_counts:
+                stats = external_sort(input_path, output_path, memory_limit, workers, temp_dir=directory)
+                results.append(ExternalSortBenchmarkResult(size_bytes, workers, stats))
+                os.remove(output_path)
+            os.remove(input_path)
+
+    return results
+
+
+def print_external_sort_results(results: List[ExternalSortBenchmarkResult]) -> None:
+    print(f"{'Size (MB)':>10} | {'Workers':>7} | {'Runs':>6} | {'Passes':>6} | {'Sort (s)':>9} | {'Merge (s)':>9} | "
+          f"{'MB/s':>7}")
+    print("-" * 80)
+    for result in results:
+        stats = result.stats
+        print(f"{result.size_bytes / 2**20:>10.0f} | {result.workers:>7} | {stats.runs:>6} | {stats.merge_passes:>6} | "
+              f"{stats.sort_time:>9.2f} | {stats.merge_time:>9.2f} | {result.throughput:>7.2f}")
+
+
+if __name__ == "__main__":
+    gigabyte = 2**30
+    benchmark_results = run_external_sort_benchmarks([gigabyte, 2 * gigabyte, 5 * gigabyte, 10 * gigabyte],
+                                                     worker_counts=[1, os.cpu_count() or 1])
+    print_external_sort_results(benchmark_results)
@@ -0,0 +1,157 @@
+from typing import List
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional: without it sort_integers falls back to Timsort
+    np = None
+
+# below this size converting a list to an array costs more than Timsort saves
+NUMPY_MIN_SIZE = 2000
+
+# counting sort pays O(range) for the counts array; use it while range <= factor * n
+COUNTING_MAX_RANGE_FACTOR = 4
+
+RADIX_DIGIT_BITS = 16
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("numpy is required for the vectorized integer sorts: pip install numpy")
+
+
+def _as_int_array(arr):
+    _require_numpy()
+    keys = np.asarray(arr)
+    if keys.dtype.kind not in 'iu':
+        raise ValueError(f"Integer array expected, got dtype {keys.dtype}")
+    return keys
+
+
+def _unsigned_offsets(keys):
+    """Map keys onto uint64 values starting at 0, preserving order (also for negative int64)."""
+    if keys.dtype.kind == 'i':
+        # flipping the sign bit turns two's complement order into unsigned order
+        unsigned = keys.astype(np.int64).view(np.uint64) ^ np.uint64(1 << 63)
+    else:
+        unsigned = keys.astype(np.uint64)
+    return unsigned - unsigned.min()
+
+
+def counting_sort(arr):
+    """
+    Sorted copy of an integer array in O(n + range): count every value with np.bincount
+    and write each one out as many times as it occurs.
+    """
+    keys = _as_int_array(arr)
+    if keys.size == 0:
+        return keys.copy()
+
+    low, high = int(keys.min()), int(keys.max())
+    counts = np.bincount(_unsigned_offsets(keys).astype(np.intp), minlength=high - low + 1)
+    return np.repeat(np.arange(low, high + 1, dtype=keys.dtype), counts)
+
+
+def counting_argsort(arr):
+    """
+    Stable sorting permutation of an integer array with a small range: equal keys keep
+    their input order, so it can reorder records by an integer key. The offsets are
+    narrowed to uint8/uint16 when the range allows it, where NumPy's stable argsort is
+    itself a counting (radix) sort; wider ranges go through radix_argsort.
+    """
+    keys = _as_int_array(arr)
+    if keys.size == 0:
+        return np.empty(0, dtype=np.intp)
+
+    offsets = _unsigned_offsets(keys)
+    span = int(offsets.max())
+    if span <= np.iinfo(np.uint16).max:
+        return np.argsort(offsets.astype(np.uint8 if span <= 255 else np.uint16), kind='stable')
+    return radix_argsort(keys)
+
+
+def radix_argsort(arr, digit_bits: int = RADIX_DIGIT_BITS):
+    """
+    Stable sorting permutation by LSD radix sort: one pass per digit_bits-wide digit,
+    least significant first, each pass a stable counting sort of that digit. Only as
+    many passes as the range of the keys needs are made.
+    """
+    if not 1 <= digit_bits <= 16:
+        raise ValueError("digit_bits must be between 1 and 16")
+
+    keys = _as_int_array(arr)
+    order = np.arange(keys.size, dtype=np.intp)
+    if keys.size == 0:
+        return order
+
+    offsets = _unsigned_offsets(keys)
+    passes = -(-int(offsets.max()).bit_length() // digit_bits)
+    mask = np.uint64((1 << digit_bits) - 1)
+
+    for digit in range(passes):
+        digits = ((offsets[order] >> np.uint64(digit * digit_bits)) & mask).astype(np.uint16)
+        order = order[np.argsort(digits, kind='stable')]
+
+    return order
+
+
+def radix_sort(arr, digit_bits: int = RADIX_DIGIT_BITS):
+    """Sorted copy of an integer array by LSD radix sort."""
+    keys = _as_int_array(arr)
+    return keys[radix_argsort(keys, digit_bits)]
+
+
+def choose_integer_sort(arr) -> str:
+    """Name of the sort sort_integers would use for arr: 'timsort', 'counting' or 'radix'."""
+    n = len(arr)
+    if np is None or n < NUMPY_MIN_SIZE:
+        return 'timsort'
+
+    keys = np.asarray(arr)
+    if keys.dtype.kind not in 'iu':
+        return 'timsort'
+    value_range = int(keys.max()) - int(keys.min()) + 1
+    return 'counting' if value_range <= COUNTING_MAX_RANGE_FACTOR * n else 'radix'
+
+
+def sort_integers(arr, stable: bool = False):
+    """
+    Sort integers with the cheapest method for their size and range:
+    Timsort for small inputs (or without NumPy), counting sort when the range is at
+    most COUNTING_MAX_RANGE_FACTOR * n, LSD radix sort otherwise.
+
+    Lists come back as lists and arrays as arrays. With stable=True the stable sorting
+    permutation is returned instead of the sorted values, for reordering records.
+    """
+    method = choose_integer_sort(arr)
+
+    if method == 'timsort':
+        if np is not None and isinstance(arr, np.ndarray):
+            # NumPy's stable sort is its own Timsort (radix sort for 16-bit types)
+            return np.argsort(arr, kind='stable') if stable else np.sort(arr, kind='stable')
+        if stable:
+            return sorted(range(len(arr)), key=arr.__getitem__)
+        return sorted(arr)
+
+    is_list = not isinstance(arr, np.ndarray)
+    if stable:
+        result = counting_argsort(arr) if method == 'counting' else radix_argsort(arr)
+    else:
+        result = counting_sort(arr) if method == 'counting' else radix_sort(arr)
+    return result.tolist() if is_list else result
+
+
+INTEGER_SORTS = {
+    'Counting Sort (NumPy)': counting_sort,
+    'Radix Sort (NumPy)': radix_sort,
+    'sort_integers (auto)': sort_integers,
+}
+
+
+def numpy_sort_timings(arr: List[int], measure) -> dict:
+    """Time the NumPy sorts on an array built once from arr; measure(func) returns seconds."""
+    if np is None:
+        return {}
+    keys = np.asarray(arr, dtype=np.int64)
+    timings = {name: measure(lambda: sort_func(keys)) for name, sort_func in INTEGER_SORTS.items()}
+    timings['np.sort (reference)'] = measure(lambda: np.sort(keys, kind='stable'))
+    return timings
@@ -1,4 +1,10 @@
-from typing import List
+import heapq
+import random
+from typing import Callable, Iterable, Iterator, List
+
+from .benchmark_runner import run_benchmark
+
+_NOTHING = object()
 
 
 def merge_k_lists(lists: List[List[int]]) -> List[int]:
@@ -39,3 +45,65 @@ def merge_two_lists(list1: List[int], list2: List[int]) -> List[int]:
         j += 1
 
     return merged
+
+
+def merge_k_iterables(iterables: Iterable[Iterable], key: Callable | None = None,
+                      unique: bool = False) -> Iterator:
+    """
+    Lazily merge sorted iterables (lists, generators, file readers) into one sorted stream.
+
+    A heap holds the current head of every input, so memory stays O(k) however long the
+    inputs are, and each value costs O(log k). Equal values come out in input order.
+    key works like in sorted(); the inputs must be sorted by it. With unique=True a value
+    whose key equals the previous one is skipped.
+    """
+    heap = []
+    for index, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for value in iterator:
+            # the input index breaks ties, so values themselves are never compared
+            heap.append((value if key is None else key(value), index, value, iterator))
+            break
+    heapq.heapify(heap)
+
+    previous_key = _NOTHING
+    while heap:
+        value_key, index, value, iterator = heap[0]
+        if not unique or value_key != previous_key:
+            yield value
+            previous_key = value_key
+
+        for next_value in iterator:
+            heapq.heapreplace(heap, (next_value if key is None else key(next_value), index, next_value, iterator))
+            break
+        else:
+            heapq.heappop(heap)
+
+
+def generate_sorted_lists(k: int, total: int, seed: int = 42) -> List[List[int]]:
+    """k sorted lists of random integers with `total` elements between them."""
+    rng = random.Random(seed)
+    size = max(total // k, 1)
+    return [sorted(rng.randrange(total) for _ in range(size)) for _ in range(k)]
+
+
+def compare_merge_k(ks: List[int], total: int = 100000, repeats: int = 5) -> List[dict]:
+    """Time merge_k_lists, the lazy merge_k_iterables and heapq.merge (reference) for each k."""
+    results = []
+    for k in ks:
+        lists = generate_sorted_lists(k, total)
+        results.append({
+            'k': k,
+            'recursive': run_benchmark(lambda: merge_k_lists(lists), repeats=repeats).median,
+            'heap': run_benchmark(lambda: list(merge_k_iterables(lists)), repeats=repeats).median,
+            'heapq.merge': run_benchmark(lambda: list(heapq.merge(*lists)), repeats=repeats).median,
+        })
+    return results
+
+
+def print_merge_k_comparison(results: List[dict]) -> None:
+    print(f"{'k':>8} | {'merge_k_lists':>14} | {'merge_k_iterables':>18} | {'heapq.merge':>12} | {'speedup':>8}")
+    print("-" * 75)
+    for result in results:
+        print(f"{result['k']:>8} | {result['recursive']:>13.6f}s | {result['heap']:>17.6f}s | "
+              f"{result['heapq.merge']:>11.6f}s | {result['recursive'] / result['heap']:>7.2f}x")
@@ -1,8 +1,9 @@
-from typing import List
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Sequence
 import random
-import timeit
-import sys
-sys.setrecursionlimit(10**6)
+
+from .benchmark_runner import run_benchmark
+from .integer_sorts import numpy_sort_timings
 
 
 def merge_sort(arr: List[int]) -> List[int]:
@@ -37,6 +38,142 @@ def merge_sort(arr: List[int]) -> List[int]:
     return arr
 
 
+def find_runs(arr: List[int]) -> List[int]:
+    """
+    Split arr into natural runs and return their boundaries [0, end_1, ..., len(arr)].
+    Non-descending runs are kept, strictly descending runs are reversed in place
+    (strictly, so equal elements never swap and the sort stays stable).
+    """
+    n = len(arr)
+    bounds = [0]
+    start = 0
+
+    while start < n:
+        end = start + 1
+        if end < n and arr[end] < arr[start]:
+            while end < n and arr[end] < arr[end - 1]:
+                end += 1
+            arr[start:end] = arr[start:end][::-1]
+        else:
+            while end < n and arr[end] >= arr[end - 1]:
+                end += 1
+        bounds.append(end)
+        start = end
+
+    return bounds
+
+
+def merge_runs(arr: List[int], buffer: List[int], lo: int, mid: int, hi: int) -> None:
+    """
+    Merge the sorted runs arr[lo:mid] and arr[mid:hi] in place, using buffer for the left run.
+    Elements that are already in their final place are trimmed off with bisection first,
+    so two runs that are already in order cost a single comparison.
+    """
+    if arr[mid - 1] <= arr[mid]:
+        return
+
+    # left elements <= arr[mid] and right elements >= arr[mid - 1] do not move
+    lo = bisect_right(arr, arr[mid], lo, mid)
+    hi = bisect_left(arr, arr[mid - 1], mid, hi)
+
+    left_length = mid - lo
+    # element-wise copies keep the buffer the only auxiliary storage: a slice would allocate a list per merge
+    for offset in range(left_length):
+        buffer[offset] = arr[lo + offset]
+    i, j, k = 0, mid, lo
+
+    while i < left_length and j < hi:
+        if arr[j] < buffer[i]:
+            arr[k] = arr[j]
+            j += 1
+        else:
+            arr[k] = buffer[i]
+            i += 1
+        k += 1
+
+    # whatever is left of the right run is already in place
+    while i < left_length:
+        arr[k] = buffer[i]
+        i += 1
+        k += 1
+
+
+def merge_passes(arr: List[int], bounds: List[int]) -> List[int]:
+    """Merge the sorted runs between consecutive bounds pairwise, pass by pass, until one is left."""
+    buffer = [None] * (len(arr) // 2 + 1)
+
+    while len(bounds) > 2:
+        merged = [0]
+        for index in range(0, len(bounds) - 2, 2):
+            lo, mid, hi = bounds[index], bounds[index + 1], bounds[index + 2]
+            if mid - lo > len(buffer):
+                buffer.extend([None] * (mid - lo - len(buffer)))
+            merge_runs(arr, buffer, lo, mid, hi)
+            merged.append(hi)
+        if len(bounds) % 2 == 0:
+            # odd number of runs: the last one waits for the next pass
+            merged.append(bounds[-1])
+        bounds = merged
+
+    return arr
+
+
+def bottom_up_merge_sort(arr: List[int]) -> List[int]:
+    """
+    Iterative merge sort over natural runs: no recursion and one auxiliary buffer,
+    allocated once and reused by every merge. Sorted input is a single run and costs
+    one pass; merging two runs that are already in order costs one comparison.
+    """
+    return merge_passes(arr, find_runs(arr))
+
+
+def binary_insertion_sort(arr: List[int], lo: int = 0, hi: int | None = None) -> List[int]:
+    """
+    Insertion sort of arr[lo:hi] that finds each slot by bisection instead of a linear
+    scan, and shifts the larger elements with one C-level move instead of one by one.
+    bisect_right puts equal elements after the existing ones, so the sort is stable.
+    """
+    hi = len(arr) if hi is None else hi
+
+    for i in range(lo + 1, hi):
+        key = arr[i]
+        position = bisect_right(arr, key, lo, i)
+        if position == i:
+            continue
+        # only arr[position:i] moves; del + insert would also shift everything after i, twice
+        arr[position + 1:i + 1] = arr[position:i]
+        arr[position] = key
+
+    return arr
+
+
+DEFAULT_CUTOFF = 32
+
+
+def hybrid_merge_sort(arr: List[int], cutoff: int = DEFAULT_CUTOFF) -> List[int]:
+    """
+    Bottom-up merge sort that first sorts blocks of `cutoff` elements with binary
+    insertion sort, then merges the blocks. Small blocks are where merging costs the
+    most per element; tune_cutoff picks the cutoff for the current machine.
+    """
+    if cutoff < 1:
+        raise ValueError("cutoff must be positive")
+
+    n = len(arr)
+    for lo in range(0, n, cutoff):
+        binary_insertion_sort(arr, lo, min(lo + cutoff, n))
+    return merge_passes(arr, list(range(0, n, cutoff)) + [n])
+
+
+def tune_cutoff(candidates: Sequence[int] = (4, 8, 16, 32, 64, 128, 256), size: int = 20000,
+                repeats: int = 5) -> int:
+    """Time hybrid_merge_sort with every candidate cutoff on random data and return the fastest."""
+    arr = generate_random_list(size)
+    times = {cutoff: measure_time(lambda data: hybrid_merge_sort(data, cutoff), arr, repeats=repeats)
+             for cutoff in candidates}
+    return min(times, key=times.get)
+
+
 def insertion_sort(arr: List[int]) -> List[int]:
     for i in range(1, len(arr)):
         key = arr[i]
@@ -52,22 +189,84 @@ def generate_random_list(size: int) -> List[int]:
     return [random.randint(0, size) for _ in range(size)]
 
 
-def measure_time(sort_func, arr: List[int], number: int = 5) -> float:
-    timer = timeit.Timer(lambda: sort_func(arr.copy()))
-    return timer.timeit(number=number) / number
+def generate_nearly_sorted_list(size: int, swap_fraction: float = 0.01) -> List[int]:
+    """Sorted list with swap_fraction * size random pairs of elements swapped."""
+    arr = sorted(generate_random_list(size))
+    for _ in range(int(size * swap_fraction)):
+        i, j = random.randrange(size), random.randrange(size)
+        arr[i], arr[j] = arr[j], arr[i]
+    return arr
+
+
+def generate_reversed_list(size: int) -> List[int]:
+    return sorted(generate_random_list(size), reverse=True)
+
+
+def generate_duplicates_list(size: int, distinct: int = 10) -> List[int]:
+    return [random.randrange(distinct) for _ in range(size)]
+
+
+INPUT_GENERATORS = {
+    'random': generate_random_list,
+    'nearly sorted': generate_nearly_sorted_list,
+    'reversed': generate_reversed_list,
+    'many duplicates': generate_duplicates_list,
+}
+
+
+def measure_time(sort_func, arr: List[int], number: int | None = None, repeats: int = 5) -> float:
+    """
+    Median time of one sort_func call on a fresh copy of arr, after a warmup run.
+    With number=None the number of calls per measurement is calibrated automatically.
+    """
+    stats = run_benchmark(lambda: sort_func(arr.copy()), repeats=repeats, number=number)
+    return stats.median
+
+
+# insertion sort is O(n^2): above this size a single run takes minutes
+INSERTION_SORT_MAX_SIZE = 10000
+
+QUADRATIC_SORTS = {'Insertion Sort', 'Binary Insertion Sort'}
+
+
+def compare_sorts(arr: List[int], cutoff: int = DEFAULT_CUTOFF, repeats: int = 5) -> Dict[str, float]:
+    """
+    Median time of every sort on copies of arr; quadratic sorts are skipped on large inputs.
+    When NumPy is installed, the counting, radix and automatic integer sorts are timed on
+    an array built once from arr (the list conversion is not included).
+    """
+    sorts = {
+        'Merge Sort': merge_sort,
+        'Bottom-up Merge Sort': bottom_up_merge_sort,
+        'Hybrid Merge Sort': lambda data: hybrid_merge_sort(data, cutoff),
+        'Insertion Sort': insertion_sort,
+        'Binary Insertion Sort': binary_insertion_sort,
+        'Timsort (built-in sorted)': sorted,
+    }
+    times = {name: measure_time(sort_func, arr, repeats=repeats) for name, sort_func in sorts.items()
+             if len(arr) <= INSERTION_SORT_MAX_SIZE or name not in QUADRATIC_SORTS}
+    times.update(numpy_sort_timings(arr, lambda func: run_benchmark(func, repeats=repeats).median))
+    return times
+
+
+def print_comparison(title: str, times: Dict[str, float]) -> None:
+    print(title)
+    for name, seconds in times.items():
+        print(f"{name} Time: {seconds:.6f} seconds")
+    print("-" * 40)
 
 
 if __name__ == "__main__":
-    sizes = [100, 1000, 5000, 10000]
-    for size in sizes:
-        arr = generate_random_list(size)
+    cutoff = tune_cutoff()
+    print(f"Hybrid merge sort cutoff tuned on this machine: {cutoff}")
+    print("-" * 40)
 
-        merge_time = measure_time(merge_sort, arr)
-        insertion_time = measure_time(insertion_sort, arr)
-        timsort_time = measure_time(sorted, arr)
+    sizes = [100, 1000, 5000, 10000, 100000, 1000000, 10000000]
+    for size in sizes:
+        # sorts of 10^6+ elements take seconds each, so only a few repeats there
+        repeats = 5 if size <= 100000 else 2
+        print_comparison(f"Array Size: {size}", compare_sorts(generate_random_list(size), cutoff, repeats))
 
-        print(f"Array Size: {size}")
-        print(f"Merge Sort Time: {merge_time:.6f} seconds")
-        print(f"Insertion Sort Time: {insertion_time:.6f} seconds")
-        print(f"Timsort (built-in sorted) Time: {timsort_time:.6f} seconds")
-        print("-" * 40)
+    for input_kind, generate in INPUT_GENERATORS.items():
+        for size in [1000, 10000, 100000]:
+            print_comparison(f"Input: {input_kind}, Array Size: {size}", compare_sorts(generate(size), cutoff))
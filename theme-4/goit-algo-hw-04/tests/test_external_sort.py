@@ -0,0 +1,70 @@
+import pytest
+
+from sources.external_sort import (
+    ITEM_SIZE,
+    SORT_BYTES_PER_ITEM,
+    external_sort,
+    is_sorted_file,
+    print_external_sort_results,
+    read_ints,
+    run_external_sort_benchmarks,
+    write_ints,
+    write_random_ints,
+)
+
+
+class TestExternalSort:
+    def test_read_write_round_trip(self, tmp_path):
+        path = tmp_path / "values.bin"
+        values = [5, -3, 2**62, 0, -2**63]
+
+        assert write_ints(path, values, buffer_items=2) == 5
+        assert path.stat().st_size == 5 * ITEM_SIZE
+        assert list(read_ints(path, buffer_items=2)) == values
+        assert list(read_ints(path, buffer_items=2, offset=1, count=3)) == values[1:4]
+
+    @pytest.mark.parametrize("workers, fan_in", [(1, 64), (1, 2), (2, 3)])
+    def test_sorts_across_runs_and_passes(self, tmp_path, workers, fan_in):
+        input_path, output_path = tmp_path / "input.bin", tmp_path / "output.bin"
+        write_random_ints(input_path, 5000, seed=1, block_items=1000)
+
+        # room for ~500 items per chunk: 10 runs or more
+        memory_limit = 500 * SORT_BYTES_PER_ITEM * workers
+        stats = external_sort(input_path, output_path, memory_limit, workers, fan_in=fan_in, temp_dir=tmp_path)
+
+        assert list(read_ints(output_path)) == sorted(read_ints(input_path))
+        assert is_sorted_file(output_path)
+        assert stats.items == 5000
+        assert stats.runs >= 10
+        if fan_in >= stats.runs:
+            assert stats.merge_passes == 1
+        else:
+            assert stats.merge_passes > 1
+        # the temporary runs are cleaned up
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["input.bin", "output.bin"]
+
+    def test_empty_input(self, tmp_path):
+        input_path, output_path = tmp_path / "input.bin", tmp_path / "output.bin"
+        input_path.write_bytes(b"")
+
+        stats = external_sort(input_path, output_path)
+
+        assert output_path.read_bytes() == b""
+        assert stats.runs == 0
+
+    def test_invalid_fan_in(self, tmp_path):
+        with pytest.raises(ValueError):
+            external_sort(tmp_path / "input.bin", tmp_path / "output.bin", fan_in=1)
+
+    def test_is_sorted_file(self, tmp_path):
+        path = tmp_path / "values.bin"
+        write_ints(path, [3, 1, 2])
+        assert not is_sorted_file(path)
+
+    def test_benchmark(self, tmp_path, capsys):
+        results = run_external_sort_benchmarks([8000], [1], memory_limit=200 * SORT_BYTES_PER_ITEM, temp_dir=tmp_path)
+
+        assert results[0].stats.items == 1000
+        assert results[0].throughput > 0
+        print_external_sort_results(results)
+        assert "MB/s" in capsys.readouterr().out
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from sources.integer_sorts import (
+    NUMPY_MIN_SIZE,
+    choose_integer_sort,
+    counting_argsort,
+    counting_sort,
+    radix_argsort,
+    radix_sort,
+    sort_integers,
+)
+
+
+class TestSortIntegersDispatch:
+    def test_small_lists_use_timsort(self):
+        arr = [5, 3, 9, 3]
+        assert choose_integer_sort(arr) == 'timsort'
+        assert sort_integers(arr) == [3, 3, 5, 9]
+        assert sort_integers(arr, stable=True) == [1, 3, 0, 2]
+
+
+class TestNumpyIntegerSorts:
+    @pytest.fixture(autouse=True)
+    def numpy(self):
+        self.np = pytest.importorskip("numpy")
+
+    @pytest.mark.parametrize("low, high", [(0, 100), (-50, 50), (-2**62, 2**62), (0, 0)])
+    def test_sorts_match_np_sort(self, low, high):
+        rng = random.Random(low)
+        keys = self.np.array([rng.randint(low, high) for _ in range(3000)], dtype=self.np.int64)
+        expected = self.np.sort(keys)
+
+        assert (radix_sort(keys) == expected).all()
+        assert (sort_integers(keys) == expected).all()
+        if high - low < 10**6:
+            assert (counting_sort(keys) == expected).all()
+
+    def test_argsorts_are_stable(self):
+        keys = self.np.array([random.Random(1).randrange(-3, 3) for _ in range(5000)])
+        expected = self.np.argsort(keys, kind='stable')
+
+        assert (counting_argsort(keys) == expected).all()
+        assert (radix_argsort(keys, digit_bits=4) == expected).all()
+        assert (sort_integers(keys, stable=True) == expected).all()
+
+        # several radix passes over a wide range
+        wide = self.np.array([random.Random(2).randrange(-2**40, 2**40) // 1000 * 1000 for _ in range(5000)])
+        assert (radix_argsort(wide, digit_bits=8) == self.np.argsort(wide, kind='stable')).all()
+
+    def test_dispatch_by_range(self):
+        dense = list(range(NUMPY_MIN_SIZE))
+        sparse = [i * 10**9 for i in range(NUMPY_MIN_SIZE)]
+
+        assert choose_integer_sort(dense) == 'counting'
+        assert choose_integer_sort(sparse) == 'radix'
+        assert sort_integers(dense[::-1]) == dense
+
+    def test_rejects_floats(self):
+        with pytest.raises(ValueError):
+            radix_sort(self.np.array([1.5, 2.5]))
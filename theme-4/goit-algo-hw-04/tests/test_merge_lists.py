@@ -1,4 +1,10 @@
-from sources.merge_lists import merge_k_lists, merge_two_lists
+from sources.merge_lists import (
+    compare_merge_k,
+    merge_k_iterables,
+    merge_k_lists,
+    merge_two_lists,
+    print_merge_k_comparison,
+)
 
 
 class TestMergeKLists:
@@ -35,3 +41,42 @@ class TestMergeKLists:
         """Test with highly interleaved values."""
         result = merge_k_lists([[1, 4, 7, 10], [2, 5, 8, 11], [3, 6, 9, 12]])
         assert result == [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12]
+
+
+class TestMergeKIterables:
+    def test_matches_merge_k_lists(self):
+        lists = [[1, 4, 5], [1, 3, 4], [2, 6], []]
+        assert list(merge_k_iterables(lists)) == merge_k_lists(lists)
+
+    def test_empty(self):
+        assert list(merge_k_iterables([])) == []
+        assert list(merge_k_iterables([[], iter([])])) == []
+
+    def test_is_lazy(self):
+        def endless(start, step):
+            value = start
+            while True:
+                yield value
+                value += step
+
+        merged = merge_k_iterables([endless(0, 2), endless(1, 2)])
+        assert [next(merged) for _ in range(6)] == [0, 1, 2, 3, 4, 5]
+
+    def test_key_and_stability(self):
+        words = [["b", "ccc"], ["aa", "dd", "eeee"]]
+        assert list(merge_k_iterables(words, key=len)) == ["b", "aa", "dd", "ccc", "eeee"]
+
+    def test_unique(self):
+        lists = [[1, 2, 2, 5], [2, 3, 5], [5, 6]]
+        assert list(merge_k_iterables(lists, unique=True)) == [1, 2, 3, 5, 6]
+
+    def test_unique_by_key(self):
+        records = [[(1, "a"), (2, "b")], [(1, "c"), (3, "d")]]
+        result = list(merge_k_iterables(records, key=lambda record: record[0], unique=True))
+        assert result == [(1, "a"), (2, "b"), (3, "d")]
+
+    def test_benchmark(self, capsys):
+        results = compare_merge_k([2, 20], total=200, repeats=2)
+        assert [result['k'] for result in results] == [2, 20]
+        print_merge_k_comparison(results)
+        assert "merge_k_iterables" in capsys.readouterr().out
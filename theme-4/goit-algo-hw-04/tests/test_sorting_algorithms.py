@@ -0,0 +1,114 @@
+import random
+
+import pytest
+
+from sources.sorting_algorithms import (
+    INPUT_GENERATORS,
+    INSERTION_SORT_MAX_SIZE,
+    QUADRATIC_SORTS,
+    binary_insertion_sort,
+    bottom_up_merge_sort,
+    compare_sorts,
+    find_runs,
+    hybrid_merge_sort,
+    merge_sort,
+    tune_cutoff,
+)
+
+
+class Item:
+    """Compares by key only, to check that equal keys keep their order."""
+
+    def __init__(self, key, position):
+        self.key = key
+        self.position = position
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+    def __le__(self, other):
+        return self.key <= other.key
+
+    def __ge__(self, other):
+        return self.key >= other.key
+
+
+class TestBottomUpMergeSort:
+    @pytest.mark.parametrize("size", [0, 1, 2, 3, 10, 257, 1000])
+    def test_matches_sorted(self, size):
+        rng = random.Random(size)
+        arr = [rng.randint(0, size) for _ in range(size)]
+        assert bottom_up_merge_sort(arr[:]) == sorted(arr)
+
+    @pytest.mark.parametrize("arr", [
+        list(range(100)),
+        list(range(100, 0, -1)),
+        [5] * 50,
+        list(range(50)) + list(range(50)),
+        [3, 2, 1, 1, 2, 3, 9, 8, 7],
+    ])
+    def test_structured_inputs(self, arr):
+        assert bottom_up_merge_sort(arr[:]) == sorted(arr)
+
+    def test_sorts_in_place_like_merge_sort(self):
+        arr = [3, 1, 2]
+        assert bottom_up_merge_sort(arr) is arr
+        assert arr == merge_sort([3, 1, 2])
+
+    def test_stable(self):
+        rng = random.Random(7)
+        items = [Item(rng.randrange(5), i) for i in range(500)]
+        # descending runs with equal keys must not be reversed past each other
+        items += [Item(key, 500 + i) for i, key in enumerate([4, 4, 3, 3, 2])]
+
+        result = bottom_up_merge_sort(items[:])
+
+        assert [(item.key, item.position) for item in result] == sorted(
+            (item.key, item.position) for item in items)
+
+    def test_find_runs(self):
+        arr = [1, 2, 3, 9, 5, 4, 4, 6]
+        assert find_runs(arr) == [0, 4, 6, 8]
+        assert arr == [1, 2, 3, 9, 4, 5, 4, 6]
+
+
+class TestBinaryInsertionSort:
+    @pytest.mark.parametrize("size", [0, 1, 2, 50, 300])
+    def test_matches_sorted(self, size):
+        rng = random.Random(size)
+        arr = [rng.randrange(20) for _ in range(size)]
+        assert binary_insertion_sort(arr[:]) == sorted(arr)
+
+    def test_sorts_only_the_given_range(self):
+        arr = [9, 5, 3, 4, 1, 0]
+        assert binary_insertion_sort(arr, 1, 5) == [9, 1, 3, 4, 5, 0]
+
+    def test_stable(self):
+        items = [Item(key, i) for i, key in enumerate([2, 1, 2, 1, 0, 2])]
+        result = binary_insertion_sort(items)
+        assert [item.position for item in result] == [4, 1, 3, 0, 2, 5]
+
+
+class TestHybridMergeSort:
+    @pytest.mark.parametrize("cutoff", [1, 2, 7, 32, 1000])
+    @pytest.mark.parametrize("input_kind", sorted(INPUT_GENERATORS))
+    def test_matches_sorted(self, cutoff, input_kind):
+        arr = INPUT_GENERATORS[input_kind](500)
+        assert hybrid_merge_sort(arr[:], cutoff) == sorted(arr)
+
+    def test_invalid_cutoff(self):
+        with pytest.raises(ValueError):
+            hybrid_merge_sort([1], 0)
+
+    def test_tune_cutoff_returns_a_candidate(self):
+        assert tune_cutoff([4, 16], size=500, repeats=2) in (4, 16)
+
+
+class TestCompareSorts:
+    def test_skips_quadratic_sorts_on_large_inputs(self):
+        small = compare_sorts(INPUT_GENERATORS['reversed'](50), repeats=2)
+        assert QUADRATIC_SORTS <= set(small)
+
+        large = compare_sorts(list(range(INSERTION_SORT_MAX_SIZE + 1)), repeats=2)
+        assert not QUADRATIC_SORTS & set(large)
+        assert 'Hybrid Merge Sort' in large
@@ -1,8 +1,17 @@
-from sources.hash_table import HashTable
-from sources.binary_search import binary_search
+from pathlib import Path
+
+from sources.hash_table import HashTable, OpenAddressingHashTable
+from sources import compare_hash_tables
+from sources import compare_binary_search
+from sources import benchmark_runner
+from sources.complexity_fit import plot_fits
+from sources.binary_search import SEARCH_MODES, binary_search
 from sources.sub_str_search import compare_sub_str_search as sub_str_search
 from sources.sub_str_search import analyze_results as analysis
 
+RESULTS_PATH = "benchmark_results.json"
+BASELINE_PATH = "benchmark_baseline.json"
+
 
 def search_sub_srt_analysis():
     print("=" * 100)
@@ -22,17 +31,64 @@ def search_sub_srt_analysis():
     sub_str_search.print_results(results)
     sub_str_search.analyze_complexity(results)
 
+    fits = sub_str_search.fit_search_complexity(pattern)
+    plot_fits(fits, title="String search: time per call vs text size")
+
+    # median/IQR of every measurement, saved for later runs to compare against
+    stats = sub_str_search.collect_stats(results)
+    print("\n")
+    benchmark_runner.print_results(stats)
+    benchmark_runner.save_results(stats, RESULTS_PATH)
+    print(f"\nResults saved to {RESULTS_PATH} (copy it to {BASELINE_PATH} to use it as a baseline)")
+
+    if Path(BASELINE_PATH).exists():
+        baseline = benchmark_runner.load_results(BASELINE_PATH)
+        print(f"\nComparison with {BASELINE_PATH}:")
+        benchmark_runner.print_baseline_comparison(benchmark_runner.compare_with_baseline(stats, baseline))
+
     data = sub_str_search.process_data(results)
 
     analysis.comprehensive_analysis(data)
     analysis.generate_summary_table(data)
 
+    print("\n\n" + "=" * 100)
+    print("BOYER-MOORE VARIANTS ON DIFFERENT ALPHABETS")
+    print("=" * 100)
+
+    variant_results = sub_str_search.run_variant_benchmarks(text_sizes, len(pattern), iterations_list)
+    variant_data = sub_str_search.process_variant_data(variant_results)
+
+    analysis.comprehensive_analysis(variant_data, algorithms=['horspool', 'full', 'sunday'])
+    analysis.generate_summary_table(variant_data, algorithms=['horspool', 'full', 'sunday'])
+
+    print("\n\n" + "=" * 100)
+    print("MULTI-PATTERN SEARCH: BOYER-MOORE PER PATTERN vs AHO-CORASICK")
+    print("=" * 100)
+
+    multi_results = sub_str_search.run_multi_pattern_benchmarks(10000, [10, 100, 1000], iterations=5)
+    sub_str_search.print_multi_pattern_results(multi_results)
+
+    rabin_karp_results = sub_str_search.run_rabin_karp_benchmarks(50000, pattern, pattern_count=50, iterations=3)
+    analysis.print_collision_statistics(rabin_karp_results)
+
+    file_results = sub_str_search.run_file_benchmarks([100000, 1000000], pattern, iterations=3)
+    sub_str_search.print_file_results(file_results)
+
+    parallel_results = sub_str_search.run_parallel_benchmarks(1000000, pattern, [1, 2, 4, 8], iterations=1)
+    sub_str_search.print_parallel_results(parallel_results)
+
+    compiled_results = sub_str_search.run_compiled_benchmarks(pattern, record_count=20000, record_size=40,
+                                                              iterations=3)
+    sub_str_search.print_compiled_results(compiled_results)
+
     print("\n\n" + "=" * 80)
     print("CONCLUSIONS")
     print("=" * 80)
     print("""
-       1. BOYER-MOORE demonstrates SUBLINEAR behavior (O(n/m)) in practice:
-          - Shows near-constant time for large texts
+       1. BOYER-MOORE shows LINEAR behavior (O(n)) per call on these inputs:
+          - Its shifts skip characters, so it does fewer comparisons per character
+          - The O(n/m) best case does not show up as sublinear time here; the
+            plateau in the raw totals comes from the falling iteration counts
           - Most efficient for single-pattern search
           - 2-6x faster than alternatives
 
@@ -57,6 +113,8 @@ def main():
         print("1. Hash Table Demo")
         print("2. Binary Search Demo")
         print("3. String Search Algorithms Analysis")
+        print("4. Hash Tables Benchmark")
+        print("5. Binary Search Benchmark")
         print("0. Exit")
         print("******************************")
 
@@ -73,19 +131,50 @@ def main():
             ht.delete("apple")
             print(f"HashTable state after deleting 'apple': {ht.table}")
             print(f"Get 'apple' after deletion: {ht.get('apple')}")
+
+            oht = OpenAddressingHashTable()
+            for i in range(10):
+                oht.insert(f"key{i}", i)
+            print(f"OpenAddressingHashTable after 10 inserts: {oht}")
+            print(f"Capacity: {oht.capacity}, load factor: {oht.load_factor:.2f}")
+            oht.delete("key3")
+            print(f"Get 'key3' after deletion: {oht.get('key3')}, entries left: {len(oht)}")
         elif choice == '2':
             array = [1.1, 2.3, 3.5, 4.7, 5.9, 6.0, 7.2]
             print(f"Array state after insertion: {array}")
             number = input("Enter a number to search: ")
             try:
                 number = float(number)
-                iterations, upper_bound = binary_search(array, number)
-                print(f"Iterations: {iterations}, Upper Bound: {upper_bound}")
+                for mode in SEARCH_MODES:
+                    iterations, upper_bound = binary_search(array, number, mode)
+                    print(f"{mode:>13}: Iterations: {iterations}, Upper Bound: {upper_bound}")
             except ValueError:
                 print("Invalid input. Please enter a valid number.")
         elif choice == '3':
             search_sub_srt_analysis()
             input("Press any key to continue...")
+        elif choice == '4':
+            power = input("Largest size as a power of 10 (3-7, default 6): ") or "6"
+            try:
+                sizes = [10 ** p for p in range(3, int(power) + 1)]
+                results = compare_hash_tables.run_hash_table_benchmarks(sizes)
+                compare_hash_tables.print_hash_table_results(results)
+                bulk_results = compare_hash_tables.run_bulk_load_benchmarks(sizes)
+                compare_hash_tables.print_bulk_load_results(bulk_results)
+                concurrency_results = compare_hash_tables.run_concurrency_benchmarks([1, 2, 4, 8, 16])
+                compare_hash_tables.print_concurrency_results(concurrency_results)
+            except ValueError:
+                print("Invalid input. Please enter a valid number.")
+            input("Press any key to continue...")
+        elif choice == '5':
+            batch_results = compare_binary_search.run_batch_search_benchmarks(10 ** 6, [10 ** 3, 10 ** 4, 10 ** 5,
+                                                                                        10 ** 6])
+            compare_binary_search.print_batch_search_results(batch_results)
+            index_results = compare_binary_search.run_index_benchmarks([10 ** 3, 10 ** 5, 10 ** 7])
+            compare_binary_search.print_index_results(index_results)
+            mode_results = compare_binary_search.run_search_mode_benchmarks(10 ** 6)
+            compare_binary_search.print_search_mode_results(mode_results)
+            input("Press any key to continue...")
         elif choice == '0':
             print("Exiting the program.")
             break
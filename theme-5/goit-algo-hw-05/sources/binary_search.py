@@ -1,8 +1,32 @@
+from bisect import bisect_left
+from math import isqrt
 
-def binary_search(arr, target):
-    left, right = 0, len(arr) - 1
+try:
+    import numpy as np
+except ImportError:  # numpy is optional: plain sequences are searched with bisect
+    np = None
+
+# sorted batches with len(queries) * ratio >= len(arr) use the linear merge walk;
+# measured crossover against bisect per query in CPython is about len(arr) / 3
+MERGE_MIN_BATCH_RATIO = 3
+
+
+def binary_search(arr, target, mode='binary'):
+    """
+    Returns (iterations, upper_bound), the upper bound being the smallest element >= target.
+    mode selects the strategy: 'binary', 'interpolation' or 'exponential' (see SEARCH_MODES).
+    """
+    if mode != 'binary':
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown mode {mode!r}, expected one of {sorted(SEARCH_MODES)}")
+        return SEARCH_MODES[mode](arr, target)
+
+    return _binary_search_range(arr, target, 0, len(arr) - 1)
+
+
+def _binary_search_range(arr, target, left, right, upper_bound=None):
+    """Binary search in arr[left:right + 1]; upper_bound is the bound already known to the right of it."""
     iterations = 0
-    upper_bound = None
 
     while left <= right:
         iterations += 1
@@ -15,3 +39,144 @@ def binary_search(arr, target):
             right = mid - 1
 
     return iterations, upper_bound
+
+
+def interpolation_search(arr, target):
+    """
+    Upper-bound search that probes where target would be if the values between the
+    current ends were evenly spread: O(log log n) iterations on uniform numeric data.
+
+    Each interpolation probe is followed by a guard probe sqrt(width) positions further
+    towards target, so the range closes in from both sides instead of creeping from one.
+    When a step does not at least halve the range, the data is too skewed for
+    interpolation and the rest is searched by binary search, so the worst case stays
+    O(log n) instead of O(n). Each probe counts as one iteration.
+    """
+    left, right = 0, len(arr) - 1
+    iterations = 0
+    upper_bound = None
+
+    while left <= right:
+        low_value, high_value = arr[left], arr[right]
+        if target <= low_value:
+            return iterations + 1, low_value
+        if target > high_value:
+            return iterations + 1, upper_bound
+
+        width = right - left
+        gap = max(isqrt(width), 1)
+        position = left + int((target - low_value) * width / (high_value - low_value))
+        position = min(max(position, left), right)
+
+        iterations += 1
+        if arr[position] < target:
+            left = position + 1
+            guard = position + gap
+            if guard <= right:
+                iterations += 1
+                if arr[guard] < target:
+                    left = guard + 1
+                else:
+                    upper_bound = arr[guard]
+                    right = guard - 1
+        else:
+            upper_bound = arr[position]
+            right = position - 1
+            guard = position - gap
+            if guard >= left:
+                iterations += 1
+                if arr[guard] < target:
+                    left = guard + 1
+                else:
+                    upper_bound = arr[guard]
+                    right = guard - 1
+
+        if right - left > width // 2:
+            fallback_iterations, upper_bound = _binary_search_range(arr, target, left, right, upper_bound)
+            return iterations + fallback_iterations, upper_bound
+
+    return iterations, upper_bound
+
+
+def exponential_search(arr, target):
+    """
+    Galloping search: probes positions 0, 1, 2, 4, 8, ... until an element >= target
+    is found, then binary searches the last gap. Takes O(log i) iterations, i being the
+    position of the answer, so it suits answers near the front and sequences that keep
+    growing at the end.
+    """
+    n = len(arr)
+    if n == 0:
+        return 0, None
+
+    iterations = 1
+    if arr[0] >= target:
+        return iterations, arr[0]
+
+    bound = 1
+    while bound < n and arr[bound] < target:
+        iterations += 1
+        bound *= 2
+
+    upper_bound = None
+    if bound < n:
+        iterations += 1
+        upper_bound = arr[bound]
+
+    fallback_iterations, upper_bound = _binary_search_range(arr, target, bound // 2 + 1, min(bound, n) - 1,
+                                                            upper_bound)
+    return iterations + fallback_iterations, upper_bound
+
+
+SEARCH_MODES = {
+    'binary': binary_search,
+    'interpolation': interpolation_search,
+    'exponential': exponential_search,
+}
+
+
+def is_numpy_array(value):
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def _merge_indices(arr, queries):
+    """Indices for sorted queries in one forward pass over arr: O(n + q)."""
+    indices = []
+    index, n = 0, len(arr)
+    for query in queries:
+        while index < n and arr[index] < query:
+            index += 1
+        indices.append(index)
+    return indices
+
+
+def binary_search_batch(arr, queries, queries_sorted=False):
+    """
+    Upper bounds (smallest element >= query, as in binary_search) for many queries at once.
+
+    Returns (upper_bounds, indices), where indices[i] is the position of upper_bounds[i]
+    in arr, or len(arr) when no element is >= queries[i]. With NumPy arrays the whole batch
+    is one np.searchsorted call; the upper bounds are then a float array with nan for
+    missing bounds. Plain sequences return lists with None for missing bounds.
+
+    When queries_sorted is True and the batch holds at least a third as many queries as
+    arr has elements, the queries are answered by one merge-style walk over arr, O(n + q).
+    Smaller batches are cheaper as separate C-level bisect calls, O(q log n).
+    """
+    n = len(arr)
+
+    if is_numpy_array(arr) or is_numpy_array(queries):
+        arr = np.asarray(arr)
+        indices = np.searchsorted(arr, np.asarray(queries), side='left')
+        if n == 0:
+            return np.full(len(indices), np.nan), indices
+        upper_bounds = np.where(indices < n, arr[np.minimum(indices, n - 1)], np.nan)
+        return upper_bounds, indices
+
+    if queries_sorted and len(queries) * MERGE_MIN_BATCH_RATIO >= n:
+        indices = _merge_indices(arr, queries)
+    else:
+        indices = [bisect_left(arr, query) for query in queries]
+
+    upper_bounds = [arr[index] if index < n else None for index in indices]
+    return upper_bounds, indices
@@ -0,0 +1,181 @@
+import random
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+from .benchmark_runner import run_benchmark
+from .binary_search import SEARCH_MODES, binary_search, binary_search_batch, np
+from .eytzinger_index import EytzingerIndex, compact_storage
+
+
+@dataclass
+class BatchSearchBenchmarkResult:
+    array_size: int
+    batch_size: int
+    times: Dict[str, float]  # seconds for the whole batch
+
+
+@dataclass
+class IndexBenchmarkResult:
+    size: int
+    query_count: int
+    times: Dict[str, float]  # seconds for all queries
+    mean_iterations: Dict[str, float]
+
+
+@dataclass
+class SearchModeBenchmarkResult:
+    distribution: str
+    size: int
+    times: Dict[str, float]  # seconds for all queries
+    mean_iterations: Dict[str, float]
+    max_iterations: Dict[str, int]
+
+
+# name -> generator(size, rng) of a sorted array
+DISTRIBUTIONS: Dict[str, Callable[[int, random.Random], List[float]]] = {
+    # evenly spread values, e.g. timestamps: interpolation guesses land next to the answer
+    'uniform': lambda size, rng: sorted(rng.uniform(0, size) for _ in range(size)),
+    # heavy-tailed values: most of them are packed near zero
+    'skewed': lambda size, rng: sorted(rng.expovariate(1) ** 4 for _ in range(size)),
+    # one huge outlier at the end: without the fallback interpolation degrades to a linear scan
+    'adversarial': lambda size, rng: [float(i) for i in range(size - 1)] + [1e18],
+}
+
+
+def generate_sorted_array(size: int, seed: int = 42) -> List[float]:
+    rng = random.Random(seed)
+    return sorted(rng.uniform(0, 1000) for _ in range(size))
+
+
+def run_batch_search_benchmarks(array_size: int, batch_sizes: List[int],
+                                repeats: int = 3) -> List[BatchSearchBenchmarkResult]:
+    """
+    Time answering a batch of upper-bound queries against one sorted array:
+    a loop over the scalar binary_search, binary_search_batch on random and on sorted
+    queries, and the NumPy path when NumPy is installed.
+    """
+    arr = generate_sorted_array(array_size)
+    numpy_arr = np.asarray(arr) if np is not None else None
+    results = []
+
+    for batch_size in batch_sizes:
+        rng = random.Random(batch_size)
+        queries = [rng.uniform(0, 1000) for _ in range(batch_size)]
+        sorted_queries = sorted(queries)
+
+        benchmarks = {
+            'scalar loop': lambda: [binary_search(arr, query) for query in queries],
+            'batch': lambda: binary_search_batch(arr, queries),
+            'batch (sorted)': lambda: binary_search_batch(arr, sorted_queries, queries_sorted=True),
+        }
+        if np is not None:
+            numpy_queries = np.asarray(queries)
+            benchmarks['numpy batch'] = lambda: binary_search_batch(numpy_arr, numpy_queries)
+
+        times = {name: run_benchmark(func, name=name, repeats=repeats, warmup=0, number=1).median
+                 for name, func in benchmarks.items()}
+        results.append(BatchSearchBenchmarkResult(array_size, batch_size, times))
+
+    return results
+
+
+def print_batch_search_results(results: List[BatchSearchBenchmarkResult]) -> None:
+    print("\n" + "=" * 100)
+    print(f"BATCH UPPER-BOUND SEARCH IN A SORTED ARRAY OF {results[0].array_size} FLOATS (seconds per batch)")
+    print("=" * 100)
+    names = list(results[0].times)
+    print(f"{'Queries':>10} | " + " | ".join(f"{name:>15}" for name in names) + f" | {'best speedup':>12}")
+    print("-" * 100)
+
+    for result in results:
+        scalar = result.times['scalar loop']
+        best = min(time for name, time in result.times.items() if name != 'scalar loop')
+        print(f"{result.batch_size:>10} | " + " | ".join(f"{result.times[name]:>14.4f}s" for name in names)
+              + f" | {scalar / best:>11.1f}x")
+
+
+def run_index_benchmarks(sizes: List[int], query_count: int = 100000,
+                         repeats: int = 3) -> List[IndexBenchmarkResult]:
+    """
+    Time query_count lower-bound queries per array size: binary_search on the sorted list
+    and on an unboxed array, EytzingerIndex.lower_bound and C-level bisect_left.
+    """
+    results = []
+
+    for size in sizes:
+        arr = generate_sorted_array(size)
+        packed = compact_storage(arr)
+        index = EytzingerIndex(arr)
+        rng = random.Random(size)
+        queries = [rng.uniform(0, 1000) for _ in range(query_count)]
+
+        benchmarks = {
+            'binary_search': lambda: [binary_search(arr, query) for query in queries],
+            'binary_search (array)': lambda: [binary_search(packed, query) for query in queries],
+            'eytzinger': lambda: [index.lower_bound(query) for query in queries],
+            'bisect': lambda: [bisect_left(arr, query) for query in queries],
+        }
+        times = {name: run_benchmark(func, name=name, repeats=repeats, warmup=0, number=1).median
+                 for name, func in benchmarks.items()}
+        mean_iterations = {
+            'binary_search': sum(binary_search(arr, query)[0] for query in queries) / query_count,
+            'eytzinger': sum(index.lower_bound(query)[0] for query in queries) / query_count,
+        }
+        results.append(IndexBenchmarkResult(size, query_count, times, mean_iterations))
+
+    return results
+
+
+def print_index_results(results: List[IndexBenchmarkResult]) -> None:
+    print("\n" + "=" * 100)
+    print(f"SORTED LAYOUT vs EYTZINGER LAYOUT ({results[0].query_count} lower-bound queries, seconds)")
+    print("=" * 100)
+    names = list(results[0].times)
+    print(f"{'Size':>10} | " + " | ".join(f"{name:>21}" for name in names) + f" | {'iters bs/ey':>11}")
+    print("-" * 100)
+
+    for result in results:
+        iterations = "/".join(f"{value:.1f}" for value in result.mean_iterations.values())
+        print(f"{result.size:>10} | " + " | ".join(f"{result.times[name]:>20.4f}s" for name in names)
+              + f" | {iterations:>11}")
+
+
+def run_search_mode_benchmarks(size: int, query_count: int = 10000,
+                               repeats: int = 3) -> List[SearchModeBenchmarkResult]:
+    """
+    Probe counts and time of every binary_search mode on each distribution in
+    DISTRIBUTIONS. Queries are elements of the array, so every search finds a bound.
+    """
+    results = []
+
+    for distribution, generate in DISTRIBUTIONS.items():
+        rng = random.Random(size)
+        arr = generate(size, rng)
+        queries = [rng.choice(arr) for _ in range(query_count)]
+
+        times, mean_iterations, max_iterations = {}, {}, {}
+        for mode in SEARCH_MODES:
+            iterations = [binary_search(arr, query, mode)[0] for query in queries]
+            mean_iterations[mode] = sum(iterations) / query_count
+            max_iterations[mode] = max(iterations)
+            times[mode] = run_benchmark(lambda: [binary_search(arr, query, mode) for query in queries],
+                                        name=mode, repeats=repeats, warmup=0, number=1).median
+
+        results.append(SearchModeBenchmarkResult(distribution, size, times, mean_iterations, max_iterations))
+
+    return results
+
+
+def print_search_mode_results(results: List[SearchModeBenchmarkResult]) -> None:
+    print("\n" + "=" * 100)
+    print(f"SEARCH MODES ON {results[0].size} ELEMENTS (mean / max iterations, seconds for all queries)")
+    print("=" * 100)
+    modes = list(results[0].times)
+    print(f"{'Distribution':<14} | " + " | ".join(f"{mode:>24}" for mode in modes))
+    print("-" * 100)
+
+    for result in results:
+        print(f"{result.distribution:<14} | " + " | ".join(
+            f"{result.mean_iterations[mode]:>5.1f} / {result.max_iterations[mode]:>3} {result.times[mode]:>10.4f}s"
+            for mode in modes))
@@ -0,0 +1,297 @@
+import os
+import random
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+from .benchmark_runner import run_benchmark
+from .hash_table import HashTable, OpenAddressingHashTable
+from .sharded_hash_table import ShardedHashTable
+
+_MISSING = object()
+
+
+class DictTable:
+    """dict behind the insert/get/delete interface of the hash tables."""
+
+    def __init__(self, size=0):
+        self.data = {}
+
+    def insert(self, key, value):
+        self.data[key] = value
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def delete(self, key):
+        return self.data.pop(key, _MISSING) is not _MISSING
+
+
+class GlobalLockHashTable:
+    """OpenAddressingHashTable with every operation serialized by one lock."""
+
+    def __init__(self, size=8):
+        self.table = OpenAddressingHashTable(size)
+        self.lock = threading.Lock()
+
+    def insert(self, key, value):
+        with self.lock:
+            return self.table.insert(key, value)
+
+    def get(self, key):
+        with self.lock:
+            return self.table.get(key)
+
+    def delete(self, key):
+        with self.lock:
+            return self.table.delete(key)
+
+
+CONCURRENT_TABLES: Dict[str, Callable[[int], object]] = {
+    'global_lock': lambda size: GlobalLockHashTable(size),
+    'sharded': lambda size: ShardedHashTable(size),
+}
+
+
+# name -> factory(expected size). 'chained' gets one bucket per key, its best case;
+# 'chained_fixed' keeps 1024 buckets however many keys it holds, like HashTable(5) does.
+HASH_TABLES: Dict[str, Callable[[int], object]] = {
+    'chained': lambda size: HashTable(size),
+    'chained_fixed': lambda size: HashTable(1024),
+    'open_addressing': lambda size: OpenAddressingHashTable(),
+    'dict': lambda size: DictTable(),
+}
+
+# chains grow linearly with the number of keys, so larger sizes would take hours
+MAX_SIZES = {'chained_fixed': 10**5}
+
+
+@dataclass
+class HashTableBenchmarkResult:
+    size: int
+    insert_times: Dict[str, float]
+    get_times: Dict[str, float]
+    delete_times: Dict[str, float]
+
+
+@dataclass
+class BulkLoadBenchmarkResult:
+    size: int
+    insert_loop_time: float
+    update_time: float
+    snapshot_save_time: float
+    snapshot_load_time: float
+    snapshot_bytes: int
+
+
+@dataclass
+class ConcurrencyBenchmarkResult:
+    threads: int
+    throughput: Dict[str, float]  # operations per second
+
+
+def generate_keys(size: int, seed: int = 42) -> List[int]:
+    rng = random.Random(seed)
+    return [rng.getrandbits(62) for _ in range(size)]
+
+
+def fill_table(factory, keys):
+    table = factory(len(keys))
+    insert = table.insert
+    for key in keys:
+        insert(key, key)
+    return table
+
+
+def run_hash_table_benchmarks(sizes: List[int], repeats: int = 3,
+                              tables: List[str] = None) -> List[HashTableBenchmarkResult]:
+    """
+    Time inserting, looking up and deleting every key for each table and size.
+    Times are totals per operation batch (median of `repeats` runs). The open-addressing
+    table starts empty and grows by resizing, so its insert time includes every resize.
+    """
+    tables = tables or list(HASH_TABLES)
+    results = []
+
+    for size in sizes:
+        keys = generate_keys(size)
+        lookups = keys[:]
+        random.Random(size).shuffle(lookups)
+        result = HashTableBenchmarkResult(size, {}, {}, {})
+
+        for name in tables:
+            if size > MAX_SIZES.get(name, size):
+                continue
+            factory = HASH_TABLES[name]
+
+            result.insert_times[name] = run_benchmark(lambda: fill_table(factory, keys), name=name,
+                                                      repeats=repeats, warmup=0, number=1).median
+
+            table = fill_table(factory, keys)
+            get = table.get
+
+            def get_all():
+                for key in lookups:
+                    get(key)
+
+            result.get_times[name] = run_benchmark(get_all, name=name, repeats=repeats, warmup=0, number=1).median
+
+            def delete_all():
+                # the deletes empty the table, so each run deletes from a fresh copy
+                filled = fill_table(factory, keys)
+                delete = filled.delete
+                for key in lookups:
+                    delete(key)
+
+            delete_with_fill = run_benchmark(delete_all, name=name, repeats=repeats, warmup=0, number=1).median
+            result.delete_times[name] = max(delete_with_fill - result.insert_times[name], 0.0)
+            del table
+
+        results.append(result)
+
+    return results
+
+
+def print_hash_table_results(results: List[HashTableBenchmarkResult]) -> None:
+    print("\n" + "=" * 100)
+    print("HASH TABLES: CHAINED vs OPEN ADDRESSING vs DICT (total seconds per batch of operations)")
+    print("=" * 100)
+    print("chained: one bucket per key (its best case); chained_fixed: 1024 buckets regardless of size")
+
+    for operation in ('insert', 'get', 'delete'):
+        print(f"\n{operation.upper()}:")
+        names = list(dict.fromkeys(name for result in results for name in getattr(result, f"{operation}_times")))
+        print(f"{'Entries':>10} | " + " | ".join(f"{name:>15}" for name in names)
+              + f" | {'open / chained':>14} | {'open / dict':>11}")
+        print("-" * 100)
+
+        for result in results:
+            times = getattr(result, f"{operation}_times")
+            row = f"{result.size:>10} | " + " | ".join(
+                f"{times[name]:>14.4f}s" if name in times else f"{'-':>15}" for name in names)
+            open_time = times.get('open_addressing')
+            if open_time and times.get('chained'):
+                row += f" | {open_time / times['chained']:>13.2f}x"
+            if open_time and times.get('dict'):
+                row += f" | {open_time / times['dict']:>10.2f}x"
+            print(row)
+
+
+def run_bulk_load_benchmarks(sizes: List[int], repeats: int = 3) -> List[BulkLoadBenchmarkResult]:
+    """
+    Compare ways of filling an OpenAddressingHashTable with `size` string keys:
+    one insert() per pair (growing by doubling), update() presized from the length hint,
+    and loading a binary snapshot saved with save().
+    """
+    results = []
+
+    for size in sizes:
+        pairs = [(f"key{key}", key) for key in generate_keys(size)]
+
+        def insert_loop():
+            table = OpenAddressingHashTable()
+            for key, value in pairs:
+                table.insert(key, value)
+
+        def update():
+            OpenAddressingHashTable().update(pairs)
+
+        table = OpenAddressingHashTable.from_pairs(pairs)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.bin")
+            save_time = run_benchmark(lambda: table.save(path), repeats=repeats, warmup=0, number=1).median
+            load_time = run_benchmark(lambda: OpenAddressingHashTable.load(path), repeats=repeats, warmup=0,
+                                      number=1).median
+            snapshot_bytes = os.path.getsize(path)
+
+        results.append(BulkLoadBenchmarkResult(
+            size=size,
+            insert_loop_time=run_benchmark(insert_loop, repeats=repeats, warmup=0, number=1).median,
+            update_time=run_benchmark(update, repeats=repeats, warmup=0, number=1).median,
+            snapshot_save_time=save_time,
+            snapshot_load_time=load_time,
+            snapshot_bytes=snapshot_bytes,
+        ))
+
+    return results
+
+
+def print_bulk_load_results(results: List[BulkLoadBenchmarkResult]) -> None:
+    print("\n" + "=" * 100)
+    print("BULK LOADING AN OPEN-ADDRESSING HASH TABLE (seconds)")
+    print("=" * 100)
+    print(f"{'Entries':>10} | {'insert loop':>12} | {'update':>12} | {'snapshot save':>14} | {'snapshot load':>14} | "
+          f"{'load speedup':>12} | {'snapshot MB':>11}")
+    print("-" * 100)
+
+    for result in results:
+        speedup = result.insert_loop_time / result.snapshot_load_time if result.snapshot_load_time else 0.0
+        print(f"{result.size:>10} | {result.insert_loop_time:>11.4f}s | {result.update_time:>11.4f}s | "
+              f"{result.snapshot_save_time:>13.4f}s | {result.snapshot_load_time:>13.4f}s | {speedup:>11.1f}x | "
+              f"{result.snapshot_bytes / 2**20:>11.2f}")
+
+
+def run_worker_threads(table, keys, thread_count: int, operations: int, read_ratio: float) -> float:
+    """Run `operations` mixed reads/inserts split over thread_count threads; return the wall time."""
+    per_thread = operations // thread_count
+    barrier = threading.Barrier(thread_count + 1)
+
+    def worker(seed):
+        rng = random.Random(seed)
+        get, insert = table.get, table.insert
+        choices = [rng.choice(keys) for _ in range(per_thread)]
+        writes = [rng.random() >= read_ratio for _ in range(per_thread)]
+        barrier.wait()
+        for key, write in zip(choices, writes):
+            if write:
+                insert(key, seed)
+            else:
+                get(key)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def run_concurrency_benchmarks(thread_counts: List[int], key_count: int = 100000, operations: int = 400000,
+                               read_ratio: float = 0.9, repeats: int = 3) -> List[ConcurrencyBenchmarkResult]:
+    """
+    Throughput of a table shared by thread_count threads doing `read_ratio` lookups and
+    the rest inserts, for the sharded table and a single table behind one global lock.
+    The table is prefilled with key_count keys; the work is split evenly over the threads.
+    """
+    keys = generate_keys(key_count)
+    results = []
+
+    for thread_count in thread_counts:
+        throughput = {}
+        for name, factory in CONCURRENT_TABLES.items():
+            table = fill_table(factory, keys)
+            times = sorted(run_worker_threads(table, keys, thread_count, operations, read_ratio)
+                           for _ in range(repeats))
+            throughput[name] = (operations // thread_count * thread_count) / times[len(times) // 2]
+        results.append(ConcurrencyBenchmarkResult(thread_count, throughput))
+
+    return results
+
+
+def print_concurrency_results(results: List[ConcurrencyBenchmarkResult]) -> None:
+    print("\n" + "=" * 100)
+    print("SHARED HASH TABLE UNDER THREADS (operations per second, 90% reads)")
+    print("=" * 100)
+    names = list(results[0].throughput)
+    print(f"{'Threads':>8} | " + " | ".join(f"{name:>14}" for name in names) + f" | {'sharded / global':>16}")
+    print("-" * 100)
+
+    for result in results:
+        ratio = result.throughput['sharded'] / result.throughput['global_lock']
+        print(f"{result.threads:>8} | " + " | ".join(f"{result.throughput[name]:>14,.0f}" for name in names)
+              + f" | {ratio:>15.2f}x")
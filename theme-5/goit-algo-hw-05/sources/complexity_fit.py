@@ -0,0 +1,120 @@
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+from .benchmark_runner import run_benchmark
+
+COMPLEXITY_MODELS: Dict[str, Callable[[float], float]] = {
+    'O(1)': lambda n: 1.0,
+    'O(log n)': lambda n: math.log2(n),
+    'O(n)': lambda n: n,
+    'O(n log n)': lambda n: n * math.log2(n),
+    'O(n^2)': lambda n: n * n,
+}
+
+
+@dataclass
+class ModelFit:
+    model: str
+    coefficient: float
+    relative_rss: float
+
+
+@dataclass
+class ComplexityFit:
+    sizes: List[int]
+    times: List[float]
+    fits: List[ModelFit]
+    confidence: float
+
+    @property
+    def best(self) -> ModelFit:
+        return self.fits[0]
+
+    def predict(self, size: float, model: str | None = None) -> float:
+        fit = self.best if model is None else next(f for f in self.fits if f.model == model)
+        return fit.coefficient * COMPLEXITY_MODELS[fit.model](size)
+
+
+def geometric_sizes(min_size: int, max_size: int, steps: int) -> List[int]:
+    """Sizes spread evenly on a log scale between min_size and max_size."""
+    if steps < 2:
+        return [max_size]
+    ratio = (max_size / min_size) ** (1 / (steps - 1))
+    return sorted({round(min_size * ratio ** i) for i in range(steps)})
+
+
+def fit_complexity(sizes: List[int], times: List[float]) -> ComplexityFit:
+    """
+    Least-squares fit of t = c * f(n) for every model in COMPLEXITY_MODELS.
+
+    Residuals are taken relative to the measured time, so a geometric range of sizes
+    weighs small and large inputs equally. The confidence is the Akaike weight of the
+    best model: all models have one parameter, so it reduces to normalizing RSS^(-k/2)
+    over the models (k = number of sizes). 1.0 means the other models are far worse,
+    1 / len(models) means the data cannot tell them apart.
+    """
+    points = [(n, t) for n, t in zip(sizes, times) if n > 1 and t > 0]
+    if len(points) < 2:
+        raise ValueError("At least two sizes > 1 with positive times are needed")
+
+    fits = []
+    for model, f in COMPLEXITY_MODELS.items():
+        # minimize sum((c * f(n) - t) / t)^2  ->  c = sum(f/t) / sum((f/t)^2)
+        ratios = [f(n) / t for n, t in points]
+        coefficient = sum(ratios) / sum(r * r for r in ratios)
+        rss = sum((coefficient * r - 1) ** 2 for r in ratios)
+        fits.append(ModelFit(model, coefficient, rss))
+
+    fits.sort(key=lambda fit: fit.relative_rss)
+
+    k = len(points)
+    best_rss = max(fits[0].relative_rss, 1e-300)
+    # weights relative to the best model, computed in log space to avoid overflow
+    weights = [math.exp(-k / 2 * (math.log(max(fit.relative_rss, 1e-300)) - math.log(best_rss))) for fit in fits]
+    confidence = weights[0] / sum(weights)
+
+    return ComplexityFit([n for n, _ in points], [t for _, t in points], fits, confidence)
+
+
+def measure_complexity(func: Callable, make_input: Callable[[int], tuple], sizes: List[int],
+                       repeats: int = 5) -> ComplexityFit:
+    """Time func(*make_input(size)) for every size (median per call) and fit the models."""
+    times = []
+    for size in sizes:
+        args = make_input(size)
+        times.append(run_benchmark(lambda: func(*args), repeats=repeats).median)
+    return fit_complexity(sizes, times)
+
+
+def print_fit(name: str, fit: ComplexityFit) -> None:
+    print(f"  {name:<20} best fit: {fit.best.model:<10} (confidence {fit.confidence:.0%})  "
+          + ", ".join(f"{f.model}: {f.relative_rss:.3g}" for f in fit.fits[1:3]))
+
+
+def plot_fits(fits: Dict[str, ComplexityFit], title: str = "Empirical complexity", path=None) -> None:
+    """
+    Plot measured times and best-fit curves on log-log axes; save to path or show.
+    matplotlib is only needed for plotting, so it is imported here.
+    """
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(9, 6))
+    for name, fit in fits.items():
+        points = ax.plot(fit.sizes, fit.times, 'o', label=f"{name} (measured)")
+        ax.plot(fit.sizes, [fit.predict(n) for n in fit.sizes], '-', color=points[0].get_color(),
+                label=f"{name}: {fit.best.model}, {fit.confidence:.0%}")
+
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.set_xlabel("Input size")
+    ax.set_ylabel("Time per call (s)")
+    ax.set_title(title)
+    ax.legend()
+    fig.tight_layout()
+
+    if path is None:
+        plt.show()
+    else:
+        fig.savefig(path)
+    plt.close(fig)
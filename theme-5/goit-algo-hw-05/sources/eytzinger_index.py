@@ -0,0 +1,98 @@
+from array import array
+
+
+def compact_storage(values):
+    """
+    Store floats and 64-bit ints unboxed in an array, so the tree itself is contiguous
+    in memory; a list only holds pointers to float objects scattered over the heap.
+    """
+    if values and all(type(value) is float for value in values):
+        return array('d', values)
+    if values and all(type(value) is int for value in values):
+        try:
+            return array('q', values)
+        except OverflowError:
+            pass
+    return values
+
+
+class EytzingerIndex:
+    """
+    Static search index over a sorted sequence, stored in Eytzinger (BFS) order.
+
+    The element at position k has its children at 2k and 2k + 1 (1-based), so the first
+    levels of the implicit tree, the ones every query touches, sit next to each other
+    in memory, and a query always moves forward through the list. The descent
+    `k = 2k + (tree[k] < target)` has no data-dependent branch; the answer is the last
+    node where the search went left, recovered from the bits of k at the end.
+
+    lower_bound/upper_bound return (iterations, value) like binary_search.
+    CPython cannot issue prefetches; the gain comes from the array layout instead
+    (see compact_storage).
+    """
+
+    def __init__(self, sorted_values):
+        n = len(sorted_values)
+        self.size = n
+        tree = [None] * (n + 1)
+        # tree slot -> position in the sorted input, for the *_index methods
+        ranks = array('q', bytes(8 * (n + 1)))
+
+        # in-order traversal of the implicit tree visits the slots in sorted order
+        rank = 0
+        stack = []
+        k = 1
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            tree[k] = sorted_values[rank]
+            ranks[k] = rank
+            rank += 1
+            k = 2 * k + 1
+
+        # slot 0 is never read; fill it with an element so the tree has a single type
+        tree[0] = tree[1] if n else None
+        self.tree = compact_storage(tree)
+        self.ranks = ranks
+
+    def _descend(self, target, strict):
+        tree, n = self.tree, self.size
+        k = 1
+        iterations = 0
+        if strict:
+            while k <= n:
+                iterations += 1
+                k = 2 * k + (tree[k] <= target)
+        else:
+            while k <= n:
+                iterations += 1
+                k = 2 * k + (tree[k] < target)
+
+        # drop the trailing right turns and the last left turn: k is the answer slot, 0 if none
+        k >>= (~k & (k + 1)).bit_length()
+        return iterations, k
+
+    def lower_bound(self, target):
+        """Smallest element >= target, or None."""
+        iterations, k = self._descend(target, strict=False)
+        return iterations, self.tree[k] if k else None
+
+    def upper_bound(self, target):
+        """Smallest element > target, or None."""
+        iterations, k = self._descend(target, strict=True)
+        return iterations, self.tree[k] if k else None
+
+    def lower_bound_index(self, target):
+        """Position of lower_bound in the sorted input (len when there is none), like bisect_left."""
+        _, k = self._descend(target, strict=False)
+        return self.ranks[k] if k else self.size
+
+    def upper_bound_index(self, target):
+        """Position of upper_bound in the sorted input, like bisect_right."""
+        _, k = self._descend(target, strict=True)
+        return self.ranks[k] if k else self.size
+
+    def __len__(self):
+        return self.size
@@ -1,3 +1,63 @@
+import operator
+import pickle
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+_EMPTY = object()  # marks a free slot, so None can still be used as a key
+
+_MASK_64 = (1 << 64) - 1
+_FIBONACCI_MULTIPLIER = 11400714819323198485  # 2^64 / golden ratio
+
+# snapshot header: magic, version, max_load_factor, capacity, count, hash seed probe
+_SNAPSHOT_HEADER = struct.Struct('<4sBdQQq')
+_SNAPSHOT_MAGIC = b'OAHT'
+_SNAPSHOT_VERSION = 1
+
+# chained table snapshot header: magic, version, bucket count, entry count, hash seed probe
+_CHAINED_SNAPSHOT_HEADER = struct.Struct('<4sBQQq')
+_CHAINED_SNAPSHOT_MAGIC = b'CHHT'
+
+
+def _hash_seed_probe():
+    """str/bytes hashes are randomized per process (PYTHONHASHSEED); this value changes with the seed."""
+    return hash("hash-table-snapshot")
+
+
+def _little_endian(values):
+    """Swap an array's bytes in place on big-endian hosts; snapshots are always little-endian."""
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def _read_array(typecode, data, offset, count):
+    """count little-endian items of typecode from data at offset; returns (array, offset after them)."""
+    values = array(typecode)
+    end = offset + count * values.itemsize
+    values.frombytes(data[offset:end])
+    return _little_endian(values), end
+
+
+def _iter_pairs(pairs):
+    """Accept a mapping or an iterable of (key, value) pairs."""
+    return pairs.items() if hasattr(pairs, 'items') else pairs
+
+
+def _sized_pairs(pairs):
+    """
+    (pairs, expected count). An iterable without a length hint (a generator, zip, ...)
+    reports 0, so it is read into a list first and the table can still be sized up front.
+    """
+    pairs = _iter_pairs(pairs)
+    expected = operator.length_hint(pairs)
+    if not expected:
+        pairs = list(pairs)
+        expected = len(pairs)
+    return pairs, expected
+
+
 class HashTable:
     def __init__(self, size):
         self.size = size
@@ -39,3 +99,334 @@ class HashTable:
                 if pair[0] == key:
                     return pair[1]
         return None
+
+    @classmethod
+    def from_pairs(cls, pairs):
+        """Build a table with one bucket per expected pair."""
+        pairs, expected = _sized_pairs(pairs)
+        table = cls(max(expected, 1))
+        table.update(pairs)
+        return table
+
+    def update(self, pairs):
+        """
+        Insert every (key, value) pair from a mapping or an iterable of pairs.
+        The table never grows on insert, so when the pairs would leave more entries
+        than buckets it is rebuilt once up front with one bucket per entry.
+        """
+        pairs, expected = _sized_pairs(pairs)
+        expected += sum(map(len, self.table))
+        if expected > self.size:
+            self._rebucket(expected)
+
+        insert = self.insert
+        for key, value in pairs:
+            insert(key, value)
+
+    def _rebucket(self, size):
+        old_table = self.table
+        self.size = size
+        self.table = [[] for _ in range(size)]
+        for bucket in old_table:
+            for pair in bucket:
+                self.table[self.hash_function(pair[0])].append(pair)
+
+    def items(self):
+        for bucket in self.table:
+            for key, value in bucket:
+                yield key, value
+
+    def keys(self):
+        for key, _ in self.items():
+            yield key
+
+    def to_bytes(self):
+        """
+        Binary snapshot: a fixed header, the bucket number of every entry as a
+        little-endian 64-bit array, then the keys and values pickled as two lists.
+        from_bytes appends every entry straight to its bucket without calling hash().
+        """
+        buckets = array('Q')
+        keys, values = [], []
+        for index, bucket in enumerate(self.table):
+            for key, value in bucket:
+                buckets.append(index)
+                keys.append(key)
+                values.append(value)
+        payload = pickle.dumps((keys, values), protocol=pickle.HIGHEST_PROTOCOL)
+        header = _CHAINED_SNAPSHOT_HEADER.pack(_CHAINED_SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, self.size, len(keys),
+                                               _hash_seed_probe())
+        return header + _little_endian(buckets).tobytes() + payload
+
+    @classmethod
+    def from_bytes(cls, data):
+        data = memoryview(data)
+        magic, version, size, count, probe = _CHAINED_SNAPSHOT_HEADER.unpack_from(data)
+        if magic != _CHAINED_SNAPSHOT_MAGIC or version != _SNAPSHOT_VERSION:
+            raise ValueError(f"Not a chained hash table snapshot (magic {bytes(magic)!r}, version {version})")
+
+        buckets, offset = _read_array('Q', data, _CHAINED_SNAPSHOT_HEADER.size, count)
+        keys, values = pickle.loads(data[offset:])
+
+        table = cls(size)
+        if probe != _hash_seed_probe():
+            # saved by a process with another hash seed: the bucket numbers are stale
+            for key, value in zip(keys, values):
+                table.insert(key, value)
+            return table
+
+        for index, key, value in zip(buckets, keys, values):
+            table.table[index].append([key, value])
+        return table
+
+    def save(self, path):
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+class OpenAddressingHashTable:
+    """
+    Hash table with linear probing over parallel key/value/hash arrays.
+
+    - The capacity is a power of two and doubles when the number of entries would
+      exceed `max_load_factor * capacity`, so inserts are amortized O(1).
+    - Stored hashes make resizing cheap: keys are not hashed again.
+    - Deletion uses backward shifting instead of tombstones, so the table never
+      fills up with dead slots and probe sequences stay short.
+    """
+
+    def __init__(self, size=8, max_load_factor=0.6):
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be between 0 and 1")
+
+        self.max_load_factor = max_load_factor
+        self.count = 0
+        self._allocate(self._capacity_for(size))
+
+    def _capacity_for(self, size):
+        capacity = 8
+        while capacity * self.max_load_factor < size:
+            capacity *= 2
+        return capacity
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        self.shift = 64 - (capacity.bit_length() - 1)
+        self._keys = [_EMPTY] * capacity
+        self._values = [None] * capacity
+        self._hashes = [0] * capacity
+
+    def _home_slot(self, key_hash):
+        # Fibonacci hashing: spreads keys such as consecutive or aligned integers
+        return ((key_hash & _MASK_64) * _FIBONACCI_MULTIPLIER & _MASK_64) >> self.shift
+
+    def _find_slot(self, key, key_hash):
+        """Return the slot holding key, or the free slot where it would be inserted."""
+        keys = self._keys
+        hashes = self._hashes
+        mask = self.capacity - 1
+        # _home_slot inlined: this is the hot path of every operation
+        index = ((key_hash & _MASK_64) * _FIBONACCI_MULTIPLIER & _MASK_64) >> self.shift
+
+        while True:
+            slot_key = keys[index]
+            if slot_key is _EMPTY:
+                return index
+            if hashes[index] == key_hash and (slot_key is key or slot_key == key):
+                return index
+            index = (index + 1) & mask
+
+    def _lookup(self, key, key_hash, default=None):
+        """
+        get() that reads every array and the capacity only once, from the list objects
+        themselves. Used for reads without a lock: a concurrent resize may still mix old
+        and new arrays, so the caller validates the result (see ShardedHashTable).
+        """
+        keys, values, hashes = self._keys, self._values, self._hashes
+        capacity = len(keys)
+        mask = capacity - 1
+        index = ((key_hash & _MASK_64) * _FIBONACCI_MULTIPLIER & _MASK_64) >> (65 - capacity.bit_length())
+
+        while True:
+            slot_key = keys[index]
+            if slot_key is _EMPTY:
+                return default
+            if hashes[index] == key_hash and (slot_key is key or slot_key == key):
+                return values[index]
+            index = (index + 1) & mask
+
+    def _resize(self, capacity):
+        old_keys, old_values, old_hashes = self._keys, self._values, self._hashes
+        self._allocate(capacity)
+        keys, values, hashes = self._keys, self._values, self._hashes
+        mask = capacity - 1
+        shift = self.shift
+
+        for key, value, key_hash in zip(old_keys, old_values, old_hashes):
+            if key is _EMPTY:
+                continue
+            index = ((key_hash & _MASK_64) * _FIBONACCI_MULTIPLIER & _MASK_64) >> shift
+            while keys[index] is not _EMPTY:
+                index = (index + 1) & mask
+            keys[index] = key
+            values[index] = value
+            hashes[index] = key_hash
+
+    def insert(self, key, value):
+        key_hash = hash(key)
+        index = self._find_slot(key, key_hash)
+
+        if self._keys[index] is _EMPTY:
+            if self.count + 1 > self.capacity * self.max_load_factor:
+                self._resize(self.capacity * 2)
+                index = self._find_slot(key, key_hash)
+            self._keys[index] = key
+            self._hashes[index] = key_hash
+            self.count += 1
+
+        self._values[index] = value
+        return True
+
+    def get(self, key):
+        index = self._find_slot(key, hash(key))
+        if self._keys[index] is _EMPTY:
+            return None
+        return self._values[index]
+
+    def delete(self, key):
+        keys, values, hashes = self._keys, self._values, self._hashes
+        index = self._find_slot(key, hash(key))
+        if keys[index] is _EMPTY:
+            return False
+
+        # backward shift: move later entries of the same cluster into the hole
+        # unless their home slot lies cyclically after the hole
+        mask = self.capacity - 1
+        hole = index
+        current = index
+        while True:
+            current = (current + 1) & mask
+            if keys[current] is _EMPTY:
+                break
+            home = self._home_slot(hashes[current])
+            if hole <= current:
+                stays = hole < home <= current
+            else:
+                stays = home > hole or home <= current
+            if stays:
+                continue
+            keys[hole] = keys[current]
+            values[hole] = values[current]
+            hashes[hole] = hashes[current]
+            hole = current
+
+        keys[hole] = _EMPTY
+        values[hole] = None
+        hashes[hole] = 0
+        self.count -= 1
+        return True
+
+    @classmethod
+    def from_pairs(cls, pairs, max_load_factor=0.6):
+        table = cls(operator.length_hint(pairs), max_load_factor)
+        table.update(pairs)
+        return table
+
+    def update(self, pairs):
+        """
+        Insert every (key, value) pair from a mapping or an iterable of pairs.
+        The table is grown once up front from the length hint of pairs, instead of
+        doubling repeatedly while the pairs are inserted.
+        """
+        pairs = _iter_pairs(pairs)
+        expected = self.count + operator.length_hint(pairs)
+        if expected > self.capacity * self.max_load_factor:
+            self._resize(self._capacity_for(expected))
+
+        insert = self.insert
+        for key, value in pairs:
+            insert(key, value)
+
+    def items(self):
+        for key, value in zip(self._keys, self._values):
+            if key is not _EMPTY:
+                yield key, value
+
+    def keys(self):
+        for key in self._keys:
+            if key is not _EMPTY:
+                yield key
+
+    def values(self):
+        for key, value in zip(self._keys, self._values):
+            if key is not _EMPTY:
+                yield value
+
+    def to_bytes(self):
+        """
+        Binary snapshot: a fixed header, the occupied slot numbers and stored hashes as
+        little-endian 64-bit arrays, then the keys and values pickled as two lists.
+        from_bytes puts every entry back into its slot without calling hash().
+        """
+        slots = array('Q', (index for index, key in enumerate(self._keys) if key is not _EMPTY))
+        hashes = array('q', (self._hashes[index] for index in slots))
+        payload = pickle.dumps(([self._keys[index] for index in slots], [self._values[index] for index in slots]),
+                               protocol=pickle.HIGHEST_PROTOCOL)
+        header = _SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, self.max_load_factor, self.capacity,
+                                       self.count, _hash_seed_probe())
+        return header + _little_endian(slots).tobytes() + _little_endian(hashes).tobytes() + payload
+
+    @classmethod
+    def from_bytes(cls, data):
+        data = memoryview(data)
+        magic, version, max_load_factor, capacity, count, probe = _SNAPSHOT_HEADER.unpack_from(data)
+        if magic != _SNAPSHOT_MAGIC or version != _SNAPSHOT_VERSION:
+            raise ValueError(f"Not a hash table snapshot (magic {bytes(magic)!r}, version {version})")
+
+        slots, offset = _read_array('Q', data, _SNAPSHOT_HEADER.size, count)
+        hashes, offset = _read_array('q', data, offset, count)
+        keys, values = pickle.loads(data[offset:])
+
+        if probe != _hash_seed_probe():
+            # saved by a process with another hash seed: the stored hashes are stale;
+            # zip() has no length hint, so size the table from the header count
+            table = cls(count, max_load_factor)
+            table.update(zip(keys, values))
+            return table
+
+        table = cls(max_load_factor=max_load_factor)
+
+        table._allocate(capacity)
+        for index, key_hash, key, value in zip(slots, hashes, keys, values):
+            table._keys[index] = key
+            table._values[index] = value
+            table._hashes[index] = key_hash
+        table.count = count
+        return table
+
+    def save(self, path):
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        return cls.from_bytes(Path(path).read_bytes())
+
+    @property
+    def load_factor(self):
+        return self.count / self.capacity
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        return self._keys[self._find_slot(key, hash(key))] is not _EMPTY
+
+    def __iter__(self):
+        return self.keys()
+
+    def __repr__(self):
+        pairs = ", ".join(f"{key!r}: {value!r}" for key, value in zip(self._keys, self._values) if key is not _EMPTY)
+        return f"OpenAddressingHashTable({{{pairs}}})"
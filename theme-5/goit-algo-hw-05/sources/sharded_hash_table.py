@@ -0,0 +1,161 @@
+import operator
+import threading
+
+from .hash_table import _FIBONACCI_MULTIPLIER, _MASK_64, OpenAddressingHashTable
+
+_MISSING = object()
+
+# optimistic reads that raced with a writer are retried this many times before taking the lock
+OPTIMISTIC_READ_ATTEMPTS = 2
+
+# the shard index is taken from the mixed hash at this bit; the tables use its top bits
+_SHARD_SHIFT = 32
+
+
+class _Shard:
+    """
+    One OpenAddressingHashTable with its own lock and a version counter (a seqlock).
+    Writers make the version odd while they modify the table and even again afterwards,
+    so a reader that saw the same even version before and after its lookup knows no
+    write overlapped it.
+    """
+    __slots__ = ('table', 'lock', 'version')
+
+    def __init__(self, size, max_load_factor):
+        self.table = OpenAddressingHashTable(size, max_load_factor)
+        self.lock = threading.Lock()
+        self.version = 0
+
+
+class ShardedHashTable:
+    """
+    Thread-safe hash table split into independent shards, each guarded by its own lock.
+
+    Writers to different shards never wait for each other. get() and __contains__ take
+    no lock: they read optimistically and only fall back to the shard lock when a write
+    to the same shard overlapped the read. get_or_insert() and compute_if_absent() are
+    atomic per key.
+    """
+
+    def __init__(self, size=8, shard_count=16, max_load_factor=0.6):
+        if shard_count < 1 or shard_count & (shard_count - 1):
+            raise ValueError("shard_count must be a power of two")
+
+        self.shard_mask = shard_count - 1
+        shard_size = -(-size // shard_count)
+        self.shards = [_Shard(shard_size, max_load_factor) for _ in range(shard_count)]
+
+    def _shard_index(self, key_hash):
+        # Fibonacci mix as in the tables, so ints with patterned low bits (multiples of
+        # the shard count) still spread; middle bits, since the table inside uses the top ones
+        return ((key_hash & _MASK_64) * _FIBONACCI_MULTIPLIER & _MASK_64) >> _SHARD_SHIFT & self.shard_mask
+
+    def _shard(self, key_hash):
+        return self.shards[self._shard_index(key_hash)]
+
+    def _read(self, shard, key, key_hash):
+        for _ in range(OPTIMISTIC_READ_ATTEMPTS):
+            version = shard.version
+            if version & 1:
+                break  # a write is in progress, waiting for the lock is cheaper than spinning
+            try:
+                value = shard.table._lookup(key, key_hash, _MISSING)
+            except IndexError:
+                continue  # the arrays were swapped by a resize in the middle of the lookup
+            if shard.version == version:
+                return value
+
+        with shard.lock:
+            return shard.table._lookup(key, key_hash, _MISSING)
+
+    def get(self, key, default=None):
+        key_hash = hash(key)
+        value = self._read(self._shard(key_hash), key, key_hash)
+        return default if value is _MISSING else value
+
+    def insert(self, key, value):
+        shard = self._shard(hash(key))
+        with shard.lock:
+            shard.version += 1
+            try:
+                return shard.table.insert(key, value)
+            finally:
+                shard.version += 1
+
+    def delete(self, key):
+        shard = self._shard(hash(key))
+        with shard.lock:
+            shard.version += 1
+            try:
+                return shard.table.delete(key)
+            finally:
+                shard.version += 1
+
+    def compute_if_absent(self, key, factory):
+        """
+        Return the value for key. If it is absent, store and return factory(key).
+        factory is called under the shard lock, at most once per absent key, so
+        concurrent callers never build the value twice.
+        """
+        key_hash = hash(key)
+        shard = self._shard(key_hash)
+        value = self._read(shard, key, key_hash)
+        if value is not _MISSING:
+            return value
+
+        with shard.lock:
+            value = shard.table._lookup(key, key_hash, _MISSING)
+            if value is _MISSING:
+                value = factory(key)
+                shard.version += 1
+                try:
+                    shard.table.insert(key, value)
+                finally:
+                    shard.version += 1
+            return value
+
+    def get_or_insert(self, key, value):
+        """Return the stored value for key, inserting value first if key is absent."""
+        return self.compute_if_absent(key, lambda _: value)
+
+    def update(self, pairs):
+        pairs = pairs.items() if hasattr(pairs, 'items') else pairs
+        groups = [[] for _ in self.shards]
+        for key, value in pairs:
+            groups[self._shard_index(hash(key))].append((key, value))
+
+        for shard, group in zip(self.shards, groups):
+            if group:
+                with shard.lock:
+                    shard.version += 1
+                    try:
+                        shard.table.update(group)
+                    finally:
+                        shard.version += 1
+
+    @classmethod
+    def from_pairs(cls, pairs, shard_count=16, max_load_factor=0.6):
+        table = cls(operator.length_hint(pairs), shard_count, max_load_factor)
+        table.update(pairs)
+        return table
+
+    def items(self):
+        """Pairs shard by shard; each shard is copied under its lock, the whole table is not frozen."""
+        for shard in self.shards:
+            with shard.lock:
+                pairs = list(shard.table.items())
+            yield from pairs
+
+    def keys(self):
+        for key, _ in self.items():
+            yield key
+
+    def __len__(self):
+        return sum(len(shard.table) for shard in self.shards)
+
+    def __contains__(self, key):
+        key_hash = hash(key)
+        return self._read(self._shard(key_hash), key, key_hash) is not _MISSING
+
+    def __iter__(self):
+        return self.keys()
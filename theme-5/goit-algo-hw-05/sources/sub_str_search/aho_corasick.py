@@ -0,0 +1,87 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+
+@dataclass
+class AhoCorasickAutomaton:
+    patterns: List[str]
+    goto: List[Dict[str, int]]
+    fail: List[int]
+    output: List[List[int]]
+
+
+def build_automaton(patterns: Iterable[str]) -> AhoCorasickAutomaton:
+    """
+    Build the Aho-Corasick automaton for a set of patterns.
+
+    The trie (goto transitions) is built first, then failure links and merged
+    outputs are filled in breadth-first order, so every state knows all patterns
+    that end at it, including those reachable through its failure chain.
+    """
+    unique_patterns = list(dict.fromkeys(patterns))
+    if any(not pattern for pattern in unique_patterns):
+        raise ValueError("Patterns must be non-empty strings")
+
+    goto: List[Dict[str, int]] = [{}]
+    fail: List[int] = [0]
+    output: List[List[int]] = [[]]
+
+    for index, pattern in enumerate(unique_patterns):
+        state = 0
+        for char in pattern:
+            next_state = goto[state].get(char)
+            if next_state is None:
+                next_state = len(goto)
+                goto[state][char] = next_state
+                goto.append({})
+                fail.append(0)
+                output.append([])
+            state = next_state
+        output[state].append(index)
+
+    # states of depth 1 fail to the root, deeper ones are resolved level by level
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for char, next_state in goto[state].items():
+            queue.append(next_state)
+
+            fallback = fail[state]
+            while fallback and char not in goto[fallback]:
+                fallback = fail[fallback]
+            fail[next_state] = goto[fallback].get(char, 0)
+
+            if output[fail[next_state]]:
+                output[next_state] = output[next_state] + output[fail[next_state]]
+
+    return AhoCorasickAutomaton(unique_patterns, goto, fail, output)
+
+
+def aho_corasick_search(text: str, patterns) -> List[Tuple[str, int]]:
+    """
+    Find every occurrence of every pattern in a single pass over the text.
+
+    `patterns` is either an iterable of strings or an automaton returned by
+    `build_automaton` (to reuse it across texts). Returns a list of
+    (pattern, offset) pairs ordered by the position where the match ends.
+    """
+    automaton = patterns if isinstance(patterns, AhoCorasickAutomaton) else build_automaton(patterns)
+    goto = automaton.goto
+    fail = automaton.fail
+    output = automaton.output
+    patterns_list = automaton.patterns
+    lengths = [len(pattern) for pattern in patterns_list]
+
+    matches: List[Tuple[str, int]] = []
+    state = 0
+
+    for i, char in enumerate(text):
+        while state and char not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(char, 0)
+
+        for index in output[state]:
+            matches.append((patterns_list[index], i - lengths[index] + 1))
+
+    return matches
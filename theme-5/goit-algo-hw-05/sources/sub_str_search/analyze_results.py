@@ -1,14 +1,16 @@
 import math
 
+from ..complexity_fit import fit_complexity
+
 
 def calculate_complexity_ratio(data, algorithm):
     """
-    Calculate empirical complexity ratio to determine O(f(n))
-    For linear O(n): ratio should be proportional to n increase
-    For O(n log n): ratio should be proportional to n*log(n) increase
+    Show how time per call grows between consecutive sizes, then classify the growth
+    with a least-squares fit over all sizes instead of per-pair thresholds.
     """
     sizes = [int(s) for s in data['sizes']]
-    times = data[algorithm]
+    iterations = data.get('iterations', [1] * len(sizes))
+    times = [t / it for t, it in zip(data[algorithm], iterations)]
 
     print(f"\n{algorithm.upper()} Complexity Analysis:")
     print("-" * 60)
@@ -17,25 +19,18 @@ def calculate_complexity_ratio(data, algorithm):
         size_ratio = sizes[i] / sizes[i-1]
         time_ratio = times[i] / times[i-1] if times[i-1] > 0 else 0
 
-        expected_linear = size_ratio
         expected_n_log_n = (sizes[i] * math.log(sizes[i])) / (sizes[i-1] * math.log(sizes[i-1]))
 
-        linear_fit = time_ratio / expected_linear
-        n_log_n_fit = time_ratio / expected_n_log_n
-
         print(f"  {sizes[i-1]:>6} -> {sizes[i]:>6} chars:")
         print(f"    Size increase: {size_ratio:.2f}x")
         print(f"    Time increase: {time_ratio:.2f}x")
-        print(f"    O(n) fit:      {linear_fit:.2f} (1.0 = perfect linear)")
-        print(f"    O(n log n) fit: {n_log_n_fit:.2f}")
+        print(f"    O(n) fit:      {time_ratio / size_ratio:.2f} (1.0 = perfect linear)")
+        print(f"    O(n log n) fit: {time_ratio / expected_n_log_n:.2f}")
 
-        # best fit
-        if abs(linear_fit - 1.0) < 0.2:
-            print(f"    Best fit: O(n) - Linear complexity")
-        elif linear_fit < 0.8:
-            print(f"    Best fit: O(n/m) - Sublinear (pattern skipping)")
-        else:
-            print(f"    Best fit: O(n log n) or higher")
+    if len(sizes) >= 2 and all(t > 0 for t in times):
+        fit = fit_complexity(sizes, times)
+        print(f"  Best fit (least squares over all sizes): {fit.best.model} "
+              f"(confidence {fit.confidence:.0%})")
 
 
 def calculate_average_constant_factor(data, algorithm, baseline_algorithm='boyer_moore'):
@@ -49,26 +44,62 @@ def calculate_average_constant_factor(data, algorithm, baseline_algorithm='boyer
     return avg_ratio
 
 
-def comprehensive_analysis(data):
+ALGORITHM_NAMES = {
+    'boyer_moore': 'Boyer-Moore',
+    'kmp': 'KMP',
+    'rabin_karp': 'Rabin-Karp',
+    'horspool': 'Horspool',
+    'full': 'Full BM',
+    'sunday': 'Sunday',
+}
+
+ALGORITHM_SHORT_NAMES = {
+    'boyer_moore': 'BM',
+    'kmp': 'KMP',
+    'rabin_karp': 'RK',
+    'horspool': 'Horspool',
+    'full': 'Full BM',
+    'sunday': 'Sunday',
+}
+
+SEARCH_ALGORITHMS = ['boyer_moore', 'kmp', 'rabin_karp']
+
+
+def scenario_title(scenario):
+    if scenario == 'existing':
+        return "Pattern EXISTS"
+    if scenario == 'non_existing':
+        return "Pattern DOES NOT EXIST"
+    return f"Alphabet '{scenario}'"
+
+
+def comprehensive_analysis(data, algorithms=None):
+    """
+    Print complexity, relative speed and per-character cost for every scenario in data.
+    The first algorithm in `algorithms` is the baseline for relative comparisons.
+    """
+    if algorithms is None:
+        algorithms = SEARCH_ALGORITHMS
+    baseline = algorithms[0]
+    baseline_name = ALGORITHM_NAMES[baseline]
+
     print("=" * 80)
     print("COMPREHENSIVE STRING SEARCH ALGORITHMS ANALYSIS")
     print("=" * 80)
 
-    for scenario in ['existing', 'non_existing']:
+    for scenario, scenario_data in data.items():
         print(f"\n\n{'='*80}")
-        print(f"SCENARIO: Pattern {'EXISTS' if scenario == 'existing' else 'DOES NOT EXIST'}")
+        print(f"SCENARIO: {scenario_title(scenario)}")
         print("=" * 80)
 
-        scenario_data = data[scenario]
-
-        for algorithm in ['boyer_moore', 'kmp', 'rabin_karp']:
+        for algorithm in algorithms:
             calculate_complexity_ratio(scenario_data, algorithm)
 
-        print(f"\n\nPERFORMANCE COMPARISON (relative to Boyer-Moore):")
+        print(f"\n\nPERFORMANCE COMPARISON (relative to {baseline_name}):")
         print("-" * 60)
 
-        for algorithm in ['kmp', 'rabin_karp']:
-            avg_factor = calculate_average_constant_factor(scenario_data, algorithm)
+        for algorithm in algorithms[1:]:
+            avg_factor = calculate_average_constant_factor(scenario_data, algorithm, baseline)
             print(f"  {algorithm.upper():12} is {avg_factor:.2f}x slower on average")
 
         print(f"\n\nEFFICIENCY AT DIFFERENT SCALES:")
@@ -76,46 +107,53 @@ def comprehensive_analysis(data):
         sizes = scenario_data['sizes']
         for i, size in enumerate(sizes):
             print(f"\n  Text size: {size} characters")
-            bm_time = scenario_data['boyer_moore'][i]
-            kmp_time = scenario_data['kmp'][i]
-            rk_time = scenario_data['rabin_karp'][i]
-
-            # time per character
+            baseline_time = scenario_data[baseline][i]
             size_int = int(size)
-            bm_per_char = (bm_time / size_int) * 1000000  # microseconds per char
-            kmp_per_char = (kmp_time / size_int) * 1000000
-            rk_per_char = (rk_time / size_int) * 1000000
 
-            print(f"    Boyer-Moore:  {bm_time:.6f}s total, {bm_per_char:.3f} us/char")
-            print(f"    KMP:          {kmp_time:.6f}s total, {kmp_per_char:.3f} us/char ({kmp_time/bm_time:.2f}x)")
-            print(f"    Rabin-Karp:   {rk_time:.6f}s total, {rk_per_char:.3f} us/char ({rk_time/bm_time:.2f}x)")
+            for algorithm in algorithms:
+                algo_time = scenario_data[algorithm][i]
+                per_char = (algo_time / size_int) * 1000000  # microseconds per char
+                label = f"{ALGORITHM_NAMES[algorithm]}:"
+                line = f"    {label:<14}{algo_time:.6f}s total, {per_char:.3f} us/char"
+                if algorithm != baseline:
+                    line += f" ({algo_time/baseline_time:.2f}x)" if baseline_time > 0 else " (n/a)"
+                print(line)
+
+
+def print_summary_scenario(scenario_data, algorithms):
+    header = f"{'Size':<10} | " + " | ".join(f"{ALGORITHM_NAMES[a]:<11}" for a in algorithms) + f" | {'Winner':<11}"
+    print(header)
+    print("-" * 80)
+
+    for i, size in enumerate(scenario_data['sizes']):
+        times = [(algorithm, scenario_data[algorithm][i]) for algorithm in algorithms]
+        winner = ALGORITHM_SHORT_NAMES[min(times, key=lambda x: x[1])[0]]
+        print(f"{size:<10} | " + " | ".join(f"{t:>10.6f}s" for _, t in times) + f" | {winner:<12}")
+
 
+def generate_summary_table(data, algorithms=None):
+    if algorithms is None:
+        algorithms = SEARCH_ALGORITHMS
 
-def generate_summary_table(data):
     print("\n\n" + "=" * 80)
     print("SUMMARY TABLE")
     print("=" * 80)
 
-    print("\nPattern EXISTS in text:")
-    print("-" * 80)
-    print(f"{'Size':<10} | {'Boyer-Moore':<11} | {'KMP':<11} | {'Rabin-Karp':<11} | {'Winner':<11}")
-    print("-" * 80)
+    for scenario, scenario_data in data.items():
+        print(f"\n{scenario_title(scenario)}{' in text' if scenario in ('existing', 'non_existing') else ''}:")
+        print("-" * 80)
+        print_summary_scenario(scenario_data, algorithms)
 
-    for i, size in enumerate(data['existing']['sizes']):
-        bm = data['existing']['boyer_moore'][i]
-        kmp = data['existing']['kmp'][i]
-        rk = data['existing']['rabin_karp'][i]
-        winner = min([('BM', bm), ('KMP', kmp), ('RK', rk)], key=lambda x: x[1])[0]
-        print(f"{size:<10} | {bm:>10.6f}s | {kmp:>10.6f}s | {rk:>10.6f}s | {winner:<12}")
 
-    print("\nPattern DOES NOT EXIST in text:")
-    print("-" * 80)
-    print(f"{'Size':<10} | {'Boyer-Moore':<11} | {'KMP':<11} | {'Rabin-Karp':<11} | {'Winner':<11}")
+def print_collision_statistics(results):
+    """Print Rabin-Karp hash hits vs true matches; `results` items have label, time and stats."""
+    print("\n\n" + "=" * 80)
+    print("RABIN-KARP HASH COLLISIONS")
+    print("=" * 80)
+    print(f"{'Mode':<32} | {'Time':>10} | {'Hash hits':>10} | {'Matches':>8} | {'Collision rate':>14}")
     print("-" * 80)
 
-    for i, size in enumerate(data['non_existing']['sizes']):
-        bm = data['non_existing']['boyer_moore'][i]
-        kmp = data['non_existing']['kmp'][i]
-        rk = data['non_existing']['rabin_karp'][i]
-        winner = min([('BM', bm), ('KMP', kmp), ('RK', rk)], key=lambda x: x[1])[0]
-        print(f"{size:<10} | {bm:>10.6f}s | {kmp:>10.6f}s | {rk:>10.6f}s | {winner:<12}")
+    for result in results:
+        stats = result.stats
+        print(f"{result.label:<32} | {result.time:>9.6f}s | {stats.hash_hits:>10} | {stats.matches:>8} | "
+              f"{stats.collision_rate:>13.4%}")
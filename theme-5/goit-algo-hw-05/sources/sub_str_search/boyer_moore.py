@@ -9,9 +9,10 @@ def build_shift_table(pattern):
   table.setdefault(pattern[-1], length)
   return table
 
-def boyer_moore_search(text, pattern):
-  # Створюємо таблицю зсувів для патерну (підрядка)
-  shift_table = build_shift_table(pattern)
+def boyer_moore_search(text, pattern, shift_table=None):
+  # Створюємо таблицю зсувів для патерну (підрядка), якщо її не передали готовою
+  if shift_table is None:
+    shift_table = build_shift_table(pattern)
   i = 0 # Ініціалізуємо початковий індекс для основного тексту
 
   # Проходимо по основному тексту, порівнюючи з підрядком
@@ -32,3 +33,121 @@ def boyer_moore_search(text, pattern):
 
   # Якщо підрядок не знайдено, повертаємо -1
   return -1
+
+def boyer_moore_search_all(text, pattern, shift_table=None):
+  """Генератор, що повертає позиції всіх (зокрема перекривних) входжень підрядка."""
+  if shift_table is None:
+    shift_table = build_shift_table(pattern)
+  pattern_length = len(pattern)
+  i = 0
+
+  while i <= len(text) - pattern_length:
+    j = pattern_length - 1
+
+    while j >= 0 and text[i + j] == pattern[j]:
+      j -= 1
+
+    if j < 0:
+      yield i
+
+    # Зсув за останнім символом вікна безпечний і після збігу,
+    # тому перекривні входження не пропускаються
+    i += shift_table.get(text[i + pattern_length - 1], pattern_length)
+
+
+def build_bad_character_table(pattern):
+  """Таблиця останніх входжень символів у підрядку (правило поганого символу)."""
+  return {char: index for index, char in enumerate(pattern)}
+
+
+def build_good_suffix_table(pattern):
+  """
+  Таблиця зсувів за правилом хорошого суфікса.
+  shift[j + 1] - зсув, якщо розбіжність сталася на позиції j після збігу суфікса pattern[j + 1:].
+  """
+  length = len(pattern)
+  shift = [0] * (length + 1)
+  border = [0] * (length + 1)
+
+  # Випадок 1: суфікс, що збігся, зустрічається в підрядку ще раз
+  i, j = length, length + 1
+  border[i] = j
+  while i > 0:
+    while j <= length and pattern[i - 1] != pattern[j - 1]:
+      if shift[j] == 0:
+        shift[j] = j - i
+      j = border[j]
+    i -= 1
+    j -= 1
+    border[i] = j
+
+  # Випадок 2: лише частина суфікса збігається з префіксом підрядка
+  j = border[0]
+  for i in range(length + 1):
+    if shift[i] == 0:
+      shift[i] = j
+    if i == j:
+      j = border[j]
+
+  return shift
+
+
+def boyer_moore_full_search(text, pattern):
+  """Повний алгоритм Боєра-Мура: правила поганого символу та хорошого суфікса."""
+  bad_character = build_bad_character_table(pattern)
+  good_suffix = build_good_suffix_table(pattern)
+  pattern_length = len(pattern)
+  i = 0
+
+  while i <= len(text) - pattern_length:
+    j = pattern_length - 1
+
+    while j >= 0 and text[i + j] == pattern[j]:
+      j -= 1
+
+    if j < 0:
+      return i
+
+    # Обираємо більший із двох безпечних зсувів
+    i += max(good_suffix[j + 1], j - bad_character.get(text[i + j], -1))
+
+  return -1
+
+
+def build_sunday_table(pattern):
+  """Таблиця зсувів Санді (quick search): за символом одразу після вікна."""
+  length = len(pattern)
+  return {char: length - index for index, char in enumerate(pattern)}
+
+
+def sunday_search(text, pattern):
+  """Алгоритм Санді: порівнюємо вікно цілим зрізом і зсуваємося за наступним символом."""
+  shift_table = build_sunday_table(pattern)
+  pattern_length = len(pattern)
+  text_length = len(text)
+  i = 0
+
+  while i <= text_length - pattern_length:
+    if text[i:i + pattern_length] == pattern:
+      return i
+
+    if i + pattern_length >= text_length:
+      break
+
+    i += shift_table.get(text[i + pattern_length], pattern_length + 1)
+
+  return -1
+
+
+# Варіанти Боєра-Мура, доступні за назвою
+BOYER_MOORE_VARIANTS = {
+  'horspool': boyer_moore_search,
+  'full': boyer_moore_full_search,
+  'sunday': sunday_search,
+}
+
+
+def boyer_moore_variant_search(text, pattern, variant='horspool'):
+  if variant not in BOYER_MOORE_VARIANTS:
+    raise ValueError(f"Unknown Boyer-Moore variant {variant!r}, expected one of {sorted(BOYER_MOORE_VARIANTS)}")
+  return BOYER_MOORE_VARIANTS[variant](text, pattern)
@@ -1,12 +1,25 @@
-import timeit
+import os
+import tempfile
 import random
 import string
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List
 
-from .boyer_moore import boyer_moore_search
-from .knuth_morris_pratt import kmp_search
-from .rabin_karp import rabin_karp_search
+from ..benchmark_runner import BenchmarkStats, run_benchmark
+from ..complexity_fit import ComplexityFit, fit_complexity, geometric_sizes, measure_complexity, print_fit
+from .boyer_moore import boyer_moore_search, BOYER_MOORE_VARIANTS
+from .knuth_morris_pratt import kmp_search, kmp_search_all
+from .rabin_karp import (
+    rabin_karp_search,
+    rabin_karp_search_all,
+    rabin_karp_multi_search,
+    RabinKarpStats,
+    LARGE_PRIME_MODULUS,
+)
+from .aho_corasick import build_automaton, aho_corasick_search
+from .compiled_pattern import compile as compile_pattern
+from .file_search import search_file
+from .parallel_search import parallel_search
 
 
 @dataclass
@@ -18,24 +31,134 @@ class BenchmarkResult:
     kmp_time: float
     rabin_karp_time: float
     iterations: int
+    stats: List[BenchmarkStats] = field(default_factory=list)
 
 
-def generate_random_string(length):
-    return ''.join(random.choices(string.ascii_lowercase + ' ', k=length))
+@dataclass
+class MultiPatternBenchmarkResult:
+    text_size: int
+    pattern_count: int
+    per_pattern_time: float
+    aho_corasick_time: float
+    automaton_build_time: float
+    matches_found: int
+    iterations: int
+
+
+@dataclass
+class VariantBenchmarkResult:
+    text_size: int
+    alphabet: str
+    times: Dict[str, float]
+    iterations: int
+
+
+@dataclass
+class RabinKarpBenchmarkResult:
+    label: str
+    modulus: int
+    pattern_count: int
+    time: float
+    stats: RabinKarpStats
+    iterations: int
+
+
+@dataclass
+class FileBenchmarkResult:
+    file_size: int
+    algorithm: str
+    mmap_time: float
+    read_time: float
+    iterations: int
+
+
+@dataclass
+class ParallelBenchmarkResult:
+    text_size: int
+    workers: int
+    sequential_time: float
+    parallel_time: float
+    first_match_time: float
+    iterations: int
+
+
+@dataclass
+class CompiledBenchmarkResult:
+    algorithm: str
+    record_count: int
+    record_size: int
+    one_shot_time: float
+    compiled_time: float
+    iterations: int
+
+
+# low-entropy alphabets make bad-character shifts collapse, which is where the variants differ
+ALPHABETS = {
+    'english': string.ascii_lowercase + ' ',
+    'dna': 'ACGT',
+    'binary': '01',
+}
 
 
-def generate_test_text(size: int, pattern: str, pattern_exists: bool) -> str:
+def generate_random_string(length, alphabet: str = ALPHABETS['english']):
+    return ''.join(random.choices(alphabet, k=length))
+
+
+def generate_test_text(size: int, pattern: str, pattern_exists: bool, alphabet: str = ALPHABETS['english']) -> str:
     if pattern_exists:
         # place pattern near the end to test worst-case scenarios
-        prefix = generate_random_string(size - len(pattern) - 100)
-        suffix = generate_random_string(100)
+        prefix = generate_random_string(size - len(pattern) - 100, alphabet)
+        suffix = generate_random_string(100, alphabet)
         return prefix + pattern + suffix
     else:
-        return generate_random_string(size)
+        return generate_random_string(size, alphabet)
+
+
+def generate_patterns(count: int, min_length: int = 5, max_length: int = 10) -> List[str]:
+    return [generate_random_string(random.randint(min_length, max_length)).replace(' ', 'a')
+            for _ in range(count)]
+
+
+def generate_multi_pattern_text(size: int, patterns: List[str], planted: int = 10) -> str:
+    # plant a few of the patterns at random places so that there is something to report
+    chunks = []
+    planted_patterns = random.sample(patterns, min(planted, len(patterns)))
+    chunk_size = size // (len(planted_patterns) + 1)
+    for pattern in planted_patterns:
+        chunks.append(generate_random_string(max(chunk_size - len(pattern), 0)))
+        chunks.append(pattern)
+    chunks.append(generate_random_string(max(size - sum(len(c) for c in chunks), 0)))
+    return ''.join(chunks)
+
+
+def search_each_pattern(text: str, patterns: List[str]) -> List[int]:
+    return [boyer_moore_search(text, pattern) for pattern in patterns]
+
+
+BENCHMARK_REPEATS = 5
+
+
+def benchmark_stats(algorithm, text: str, pattern: str, iterations: int | None, name: str = "") -> BenchmarkStats:
+    """
+    Warm up, then time `iterations` calls BENCHMARK_REPEATS times.
+    With iterations=None the number of calls is calibrated automatically.
+    """
+    return run_benchmark(lambda: algorithm(text, pattern), name=name or algorithm.__name__,
+                         repeats=BENCHMARK_REPEATS, number=iterations)
+
+
+def time_callable(func, iterations: int) -> float:
+    """
+    Median time of `iterations` calls of func() over BENCHMARK_REPEATS measurements
+    (time of a single call when iterations is None and the call count is calibrated).
+    """
+    stats = run_benchmark(func, repeats=BENCHMARK_REPEATS, number=iterations)
+    return stats.median * (iterations or 1)
 
 
 def benchmark_algorithm(algorithm, text: str, pattern: str, iterations: int) -> float:
-    return timeit.timeit(lambda: algorithm(text, pattern), number=iterations)
+    """Median time of `iterations` calls."""
+    return time_callable(lambda: algorithm(text, pattern), iterations)
 
 
 def run_benchmarks(text_sizes: List[int], pattern: str, iterations_list: List[int]) -> Dict[str, List[BenchmarkResult]]:
@@ -46,13 +169,20 @@ def run_benchmarks(text_sizes: List[int], pattern: str, iterations_list: List[in
 
     for text_size, iterations in zip(text_sizes, iterations_list):
         print(f"\nBenchmarking text size: {text_size} characters ({iterations} iterations)")
+        collected_stats = {'existing': [], 'non_existing': []}
+
+        def measure(scenario, algorithm, text, searched_pattern):
+            stats = benchmark_stats(algorithm, text, searched_pattern, iterations,
+                                    name=f"{scenario}/{algorithm.__name__}/{text_size}")
+            collected_stats[scenario].append(stats)
+            return stats.median * (iterations or 1)
 
         text_existing = generate_test_text(text_size, pattern, True)
         print(f"  Testing with existing pattern...")
 
-        bm_time_existing = benchmark_algorithm(boyer_moore_search, text_existing, pattern, iterations)
-        kmp_time_existing = benchmark_algorithm(kmp_search, text_existing, pattern, iterations)
-        rk_time_existing = benchmark_algorithm(rabin_karp_search, text_existing, pattern, iterations)
+        bm_time_existing = measure('existing', boyer_moore_search, text_existing, pattern)
+        kmp_time_existing = measure('existing', kmp_search, text_existing, pattern)
+        rk_time_existing = measure('existing', rabin_karp_search, text_existing, pattern)
 
         results['existing'].append(BenchmarkResult(
             text_size=text_size,
@@ -61,7 +191,8 @@ def run_benchmarks(text_sizes: List[int], pattern: str, iterations_list: List[in
             boyer_moore_time=bm_time_existing,
             kmp_time=kmp_time_existing,
             rabin_karp_time=rk_time_existing,
-            iterations=iterations
+            iterations=iterations,
+            stats=collected_stats['existing']
         ))
 
         print(f"  Testing with non-existing pattern...")
@@ -69,9 +200,9 @@ def run_benchmarks(text_sizes: List[int], pattern: str, iterations_list: List[in
         non_existing_pattern = non_existing_pattern[:len(pattern)]
         text_non_existing = generate_test_text(text_size, pattern, False)
 
-        bm_time_non_existing = benchmark_algorithm(boyer_moore_search, text_non_existing, non_existing_pattern, iterations)
-        kmp_time_non_existing = benchmark_algorithm(kmp_search, text_non_existing, non_existing_pattern, iterations)
-        rk_time_non_existing = benchmark_algorithm(rabin_karp_search, text_non_existing, non_existing_pattern, iterations)
+        bm_time_non_existing = measure('non_existing', boyer_moore_search, text_non_existing, non_existing_pattern)
+        kmp_time_non_existing = measure('non_existing', kmp_search, text_non_existing, non_existing_pattern)
+        rk_time_non_existing = measure('non_existing', rabin_karp_search, text_non_existing, non_existing_pattern)
 
         results['non_existing'].append(BenchmarkResult(
             text_size=text_size,
@@ -80,7 +211,8 @@ def run_benchmarks(text_sizes: List[int], pattern: str, iterations_list: List[in
             boyer_moore_time=bm_time_non_existing,
             kmp_time=kmp_time_non_existing,
             rabin_karp_time=rk_time_non_existing,
-            iterations=iterations
+            iterations=iterations,
+            stats=collected_stats['non_existing']
         ))
 
         print(f"    Boyer-Moore: {bm_time_existing:.6f}s (existing), {bm_time_non_existing:.6f}s (non-existing)")
@@ -90,6 +222,275 @@ def run_benchmarks(text_sizes: List[int], pattern: str, iterations_list: List[in
     return results
 
 
+def run_multi_pattern_benchmarks(text_size: int, pattern_counts: List[int],
+                                 iterations: int) -> List[MultiPatternBenchmarkResult]:
+    results = []
+
+    for pattern_count in pattern_counts:
+        print(f"\nBenchmarking {pattern_count} patterns over {text_size} characters ({iterations} iterations)")
+
+        patterns = generate_patterns(pattern_count)
+        text = generate_multi_pattern_text(text_size, patterns)
+
+        build_time = time_callable(lambda: build_automaton(patterns), iterations)
+        automaton = build_automaton(patterns)
+
+        per_pattern_time = benchmark_algorithm(search_each_pattern, text, patterns, iterations)
+        ac_time = benchmark_algorithm(aho_corasick_search, text, automaton, iterations)
+
+        results.append(MultiPatternBenchmarkResult(
+            text_size=text_size,
+            pattern_count=pattern_count,
+            per_pattern_time=per_pattern_time,
+            aho_corasick_time=ac_time,
+            automaton_build_time=build_time,
+            matches_found=len(aho_corasick_search(text, automaton)),
+            iterations=iterations
+        ))
+
+        print(f"    Boyer-Moore per pattern: {per_pattern_time:.6f}s")
+        print(f"    Aho-Corasick (single pass): {ac_time:.6f}s (+{build_time:.6f}s to build)")
+
+    return results
+
+
+def print_multi_pattern_results(results: List[MultiPatternBenchmarkResult]):
+    print("\n" + "="*100)
+    print("MULTI-PATTERN SEARCH RESULTS")
+    print("="*100)
+    print(f"{'Patterns':<10} | {'BM per pattern':<15} | {'Aho-Corasick':<15} | {'AC build':<15} | "
+          f"{'Matches':<8} | {'Speedup':<8}")
+    print("-" * 100)
+
+    for result in results:
+        speedup = result.per_pattern_time / result.aho_corasick_time if result.aho_corasick_time > 0 else 0
+        print(f"{result.pattern_count:<10} | {result.per_pattern_time:>14.6f}s | {result.aho_corasick_time:>14.6f}s | "
+              f"{result.automaton_build_time:>14.6f}s | {result.matches_found:<8} | {speedup:>7.2f}x")
+
+    print("="*100)
+
+
+def run_compiled_benchmarks(pattern: str, record_count: int, record_size: int,
+                            iterations: int) -> List[CompiledBenchmarkResult]:
+    """
+    Search the same pattern in many short records, once with the one-shot functions
+    (preprocessing on every call) and once with a pattern compiled up front.
+    """
+    records = [generate_random_string(record_size) for _ in range(record_count)]
+    one_shot = {
+        'boyer_moore': boyer_moore_search,
+        'kmp': kmp_search,
+        'rabin_karp': rabin_karp_search,
+    }
+    results = []
+
+    print(f"\nBenchmarking {record_count} records of {record_size} characters ({iterations} iterations)")
+
+    for algorithm, search in one_shot.items():
+        compiled = compile_pattern(pattern, algorithm)
+
+        one_shot_time = time_callable(lambda: [search(record, pattern) for record in records], iterations)
+        compiled_time = time_callable(lambda: [compiled.search(record) for record in records], iterations)
+
+        results.append(CompiledBenchmarkResult(
+            algorithm=algorithm,
+            record_count=record_count,
+            record_size=record_size,
+            one_shot_time=one_shot_time,
+            compiled_time=compiled_time,
+            iterations=iterations
+        ))
+
+    return results
+
+
+def print_compiled_results(results: List[CompiledBenchmarkResult]):
+    print("\n" + "="*100)
+    print("COMPILED PATTERN vs ONE-SHOT SEARCH")
+    print("="*100)
+    print(f"{'Algorithm':<12} | {'One-shot':<14} | {'Compiled':<14} | {'Speedup':<8}")
+    print("-" * 100)
+
+    for result in results:
+        speedup = result.one_shot_time / result.compiled_time if result.compiled_time > 0 else 0
+        print(f"{result.algorithm:<12} | {result.one_shot_time:>13.6f}s | {result.compiled_time:>13.6f}s | "
+              f"{speedup:>7.2f}x")
+
+    print("="*100)
+
+
+def run_variant_benchmarks(text_sizes: List[int], pattern_size: int, iterations_list: List[int],
+                           alphabets: List[str] = None) -> Dict[str, List[VariantBenchmarkResult]]:
+    """
+    Compare Boyer-Moore variants (Horspool, full BM with good suffix, Sunday) per alphabet.
+    The pattern is drawn from the same alphabet and planted near the end of the text.
+    """
+    if alphabets is None:
+        alphabets = list(ALPHABETS)
+
+    results = {alphabet: [] for alphabet in alphabets}
+
+    for alphabet_name in alphabets:
+        alphabet = ALPHABETS[alphabet_name]
+        pattern = generate_random_string(pattern_size, alphabet)
+        print(f"\nBenchmarking Boyer-Moore variants on '{alphabet_name}' alphabet (pattern '{pattern}')")
+
+        for text_size, iterations in zip(text_sizes, iterations_list):
+            text = generate_test_text(text_size, pattern, True, alphabet)
+            times = {variant: benchmark_algorithm(search, text, pattern, iterations)
+                     for variant, search in BOYER_MOORE_VARIANTS.items()}
+
+            results[alphabet_name].append(VariantBenchmarkResult(
+                text_size=text_size,
+                alphabet=alphabet_name,
+                times=times,
+                iterations=iterations
+            ))
+
+            print(f"  {text_size:>8} chars: " + ", ".join(f"{v}={t:.6f}s" for v, t in times.items()))
+
+    return results
+
+
+def process_variant_data(results: Dict[str, List[VariantBenchmarkResult]]) -> dict:
+    data = {}
+
+    for alphabet, benchmark_list in results.items():
+        data[alphabet] = {
+            'sizes': [str(result.text_size) for result in benchmark_list],
+            'iterations': [result.iterations for result in benchmark_list],
+        }
+        for variant in BOYER_MOORE_VARIANTS:
+            data[alphabet][variant] = [result.times[variant] for result in benchmark_list]
+
+    return data
+
+
+def run_rabin_karp_benchmarks(text_size: int, pattern: str, pattern_count: int,
+                              iterations: int) -> List[RabinKarpBenchmarkResult]:
+    """
+    Measure the cost of hash collisions: modulus 101 vs a 61-bit prime for one pattern,
+    and one pass over a hash set of equal-length patterns vs a pass per pattern.
+    """
+    text = generate_test_text(text_size, pattern, True)
+    patterns = [pattern] + [generate_random_string(len(pattern)) for _ in range(pattern_count - 1)]
+    results = []
+
+    print(f"\nBenchmarking Rabin-Karp hashing over {text_size} characters ({iterations} iterations)")
+
+    def add_result(label, modulus, count, search):
+        elapsed = time_callable(search, iterations)
+        stats = RabinKarpStats()
+        search(stats)
+        results.append(RabinKarpBenchmarkResult(label, modulus, count, elapsed, stats, iterations))
+
+    def modulus_label(modulus):
+        return "2^61-1" if modulus == LARGE_PRIME_MODULUS else str(modulus)
+
+    for modulus in (101, LARGE_PRIME_MODULUS):
+        add_result(f"single, mod {modulus_label(modulus)}", modulus, 1,
+                   lambda stats=None, m=modulus: list(rabin_karp_search_all(text, pattern, modulus=m, stats=stats)))
+
+    for modulus in (101, LARGE_PRIME_MODULUS):
+        add_result(f"{pattern_count} one by one, mod {modulus_label(modulus)}", modulus, pattern_count,
+                   lambda stats=None, m=modulus: [list(rabin_karp_search_all(text, p, modulus=m, stats=stats))
+                                                  for p in patterns])
+        add_result(f"{pattern_count} hash set, mod {modulus_label(modulus)}", modulus, pattern_count,
+                   lambda stats=None, m=modulus: rabin_karp_multi_search(text, patterns, modulus=m, stats=stats))
+
+    return results
+
+
+def run_file_benchmarks(file_sizes: List[int], pattern: str, iterations: int,
+                        algorithms: List[str] = None) -> List[FileBenchmarkResult]:
+    """
+    Compare search_file (mmap, bytes) with reading the file into a Python string first.
+    """
+    if algorithms is None:
+        algorithms = ['boyer_moore', 'kmp']
+    results = []
+
+    for file_size in file_sizes:
+        print(f"\nBenchmarking file search over {file_size} bytes ({iterations} iterations)")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'text.txt')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(generate_test_text(file_size, pattern, True))
+
+            for algorithm in algorithms:
+                compiled = compile_pattern(pattern, algorithm)
+
+                def read_and_search():
+                    with open(path, encoding='utf-8') as text_file:
+                        return compiled.search(text_file.read())
+
+                mmap_time = time_callable(lambda: search_file(path, pattern, algorithm), iterations)
+                read_time = time_callable(read_and_search, iterations)
+
+                results.append(FileBenchmarkResult(file_size, algorithm, mmap_time, read_time, iterations))
+                print(f"    {algorithm}: mmap {mmap_time:.6f}s, read into str {read_time:.6f}s")
+
+    return results
+
+
+def print_file_results(results: List[FileBenchmarkResult]):
+    print("\n" + "="*100)
+    print("FILE SEARCH: MMAP vs READ INTO STRING")
+    print("="*100)
+    print(f"{'File size':<12} | {'Algorithm':<12} | {'mmap':<14} | {'read + search':<14} | {'Ratio':<8}")
+    print("-" * 100)
+
+    for result in results:
+        ratio = result.read_time / result.mmap_time if result.mmap_time > 0 else 0
+        print(f"{result.file_size:<12} | {result.algorithm:<12} | {result.mmap_time:>13.6f}s | "
+              f"{result.read_time:>13.6f}s | {ratio:>7.2f}x")
+
+    print("="*100)
+
+
+def run_parallel_benchmarks(text_size: int, pattern: str, worker_counts: List[int],
+                            iterations: int) -> List[ParallelBenchmarkResult]:
+    """
+    Find-all KMP over the whole text vs parallel_search with a growing process pool.
+    The first-match column plants the pattern early to show the effect of cancellation.
+    """
+    text = generate_test_text(text_size, pattern, False)
+    early_match_text = generate_random_string(text_size // 10) + pattern + text
+    results = []
+
+    print(f"\nBenchmarking parallel KMP over {text_size} characters ({iterations} iterations)")
+    sequential_time = time_callable(lambda: list(kmp_search_all(text, pattern)), iterations)
+    print(f"    sequential: {sequential_time:.6f}s")
+
+    for workers in worker_counts:
+        parallel_time = time_callable(
+            lambda: parallel_search(text, pattern, 'kmp', find_all=True, workers=workers), iterations)
+        first_match_time = time_callable(
+            lambda: parallel_search(early_match_text, pattern, 'kmp', workers=workers), iterations)
+
+        results.append(ParallelBenchmarkResult(text_size, workers, sequential_time, parallel_time,
+                                               first_match_time, iterations))
+        print(f"    {workers} workers: find-all {parallel_time:.6f}s, first match {first_match_time:.6f}s")
+
+    return results
+
+
+def print_parallel_results(results: List[ParallelBenchmarkResult]):
+    print("\n" + "="*100)
+    print(f"PARALLEL SEARCH SCALING ({os.cpu_count()} CPUs available)")
+    print("="*100)
+    print(f"{'Workers':<8} | {'Sequential':<14} | {'Parallel':<14} | {'Speedup':<8} | {'First match':<14}")
+    print("-" * 100)
+
+    for result in results:
+        speedup = result.sequential_time / result.parallel_time if result.parallel_time > 0 else 0
+        print(f"{result.workers:<8} | {result.sequential_time:>13.6f}s | {result.parallel_time:>13.6f}s | "
+              f"{speedup:>7.2f}x | {result.first_match_time:>13.6f}s")
+
+    print("="*100)
+
+
 def print_results(results: Dict[str, List[BenchmarkResult]]):
     print("\n" + "="*100)
     print("BENCHMARK RESULTS")
@@ -115,8 +516,12 @@ def print_results(results: Dict[str, List[BenchmarkResult]]):
 
 
 def analyze_complexity(results: Dict[str, List[BenchmarkResult]]):
+    """
+    Fit O(1) .. O(n^2) models to the time per call of every algorithm.
+    Sizes use different iteration counts, so totals are divided by iterations first.
+    """
     print("\n" + "="*100)
-    print("COMPLEXITY ANALYSIS")
+    print("COMPLEXITY ANALYSIS (least-squares fit of time per call)")
     print("="*100)
 
     for scenario, benchmark_list in results.items():
@@ -126,22 +531,40 @@ def analyze_complexity(results: Dict[str, List[BenchmarkResult]]):
         print(f"\n{'Pattern Exists' if scenario == 'existing' else 'Pattern Does NOT Exist'}")
         print("-" * 100)
 
-        for i in range(1, len(benchmark_list)):
-            prev = benchmark_list[i-1]
-            curr = benchmark_list[i]
+        sizes = [result.text_size for result in benchmark_list]
+        for name, attribute in [('Boyer-Moore', 'boyer_moore_time'), ('KMP', 'kmp_time'),
+                                ('Rabin-Karp', 'rabin_karp_time')]:
+            times = [getattr(result, attribute) / result.iterations for result in benchmark_list]
+            print_fit(name, fit_complexity(sizes, times))
+
+    print("\n" + "="*100)
+
+
+def fit_search_complexity(pattern: str, min_size: int = 1000, max_size: int = 200000,
+                          steps: int = 8) -> Dict[str, ComplexityFit]:
+    """
+    Run every search algorithm over a geometric range of text sizes (pattern placed
+    near the end) and fit complexity models to the median time per call.
+    """
+    sizes = geometric_sizes(min_size, max_size, steps)
+    texts = {size: generate_test_text(size, pattern, True) for size in sizes}
+    algorithms = {
+        'Boyer-Moore': boyer_moore_search,
+        'KMP': kmp_search,
+        'Rabin-Karp': rabin_karp_search,
+    }
 
-            size_ratio = curr.text_size / prev.text_size
+    print(f"\nFitting complexity over sizes {sizes}")
+    fits = {name: measure_complexity(search, lambda size: (texts[size], pattern), sizes, repeats=BENCHMARK_REPEATS)
+            for name, search in algorithms.items()}
 
-            bm_ratio = curr.boyer_moore_time / prev.boyer_moore_time if prev.boyer_moore_time > 0 else 0
-            kmp_ratio = curr.kmp_time / prev.kmp_time if prev.kmp_time > 0 else 0
-            rk_ratio = curr.rabin_karp_time / prev.rabin_karp_time if prev.rabin_karp_time > 0 else 0
+    for name, fit in fits.items():
+        print_fit(name, fit)
+    return fits
 
-            print(f"\nText size: {prev.text_size} → {curr.text_size} ({size_ratio:.2f}x increase)")
-            print(f"  Boyer-Moore time increased: {bm_ratio:.2f}x")
-            print(f"  KMP time increased: {kmp_ratio:.2f}x")
-            print(f"  Rabin-Karp time increased: {rk_ratio:.2f}x")
 
-    print("\n" + "="*100)
+def collect_stats(results: Dict[str, List[BenchmarkResult]]) -> List[BenchmarkStats]:
+    return [stats for benchmark_list in results.values() for result in benchmark_list for stats in result.stats]
 
 
 def process_data(results: Dict[str, List[BenchmarkResult]]) -> dict:
@@ -158,12 +581,13 @@ def process_data(results: Dict[str, List[BenchmarkResult]]) -> dict:
 
         for result in results[scenario]:
             sizes.append(str(result.text_size))
-            bm_times.append(round(result.boyer_moore_time, 6))
-            kmp_times.append(round(result.kmp_time, 6))
-            rk_times.append(round(result.rabin_karp_time, 6))
+            bm_times.append(result.boyer_moore_time)
+            kmp_times.append(result.kmp_time)
+            rk_times.append(result.rabin_karp_time)
 
         data[scenario] = {
             'sizes': sizes,
+            'iterations': [result.iterations for result in results[scenario]],
             'boyer_moore': bm_times,
             'kmp': kmp_times,
             'rabin_karp': rk_times
@@ -0,0 +1,75 @@
+from functools import lru_cache
+
+from .boyer_moore import build_shift_table, boyer_moore_search, boyer_moore_search_all
+from .knuth_morris_pratt import compute_lps, kmp_search, kmp_search_all
+from .rabin_karp import polynomial_hash, rabin_karp_search, rabin_karp_search_all
+
+CACHE_SIZE = 512
+
+# algorithm name -> (preprocessing, first-match search, find-all search);
+# both searches take the preprocessed value as their third argument
+ALGORITHMS = {
+    'boyer_moore': (build_shift_table, boyer_moore_search, boyer_moore_search_all),
+    'kmp': (compute_lps, kmp_search, kmp_search_all),
+    'rabin_karp': (polynomial_hash, rabin_karp_search, rabin_karp_search_all),
+}
+
+
+class CompiledPattern:
+    """
+    A pattern with its algorithm-specific preprocessing done once
+    (shift table, LPS array or pattern hash), ready to be searched in many texts.
+    """
+
+    __slots__ = ('pattern', 'algorithm', '_prepared', '_search', '_search_all')
+
+    def __init__(self, pattern, algorithm: str = 'boyer_moore'):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm {algorithm!r}, expected one of {sorted(ALGORITHMS)}")
+        if not pattern:
+            raise ValueError("Pattern must not be empty")
+
+        prepare, search, search_all = ALGORITHMS[algorithm]
+        self.pattern = pattern
+        self.algorithm = algorithm
+        self._prepared = prepare(pattern)
+        self._search = search
+        self._search_all = search_all
+
+    def search(self, text) -> int:
+        """Return the offset of the first occurrence in text or -1."""
+        return self._search(text, self.pattern, self._prepared)
+
+    def search_all(self, text):
+        """Yield the offset of every occurrence in text."""
+        return self._search_all(text, self.pattern, self._prepared)
+
+    def __repr__(self):
+        return f"CompiledPattern({self.pattern!r}, algorithm={self.algorithm!r})"
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compile_cached(pattern, algorithm: str) -> CompiledPattern:
+    return CompiledPattern(pattern, algorithm)
+
+
+def compile(pattern, algorithm: str = 'boyer_moore') -> CompiledPattern:
+    """
+    Return a reusable matcher for pattern, like `re.compile`.
+
+    Compiled patterns are kept in an LRU cache of CACHE_SIZE entries, so calling
+    compile() again with the same pattern and algorithm is a dictionary lookup.
+    A bytearray or memoryview pattern is unhashable, so it is cached as bytes.
+    """
+    if isinstance(pattern, (bytearray, memoryview)):
+        pattern = bytes(pattern)
+    return _compile_cached(pattern, algorithm)
+
+
+def purge():
+    """Clear the compiled pattern cache."""
+    _compile_cached.cache_clear()
+
+
+def cache_info():
+    return _compile_cached.cache_info()
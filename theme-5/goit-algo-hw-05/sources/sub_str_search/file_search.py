@@ -0,0 +1,34 @@
+import mmap
+import os
+
+from .compiled_pattern import compile as compile_pattern
+
+
+def to_bytes_pattern(pattern, encoding: str = 'utf-8') -> bytes:
+    if isinstance(pattern, str):
+        return pattern.encode(encoding)
+    return bytes(pattern)
+
+
+def search_file(path, pattern, algorithm: str = 'boyer_moore', find_all: bool = False, encoding: str = 'utf-8',
+                start: int = 0, end: int = None):
+    """
+    Memory-map the file at path and search it in place, without reading it into a string.
+
+    A str pattern is encoded with `encoding` first, so returned offsets are byte
+    offsets into the file. Returns the first offset (or -1), or a list of every
+    offset when find_all is True. `start`/`end` restrict the search to a byte range.
+    """
+    matcher = compile_pattern(to_bytes_pattern(pattern, encoding), algorithm)
+
+    if os.path.getsize(path) == 0:
+        # an empty file cannot be memory-mapped
+        return [] if find_all else -1
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        # memoryview indexes and iterates as ints like bytes, and slices without copying
+        with memoryview(mapped) as view, view[start:end] as window:
+            if find_all:
+                return [start + offset for offset in matcher.search_all(window)]
+            offset = matcher.search(window)
+            return start + offset if offset != -1 else -1
@@ -17,11 +17,12 @@ def compute_lps(pattern):
 
     return lps
 
-def kmp_search(main_string, pattern):
+def kmp_search(main_string, pattern, lps=None):
     M = len(pattern)
     N = len(main_string)
 
-    lps = compute_lps(pattern)
+    if lps is None:
+        lps = compute_lps(pattern)
 
     i = j = 0
 
@@ -38,3 +39,27 @@ def kmp_search(main_string, pattern):
             return i - j
 
     return -1  # якщо підрядок не знайдено
+
+
+def kmp_search_all(main_string, pattern, lps=None):
+    """Yield the offset of every (possibly overlapping) occurrence of pattern."""
+    M = len(pattern)
+    N = len(main_string)
+
+    if lps is None:
+        lps = compute_lps(pattern)
+
+    i = j = 0
+
+    while i < N:
+        if pattern[j] == main_string[i]:
+            i += 1
+            j += 1
+        elif j != 0:
+            j = lps[j - 1]
+        else:
+            i += 1
+
+        if j == M:
+            yield i - j
+            j = lps[j - 1]
@@ -0,0 +1,86 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+
+from .compiled_pattern import compile as compile_pattern
+from .file_search import search_file, to_bytes_pattern
+
+
+def split_ranges(text_length: int, pattern_length: int, chunk_count: int) -> List[Tuple[int, int]]:
+    """
+    Split [0, text_length) into chunk_count ranges, each extended by pattern_length - 1
+    characters so that a match crossing a boundary is found by exactly one chunk.
+    """
+    chunk_size = max(-(-text_length // chunk_count), 1)
+    ranges = []
+    for start in range(0, text_length, chunk_size):
+        end = min(start + chunk_size + pattern_length - 1, text_length)
+        if end - start >= pattern_length:
+            ranges.append((start, end))
+    return ranges
+
+
+def search_text_chunk(chunk, start: int, pattern, algorithm: str, find_all: bool):
+    matcher = compile_pattern(pattern, algorithm)
+    if find_all:
+        return [start + offset for offset in matcher.search_all(chunk)]
+    offset = matcher.search(chunk)
+    return start + offset if offset != -1 else -1
+
+
+def collect_results(futures, find_all: bool):
+    """Merge chunk results in text order; on the first match cancel chunks that did not start yet."""
+    if find_all:
+        return [offset for future in futures for offset in future.result()]
+
+    for future in futures:
+        offset = future.result()
+        if offset != -1:
+            for pending in futures:
+                pending.cancel()
+            return offset
+    return -1
+
+
+def _picklable(chunk):
+    """Chunks are pickled to the workers; a memoryview slice is sent as bytes."""
+    return bytes(chunk) if isinstance(chunk, memoryview) else chunk
+
+
+def parallel_search(text, pattern, algorithm: str = 'kmp', find_all: bool = False,
+                    workers: int = None, chunk_count: int = None):
+    """
+    Search text in overlapping chunks spread over a process pool.
+
+    Returns the first offset (or -1), or a sorted list of every offset when find_all
+    is True. chunk_count defaults to 4 chunks per worker, so that a first match
+    found early lets the remaining chunks be cancelled before they start.
+    """
+    if isinstance(pattern, (bytearray, memoryview)):
+        pattern = bytes(pattern)  # hashable for the compile cache; a memoryview cannot be pickled
+    workers = workers or os.cpu_count() or 1
+    chunk_count = chunk_count or workers * 4
+    ranges = split_ranges(len(text), len(pattern), chunk_count)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(search_text_chunk, _picklable(text[start:end]), start, pattern, algorithm,
+                                   find_all)
+                   for start, end in ranges]
+        return collect_results(futures, find_all)
+
+
+def parallel_search_file(path, pattern, algorithm: str = 'kmp', find_all: bool = False,
+                         workers: int = None, chunk_count: int = None, encoding: str = 'utf-8'):
+    """
+    Like parallel_search, but every worker memory-maps its own byte range of the file,
+    so no text is sent between processes. Offsets are byte offsets.
+    """
+    pattern = to_bytes_pattern(pattern, encoding)
+    workers = workers or os.cpu_count() or 1
+    chunk_count = chunk_count or workers * 4
+    ranges = split_ranges(os.path.getsize(path), len(pattern), chunk_count)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(search_file, path, pattern, algorithm, find_all, encoding, start, end)
+                   for start, end in ranges]
+        return collect_results(futures, find_all)
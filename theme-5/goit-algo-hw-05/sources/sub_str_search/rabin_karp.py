@@ -1,41 +1,174 @@
+from dataclasses import dataclass
+
+# Просте число Мерсенна 2^61 - 1: колізії хешів стають практично неможливими
+LARGE_PRIME_MODULUS = (1 << 61) - 1
+
+
+@dataclass
+class RabinKarpStats:
+    """
+    Лічильники пошуку: скільки вікон переглянуто, у скількох хеш збігся
+    і скільки з них виявилися справжніми входженнями.
+    """
+    windows: int = 0
+    hash_hits: int = 0
+    matches: int = 0
+
+    def record(self, windows, hash_hits, matches):
+        self.windows += windows
+        self.hash_hits += hash_hits
+        self.matches += matches
+
+    @property
+    def false_positives(self):
+        return self.hash_hits - self.matches
+
+    @property
+    def collision_rate(self):
+        """Частка вікон, для яких збіг хешів змусив даремно порівнювати зрізи."""
+        return self.false_positives / self.windows if self.windows else 0.0
+
+
+def char_code(s):
+    """
+    Функція, що перетворює елемент s на число: ord для str,
+    а елементи bytes/bytearray/memoryview вже є числами.
+    """
+    return ord if isinstance(s, str) else int
+
+
 def polynomial_hash(s, base=256, modulus=101):
     """
-    Повертає поліноміальний хеш рядка s.
+    Повертає поліноміальний хеш рядка s (str або bytes-подібного об'єкта).
     """
+    code = char_code(s)
     n = len(s)
     hash_value = 0
     for i, char in enumerate(s):
-        power_of_base = pow(base, n - i - 1) % modulus
-        hash_value = (hash_value + ord(char) * power_of_base) % modulus
+        power_of_base = pow(base, n - i - 1, modulus)
+        hash_value = (hash_value + code(char) * power_of_base) % modulus
     return hash_value
 
 
-def rabin_karp_search(main_string, substring):
+def rabin_karp_search(main_string, substring, substring_hash=None, modulus=101, stats=None):
     # Довжини основного рядка та підрядка пошуку
     substring_length = len(substring)
     main_string_length = len(main_string)
 
-    # Базове число для хешування та модуль
+    # Базове число для хешування (модуль можна передати, напр. LARGE_PRIME_MODULUS)
     base = 256
-    modulus = 101
 
-    # Хеш-значення для підрядка пошуку та поточного відрізка в основному рядку
-    substring_hash = polynomial_hash(substring, base, modulus)
+    # Хеш-значення для підрядка пошуку (якщо не передано готовим) та поточного відрізка в основному рядку
+    if substring_hash is None:
+        substring_hash = polynomial_hash(substring, base, modulus)
     current_slice_hash = polynomial_hash(main_string[:substring_length], base, modulus)
+    code = char_code(main_string)
 
     # Попереднє значення для перерахунку хешу
-    h_multiplier = pow(base, substring_length - 1) % modulus
+    h_multiplier = pow(base, substring_length - 1, modulus)
+    hash_hits = 0
 
     # Проходимо крізь основний рядок
     for i in range(main_string_length - substring_length + 1):
         if substring_hash == current_slice_hash:
+            hash_hits += 1
             if main_string[i:i + substring_length] == substring:
+                if stats is not None:
+                    stats.record(i + 1, hash_hits, 1)
                 return i
 
         if i < main_string_length - substring_length:
-            current_slice_hash = (current_slice_hash - ord(main_string[i]) * h_multiplier) % modulus
-            current_slice_hash = (current_slice_hash * base + ord(main_string[i + substring_length])) % modulus
+            current_slice_hash = (current_slice_hash - code(main_string[i]) * h_multiplier) % modulus
+            current_slice_hash = (current_slice_hash * base + code(main_string[i + substring_length])) % modulus
             if current_slice_hash < 0:
                 current_slice_hash += modulus
 
+    if stats is not None:
+        stats.record(max(main_string_length - substring_length + 1, 0), hash_hits, 0)
     return -1
+
+
+def rabin_karp_search_all(main_string, substring, substring_hash=None, modulus=101, stats=None):
+    """
+    Генератор, що повертає позиції всіх входжень підрядка в основному рядку.
+    stats записуються і тоді, коли генератор закрили раніше (break, close()):
+    враховуються лише вже переглянуті вікна.
+    """
+    substring_length = len(substring)
+    main_string_length = len(main_string)
+
+    base = 256
+
+    if substring_hash is None:
+        substring_hash = polynomial_hash(substring, base, modulus)
+    current_slice_hash = polynomial_hash(main_string[:substring_length], base, modulus)
+    code = char_code(main_string)
+
+    h_multiplier = pow(base, substring_length - 1, modulus)
+    hash_hits = matches = 0
+    i = -1
+
+    try:
+        for i in range(main_string_length - substring_length + 1):
+            if substring_hash == current_slice_hash:
+                hash_hits += 1
+                if main_string[i:i + substring_length] == substring:
+                    matches += 1
+                    yield i
+
+            if i < main_string_length - substring_length:
+                current_slice_hash = (current_slice_hash - code(main_string[i]) * h_multiplier) % modulus
+                current_slice_hash = (current_slice_hash * base + code(main_string[i + substring_length])) % modulus
+                if current_slice_hash < 0:
+                    current_slice_hash += modulus
+    finally:
+        # i + 1 вікон переглянуто, незалежно від того, чи дійшов цикл до кінця
+        if stats is not None:
+            stats.record(i + 1, hash_hits, matches)
+
+
+def rabin_karp_multi_search(main_string, patterns, modulus=LARGE_PRIME_MODULUS, stats=None):
+    """
+    Шукає одразу набір підрядків однакової довжини: хеш кожного вікна
+    перевіряється в одній хеш-таблиці замість окремого проходу на кожен підрядок.
+    Повертає список пар (підрядок, позиція) у порядку позицій.
+    """
+    unique_patterns = list(dict.fromkeys(patterns))
+    if not unique_patterns:
+        return []
+
+    pattern_length = len(unique_patterns[0])
+    if pattern_length == 0 or any(len(pattern) != pattern_length for pattern in unique_patterns):
+        raise ValueError("All patterns must be non-empty and of equal length")
+
+    main_string_length = len(main_string)
+    base = 256
+
+    # Хеш -> підрядки з таким хешем (колізії між самими підрядками теж можливі)
+    pattern_hashes = {}
+    for pattern in unique_patterns:
+        pattern_hashes.setdefault(polynomial_hash(pattern, base, modulus), []).append(pattern)
+
+    current_slice_hash = polynomial_hash(main_string[:pattern_length], base, modulus)
+    code = char_code(main_string)
+    h_multiplier = pow(base, pattern_length - 1, modulus)
+    hash_hits = 0
+    found = []
+
+    for i in range(main_string_length - pattern_length + 1):
+        candidates = pattern_hashes.get(current_slice_hash)
+        if candidates is not None:
+            hash_hits += 1
+            window = main_string[i:i + pattern_length]
+            for pattern in candidates:
+                if window == pattern:
+                    found.append((pattern, i))
+                    break
+
+        if i < main_string_length - pattern_length:
+            current_slice_hash = (current_slice_hash - code(main_string[i]) * h_multiplier) % modulus
+            current_slice_hash = (current_slice_hash * base + code(main_string[i + pattern_length])) % modulus
+
+    if stats is not None:
+        stats.record(max(main_string_length - pattern_length + 1, 0), hash_hits, len(found))
+    return found
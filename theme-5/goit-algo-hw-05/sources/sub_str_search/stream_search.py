@@ -0,0 +1,95 @@
+from typing import Iterable, Iterator
+
+from .boyer_moore import build_shift_table, boyer_moore_search_all
+from .knuth_morris_pratt import compute_lps
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def read_chunks(source, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator:
+    """
+    Turn a file object (anything with `read`) or an iterable of chunks into a chunk iterator.
+    """
+    if hasattr(source, 'read'):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    else:
+        for chunk in source:
+            if chunk:
+                yield chunk
+
+
+def kmp_search_stream(chunks: Iterable, pattern) -> Iterator[int]:
+    """
+    Yield absolute offsets of every occurrence of pattern in a stream of chunks.
+
+    The only state carried between chunks is the length of the currently
+    matched prefix, so memory usage does not depend on the stream size.
+    """
+    if not pattern:
+        raise ValueError("Pattern must not be empty")
+
+    M = len(pattern)
+    lps = compute_lps(pattern)
+    j = 0
+    offset = 0
+
+    for chunk in chunks:
+        for i, char in enumerate(chunk):
+            while j and char != pattern[j]:
+                j = lps[j - 1]
+            if char == pattern[j]:
+                j += 1
+            if j == M:
+                yield offset + i - M + 1
+                j = lps[j - 1]
+        offset += len(chunk)
+
+
+def boyer_moore_search_stream(chunks: Iterable, pattern) -> Iterator[int]:
+    """
+    Yield absolute offsets of every occurrence of pattern in a stream of chunks.
+
+    The last len(pattern) - 1 characters of each window are prepended to the
+    next chunk, so matches that straddle a chunk boundary are found exactly once.
+    """
+    if not pattern:
+        raise ValueError("Pattern must not be empty")
+
+    M = len(pattern)
+    shift_table = build_shift_table(pattern)
+    tail = None
+    offset = 0  # absolute offset of the first character of the next chunk
+
+    for chunk in chunks:
+        window = chunk if tail is None else tail + chunk
+        window_start = offset - (len(window) - len(chunk))
+
+        for position in boyer_moore_search_all(window, pattern, shift_table):
+            yield window_start + position
+
+        offset += len(chunk)
+        tail = window[max(len(window) - (M - 1), 0):]
+
+
+STREAM_ALGORITHMS = {
+    'kmp': kmp_search_stream,
+    'boyer_moore': boyer_moore_search_stream,
+}
+
+
+def search_stream(source, pattern, algorithm: str = 'kmp', chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[int]:
+    """
+    Search a file object or an iterable of chunks (str or bytes) without loading it whole.
+
+    Example:
+        with open('huge.log', encoding='utf-8') as f:
+            count = sum(1 for _ in search_stream(f, 'ERROR'))
+    """
+    if algorithm not in STREAM_ALGORITHMS:
+        raise ValueError(f"Unknown algorithm {algorithm!r}, expected one of {sorted(STREAM_ALGORITHMS)}")
+
+    return STREAM_ALGORITHMS[algorithm](read_chunks(source, chunk_size), pattern)
@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from sources.sub_str_search.aho_corasick import build_automaton, aho_corasick_search
+
+
+def naive_find_all(text, patterns):
+    matches = []
+    for pattern in dict.fromkeys(patterns):
+        start = text.find(pattern)
+        while start != -1:
+            matches.append((pattern, start))
+            start = text.find(pattern, start + 1)
+    return sorted(matches, key=lambda m: (m[1] + len(m[0]), m))
+
+
+class TestAhoCorasick:
+    def test_classic_example(self):
+        result = aho_corasick_search("ushers", ["he", "she", "his", "hers"])
+        assert sorted(result) == [("he", 2), ("hers", 2), ("she", 1)]
+
+    def test_no_matches(self):
+        assert aho_corasick_search("abcdef", ["xyz", "qq"]) == []
+
+    def test_empty_text(self):
+        assert aho_corasick_search("", ["a"]) == []
+
+    def test_overlapping_matches(self):
+        result = aho_corasick_search("aaaa", ["a", "aa"])
+        assert sorted(result) == sorted([("a", 0), ("a", 1), ("a", 2), ("a", 3),
+                                         ("aa", 0), ("aa", 1), ("aa", 2)])
+
+    def test_duplicate_patterns_reported_once(self):
+        assert aho_corasick_search("abab", ["ab", "ab"]) == [("ab", 0), ("ab", 2)]
+
+    def test_empty_pattern_raises(self):
+        with pytest.raises(ValueError):
+            build_automaton(["a", ""])
+
+    def test_reuse_automaton(self):
+        automaton = build_automaton(["cat", "at"])
+        assert sorted(aho_corasick_search("a cat", automaton)) == [("at", 3), ("cat", 2)]
+        assert aho_corasick_search("dog", automaton) == []
+
+    def test_matches_naive_search(self):
+        rng = random.Random(7)
+        text = ''.join(rng.choices("abc", k=2000))
+        patterns = [''.join(rng.choices("abc", k=rng.randint(1, 6))) for _ in range(50)]
+        result = aho_corasick_search(text, patterns)
+        assert sorted(result) == sorted(naive_find_all(text, patterns))
@@ -0,0 +1,55 @@
+import pytest
+
+from sources.benchmark_runner import (
+    BenchmarkStats,
+    compare_with_baseline,
+    load_results,
+    run_benchmark,
+    save_results,
+)
+
+
+def make_stats(name, median, spread=0.01):
+    return BenchmarkStats(name=name, number=10, repeats=5, median=median,
+                          q1=median - spread, q3=median + spread, min=median - 2 * spread, max=median + 2 * spread)
+
+
+class TestRunBenchmark:
+    def test_calibrates_number_of_calls(self):
+        stats = run_benchmark(lambda: sum(range(100)), name="sum", repeats=3, min_time=0.001)
+        assert stats.name == "sum"
+        assert stats.number > 1
+        assert stats.min <= stats.q1 <= stats.median <= stats.q3 <= stats.max
+
+    def test_fixed_number_of_calls(self):
+        calls = []
+        stats = run_benchmark(lambda: calls.append(1), repeats=3, warmup=2, number=4)
+        assert stats.number == 4
+        assert len(calls) == (2 + 3) * 4
+
+    def test_single_repeat_raises(self):
+        with pytest.raises(ValueError):
+            run_benchmark(lambda: None, repeats=1)
+
+
+class TestBaseline:
+    @pytest.mark.parametrize("file_name", ["results.json", "results.csv"])
+    def test_save_and_load(self, tmp_path, file_name):
+        results = [make_stats("a", 1.0), make_stats("b", 0.5)]
+        save_results(results, tmp_path / file_name)
+        loaded = load_results(tmp_path / file_name)
+        assert loaded == {"a": results[0], "b": results[1]}
+
+    def test_regression_flagged_only_outside_noise(self):
+        baseline = {"slow": make_stats("slow", 1.0), "noisy": make_stats("noisy", 1.0, spread=0.5),
+                    "same": make_stats("same", 1.0)}
+        current = [make_stats("slow", 1.5), make_stats("noisy", 1.5, spread=0.5), make_stats("same", 1.01),
+                   make_stats("new", 1.0)]
+
+        comparisons = {c.name: c for c in compare_with_baseline(current, baseline)}
+
+        assert set(comparisons) == {"slow", "noisy", "same"}
+        assert comparisons["slow"].regression
+        assert not comparisons["noisy"].regression
+        assert not comparisons["same"].regression
+        assert comparisons["slow"].change == pytest.approx(0.5)
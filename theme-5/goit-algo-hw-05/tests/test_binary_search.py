@@ -0,0 +1,133 @@
+import bisect
+import random
+
+import pytest
+
+from sources.binary_search import SEARCH_MODES, binary_search, binary_search_batch
+from sources.compare_binary_search import (
+    print_batch_search_results,
+    print_index_results,
+    print_search_mode_results,
+    run_batch_search_benchmarks,
+    run_index_benchmarks,
+    run_search_mode_benchmarks,
+)
+from sources.eytzinger_index import EytzingerIndex
+
+ARRAY = [1.1, 2.3, 3.5, 4.7, 5.9, 6.0, 7.2]
+
+
+class TestSearchModes:
+    @pytest.mark.parametrize("mode", sorted(SEARCH_MODES))
+    @pytest.mark.parametrize("arr", [
+        [],
+        [5.0],
+        ARRAY,
+        [0, 0, 1, 1, 1, 2, 2],
+        [float(i) for i in range(999)] + [1e18],
+        sorted(random.Random(3).expovariate(1) ** 4 for _ in range(500)),
+    ])
+    def test_same_upper_bound_as_binary(self, mode, arr):
+        targets = [-1, 0, 0.5, 1, 2, 3, 7.2, 10, 600.5, 1e18, 2e18] + arr
+        for target in targets:
+            index = bisect.bisect_left(arr, target)
+            assert binary_search(arr, target, mode)[1] == (arr[index] if index < len(arr) else None)
+
+    def test_interpolation_takes_few_probes_on_uniform_data(self):
+        arr = [i * 3.0 for i in range(100000)]
+        assert binary_search(arr, 12345.0, 'interpolation')[0] <= 4
+        assert binary_search(arr, 12345.0)[0] == 17
+
+    def test_interpolation_falls_back_on_adversarial_data(self):
+        arr = [float(i) for i in range(100000)] + [1e18]
+        iterations, upper_bound = binary_search(arr, 99998.5, 'interpolation')
+        assert upper_bound == 99999.0
+        assert iterations < 25
+
+    def test_exponential_is_fast_near_the_front(self):
+        arr = list(range(100000))
+        assert binary_search(arr, 3, 'exponential') == (5, 3)
+        assert binary_search(arr, 3)[0] == 16
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError, match="Unknown mode"):
+            binary_search(ARRAY, 1, 'ternary')
+
+    def test_benchmark(self, capsys):
+        results = run_search_mode_benchmarks(1000, query_count=50, repeats=2)
+
+        assert [result.distribution for result in results] == ['uniform', 'skewed', 'adversarial']
+        print_search_mode_results(results)
+        assert "interpolation" in capsys.readouterr().out
+
+
+class TestBinarySearchBatch:
+    def test_matches_scalar_binary_search(self):
+        queries = [0, 1.1, 3, 4.7, 6.5, 7.2, 8]
+        upper_bounds, indices = binary_search_batch(ARRAY, queries)
+
+        assert upper_bounds == [binary_search(ARRAY, query)[1] for query in queries]
+        assert indices == [0, 0, 2, 3, 6, 6, 7]
+
+    @pytest.mark.parametrize("batch_size", [5, 500])
+    def test_sorted_queries(self, batch_size):
+        rng = random.Random(batch_size)
+        arr = sorted(rng.randrange(1000) for _ in range(1000))
+        queries = sorted(rng.randrange(-10, 1010) for _ in range(batch_size))
+
+        assert binary_search_batch(arr, queries, queries_sorted=True) == binary_search_batch(arr, queries)
+
+    def test_empty_inputs(self):
+        assert binary_search_batch([], [1, 2]) == ([None, None], [0, 0])
+        assert binary_search_batch(ARRAY, []) == ([], [])
+
+    def test_numpy_arrays(self):
+        np = pytest.importorskip("numpy")
+        upper_bounds, indices = binary_search_batch(np.array(ARRAY), np.array([0, 3, 8]))
+
+        assert indices.tolist() == [0, 2, 7]
+        assert upper_bounds[:2].tolist() == [1.1, 3.5]
+        assert np.isnan(upper_bounds[2])
+
+    def test_benchmark(self, capsys):
+        results = run_batch_search_benchmarks(1000, [10, 100], repeats=2)
+
+        assert [result.batch_size for result in results] == [10, 100]
+        print_batch_search_results(results)
+        assert "scalar loop" in capsys.readouterr().out
+
+
+class TestEytzingerIndex:
+    @pytest.mark.parametrize("size", [0, 1, 2, 7, 8, 100])
+    @pytest.mark.parametrize("kind", [int, float, str])
+    def test_matches_bisect(self, size, kind):
+        rng = random.Random(size)
+        arr = sorted(kind(rng.randrange(50)) for _ in range(size))
+        index = EytzingerIndex(arr)
+
+        for target in map(kind, range(-1, 52)):
+            lower, upper = bisect.bisect_left(arr, target), bisect.bisect_right(arr, target)
+            assert index.lower_bound_index(target) == lower
+            assert index.upper_bound_index(target) == upper
+            assert index.lower_bound(target)[1] == (arr[lower] if lower < size else None)
+            assert index.upper_bound(target)[1] == (arr[upper] if upper < size else None)
+
+    def test_same_contract_as_binary_search(self):
+        index = EytzingerIndex(ARRAY)
+
+        for target in [0, 3.5, 4, 7.2, 8]:
+            iterations, upper_bound = index.lower_bound(target)
+            assert upper_bound == binary_search(ARRAY, target)[1]
+            assert iterations == 3
+
+    def test_numbers_are_stored_unboxed(self):
+        assert EytzingerIndex([1.0, 2.5]).tree.typecode == 'd'
+        assert EytzingerIndex([1, 2]).tree.typecode == 'q'
+        assert isinstance(EytzingerIndex([1, 2 ** 70]).tree, list)
+
+    def test_benchmark(self, capsys):
+        results = run_index_benchmarks([100], query_count=50, repeats=2)
+
+        assert set(results[0].times) == {'binary_search', 'binary_search (array)', 'eytzinger', 'bisect'}
+        print_index_results(results)
+        assert "EYTZINGER" in capsys.readouterr().out
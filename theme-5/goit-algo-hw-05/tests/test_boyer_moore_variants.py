@@ -0,0 +1,41 @@
+import random
+
+import pytest
+
+from sources.sub_str_search.boyer_moore import (
+    BOYER_MOORE_VARIANTS,
+    boyer_moore_variant_search,
+    build_good_suffix_table,
+)
+
+
+class TestBoyerMooreVariants:
+    @pytest.mark.parametrize("variant", BOYER_MOORE_VARIANTS)
+    @pytest.mark.parametrize("text,pattern,expected", [
+        ("HERE IS A SIMPLE EXAMPLE", "EXAMPLE", 17),
+        ("GCATCGCAGAGAGTATACAGTACG", "GCAGAGAG", 5),
+        ("aaaaaaaab", "aab", 6),
+        ("abc", "abcd", -1),
+        ("abc", "c", 2),
+        ("", "a", -1),
+    ])
+    def test_examples(self, variant, text, pattern, expected):
+        assert boyer_moore_variant_search(text, pattern, variant) == expected
+
+    @pytest.mark.parametrize("variant", BOYER_MOORE_VARIANTS)
+    @pytest.mark.parametrize("alphabet", ["01", "ACGT"])
+    def test_matches_str_find_on_low_entropy_text(self, variant, alphabet):
+        rng = random.Random(11)
+        for _ in range(300):
+            text = ''.join(rng.choices(alphabet, k=rng.randint(0, 200)))
+            pattern = ''.join(rng.choices(alphabet, k=rng.randint(1, 10)))
+            assert boyer_moore_variant_search(text, pattern, variant) == text.find(pattern)
+
+    def test_good_suffix_table(self):
+        # shift after a full match of "abab" is its period
+        assert build_good_suffix_table("abab")[0] == 2
+        assert len(build_good_suffix_table("abcde")) == 6
+
+    def test_unknown_variant_raises(self):
+        with pytest.raises(ValueError):
+            boyer_moore_variant_search("abc", "a", "unknown")
@@ -0,0 +1,48 @@
+import pytest
+
+from sources.sub_str_search import compiled_pattern
+from sources.sub_str_search.compiled_pattern import compile, CompiledPattern
+from sources.sub_str_search.boyer_moore import boyer_moore_search
+from sources.sub_str_search.knuth_morris_pratt import kmp_search
+from sources.sub_str_search.rabin_karp import rabin_karp_search
+
+ONE_SHOT = {
+    'boyer_moore': boyer_moore_search,
+    'kmp': kmp_search,
+    'rabin_karp': rabin_karp_search,
+}
+
+
+class TestCompiledPattern:
+    @pytest.mark.parametrize("algorithm", ONE_SHOT)
+    @pytest.mark.parametrize("text", ["", "algo", "an algorithm", "no match here", "algorithmalgorithm"])
+    def test_same_result_as_one_shot(self, algorithm, text):
+        matcher = compile("algorithm", algorithm)
+        assert matcher.search(text) == ONE_SHOT[algorithm](text, "algorithm")
+
+    @pytest.mark.parametrize("algorithm", ONE_SHOT)
+    def test_search_all(self, algorithm):
+        assert list(compile("aba", algorithm).search_all("ababa xaba")) == [0, 2, 7]
+
+    def test_compile_is_cached(self):
+        compiled_pattern.purge()
+        first = compile("needle", "kmp")
+        assert compile("needle", "kmp") is first
+        assert compile("needle", "boyer_moore") is not first
+        assert compiled_pattern.cache_info().hits == 1
+
+    @pytest.mark.parametrize("algorithm", ONE_SHOT)
+    @pytest.mark.parametrize("pattern", [bytearray(b"aba"), memoryview(b"aba")])
+    def test_bytes_like_pattern(self, algorithm, pattern):
+        matcher = compile(pattern, algorithm)
+        assert matcher.pattern == b"aba"
+        assert list(matcher.search_all(b"ababa xaba")) == [0, 2, 7]
+        assert compile(b"aba", algorithm) is matcher
+
+    def test_unknown_algorithm_raises(self):
+        with pytest.raises(ValueError):
+            CompiledPattern("abc", "unknown")
+
+    def test_empty_pattern_raises(self):
+        with pytest.raises(ValueError):
+            CompiledPattern("", "kmp")
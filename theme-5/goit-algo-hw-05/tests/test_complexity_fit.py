@@ -0,0 +1,44 @@
+import math
+import random
+
+import pytest
+
+from sources.complexity_fit import fit_complexity, geometric_sizes
+
+SIZES = geometric_sizes(100, 100000, 10)
+
+
+def noisy(values, seed=0, noise=0.05):
+    rng = random.Random(seed)
+    return [v * (1 + rng.uniform(-noise, noise)) for v in values]
+
+
+class TestFitComplexity:
+    @pytest.mark.parametrize("model,f", [
+        ("O(1)", lambda n: 5.0),
+        ("O(log n)", lambda n: 3 * math.log2(n)),
+        ("O(n)", lambda n: 2 * n),
+        ("O(n log n)", lambda n: n * math.log2(n)),
+        ("O(n^2)", lambda n: 0.5 * n * n),
+    ])
+    def test_recovers_model_from_noisy_times(self, model, f):
+        fit = fit_complexity(SIZES, noisy([f(n) for n in SIZES]))
+        assert fit.best.model == model
+        assert fit.confidence > 0.9
+
+    def test_coefficient_and_prediction(self):
+        fit = fit_complexity(SIZES, [3e-6 * n for n in SIZES])
+        assert fit.best.coefficient == pytest.approx(3e-6)
+        assert fit.predict(1000) == pytest.approx(3e-3)
+
+    def test_confidence_is_low_for_two_close_points(self):
+        fit = fit_complexity([1000, 1100], [1.0, 1.107])
+        assert fit.confidence < 0.9
+
+    def test_needs_two_points(self):
+        with pytest.raises(ValueError):
+            fit_complexity([1000], [1.0])
+
+
+def test_geometric_sizes():
+    assert geometric_sizes(10, 1000, 3) == [10, 100, 1000]
@@ -0,0 +1,47 @@
+import pytest
+
+from sources.sub_str_search.boyer_moore import boyer_moore_search, boyer_moore_variant_search
+from sources.sub_str_search.knuth_morris_pratt import kmp_search
+from sources.sub_str_search.rabin_karp import rabin_karp_search, rabin_karp_multi_search
+from sources.sub_str_search.file_search import search_file
+
+ALGORITHMS = ['boyer_moore', 'kmp', 'rabin_karp']
+
+
+class TestBytesSearch:
+    @pytest.mark.parametrize("search", [boyer_moore_search, kmp_search, rabin_karp_search])
+    @pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+    def test_bytes_like_text(self, search, wrap):
+        text = wrap(b"\x00\x01binary \xff log \xffneedle\x00")
+        assert search(text, b"\xffneedle") == 15
+        assert search(text, b"missing") == -1
+
+    @pytest.mark.parametrize("variant", ["horspool", "full", "sunday"])
+    def test_boyer_moore_variants_on_memoryview(self, variant):
+        assert boyer_moore_variant_search(memoryview(b"abcabcd"), b"abcd", variant) == 3
+
+    def test_multi_search_on_bytes(self):
+        assert rabin_karp_multi_search(b"GATTACA", [b"TTA", b"ACA"]) == [(b"TTA", 2), (b"ACA", 4)]
+
+
+class TestSearchFile:
+    @pytest.mark.parametrize("algorithm", ALGORITHMS)
+    def test_utf8_file(self, tmp_path, algorithm):
+        path = tmp_path / "log.txt"
+        path.write_text("привіт ERROR world ERROR", encoding="utf-8")
+        # offsets are in bytes: each Cyrillic letter takes two
+        assert search_file(path, "ERROR", algorithm) == 13
+        assert search_file(path, "ERROR", algorithm, find_all=True) == [13, 25]
+        assert search_file(path, "світ", algorithm) == -1
+
+    @pytest.mark.parametrize("algorithm", ALGORITHMS)
+    def test_binary_file(self, tmp_path, algorithm):
+        path = tmp_path / "data.bin"
+        path.write_bytes(bytes(range(256)) * 4)
+        assert search_file(path, bytes([254, 255, 0]), algorithm, find_all=True) == [254, 510, 766]
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        assert search_file(path, "a") == -1
+        assert search_file(path, "a", find_all=True) == []
@@ -0,0 +1,240 @@
+import random
+import struct
+
+import pytest
+
+from sources import hash_table
+
+from sources.compare_hash_tables import (
+    print_bulk_load_results,
+    print_hash_table_results,
+    run_bulk_load_benchmarks,
+    run_hash_table_benchmarks,
+)
+from sources.hash_table import HashTable, OpenAddressingHashTable
+
+
+class TestOpenAddressingHashTable:
+    def test_insert_get_delete(self):
+        table = OpenAddressingHashTable()
+        table.insert("apple", 10)
+        table.insert("orange", 20)
+        table.insert("apple", 15)
+
+        assert len(table) == 2
+        assert table.get("apple") == 15
+        assert table.get("banana") is None
+        assert table.delete("apple") is True
+        assert table.delete("apple") is False
+        assert "apple" not in table
+        assert "orange" in table
+
+    def test_none_is_a_valid_key(self):
+        table = OpenAddressingHashTable()
+        table.insert(None, "none")
+        assert table.get(None) == "none"
+        assert None in table
+
+    def test_resizes_at_load_factor(self):
+        table = OpenAddressingHashTable(max_load_factor=0.5)
+        for i in range(1000):
+            table.insert(i, i)
+            assert table.load_factor <= 0.5
+
+        assert table.capacity == 2048
+        assert all(table.get(i) == i for i in range(1000))
+
+    def test_presized_table_does_not_resize(self):
+        table = OpenAddressingHashTable(1000)
+        capacity = table.capacity
+        for i in range(1000):
+            table.insert(i, i)
+        assert table.capacity == capacity
+
+    @pytest.mark.parametrize("max_load_factor", [0, 1, 1.5])
+    def test_invalid_load_factor(self, max_load_factor):
+        with pytest.raises(ValueError):
+            OpenAddressingHashTable(max_load_factor=max_load_factor)
+
+    def test_colliding_hashes(self):
+        # equal hashes force long probe chains and backward shifts across them
+        class Key:
+            def __init__(self, value):
+                self.value = value
+
+            def __hash__(self):
+                return 7
+
+            def __eq__(self, other):
+                return self.value == other.value
+
+        table = OpenAddressingHashTable()
+        keys = [Key(i) for i in range(20)]
+        for key in keys:
+            table.insert(key, key.value)
+
+        for key in keys[::2]:
+            assert table.delete(key)
+        assert [table.get(key) for key in keys] == [None if i % 2 == 0 else i for i in range(20)]
+
+    def test_random_operations_match_dict(self):
+        rng = random.Random(1)
+        table = OpenAddressingHashTable()
+        expected = {}
+
+        for _ in range(20000):
+            key = rng.randrange(500)
+            operation = rng.random()
+            if operation < 0.5:
+                table.insert(key, operation)
+                expected[key] = operation
+            elif operation < 0.8:
+                assert table.delete(key) == (expected.pop(key, None) is not None)
+            else:
+                assert table.get(key) == expected.get(key)
+
+        assert len(table) == len(expected)
+        assert all(table.get(key) == value for key, value in expected.items())
+
+    def test_deletion_leaves_no_tombstones(self):
+        table = OpenAddressingHashTable()
+        for i in range(100):
+            table.insert(i, i)
+        for i in range(100):
+            table.delete(i)
+
+        assert len(table) == 0
+        assert all(value is None for value in table._values)
+
+
+class TestBulkOperations:
+    PAIRS = [(f"key{i}", i) for i in range(1000)]
+
+    def test_update_presizes_once(self):
+        table = OpenAddressingHashTable()
+        table.update(self.PAIRS)
+
+        assert table.capacity == OpenAddressingHashTable(1000).capacity
+        assert dict(table.items()) == dict(self.PAIRS)
+
+    def test_update_accepts_mapping_and_generator(self):
+        table = OpenAddressingHashTable.from_pairs({"a": 1, "b": 2})
+        table.update((key, 0) for key in "bc")
+
+        assert dict(table.items()) == {"a": 1, "b": 0, "c": 0}
+        assert sorted(table.keys()) == sorted(table) == ["a", "b", "c"]
+        assert sorted(table.values()) == [0, 0, 1]
+
+    def test_chained_from_pairs(self):
+        table = HashTable.from_pairs(self.PAIRS)
+
+        assert table.size == 1000
+        assert sorted(table.items(), key=lambda pair: pair[1]) == self.PAIRS
+        assert set(table.keys()) == {key for key, _ in self.PAIRS}
+
+        table = HashTable.from_pairs(pair for pair in self.PAIRS)
+
+        assert table.size == 1000
+        assert dict(table.items()) == dict(self.PAIRS)
+
+    def test_chained_update_rebuckets_once(self):
+        table = HashTable(5)
+        table.insert("key0", -1)
+        table.update(pair for pair in self.PAIRS)
+
+        assert table.size == 1001
+        assert table.get("key0") == 0
+        assert dict(table.items()) == dict(self.PAIRS)
+
+        table.update([("key1", 1)])
+        assert table.size == 1001
+
+    def test_chained_snapshot_round_trip(self, tmp_path):
+        table = HashTable(64)
+        for key, value in self.PAIRS:
+            table.insert(key, value)
+        table.insert(None, "none")
+        path = tmp_path / "table.bin"
+        table.save(path)
+
+        loaded = HashTable.load(path)
+
+        assert loaded.size == 64
+        assert loaded.table == table.table
+        assert loaded.get("key999") == 999
+        assert loaded.get(None) == "none"
+
+    def test_chained_snapshot_from_other_hash_seed_is_rehashed(self, monkeypatch):
+        data = HashTable.from_pairs(self.PAIRS).to_bytes()
+        monkeypatch.setattr("sources.hash_table._hash_seed_probe", lambda: 12345)
+
+        loaded = HashTable.from_bytes(data)
+
+        assert all(loaded.get(key) == value for key, value in self.PAIRS)
+
+    def test_snapshot_kinds_are_not_mixed(self):
+        with pytest.raises(ValueError):
+            HashTable.from_bytes(OpenAddressingHashTable.from_pairs(self.PAIRS).to_bytes())
+        with pytest.raises(ValueError):
+            OpenAddressingHashTable.from_bytes(HashTable.from_pairs(self.PAIRS).to_bytes())
+
+    def test_snapshot_round_trip_keeps_layout(self, tmp_path):
+        table = OpenAddressingHashTable.from_pairs(self.PAIRS, max_load_factor=0.5)
+        table.insert(None, "none")
+        table.delete("key10")
+        path = tmp_path / "table.bin"
+        table.save(path)
+
+        loaded = OpenAddressingHashTable.load(path)
+
+        assert loaded._keys == table._keys
+        assert loaded._hashes == table._hashes
+        assert (loaded.capacity, loaded.max_load_factor, len(loaded)) == (table.capacity, 0.5, len(table))
+        assert loaded.get("key999") == 999
+        assert loaded.get(None) == "none"
+        assert "key10" not in loaded
+
+    def test_snapshot_from_other_hash_seed_is_rehashed(self, monkeypatch):
+        data = OpenAddressingHashTable.from_pairs(self.PAIRS).to_bytes()
+        monkeypatch.setattr("sources.hash_table._hash_seed_probe", lambda: 12345)
+
+        loaded = OpenAddressingHashTable.from_bytes(data)
+
+        assert dict(loaded.items()) == dict(self.PAIRS)
+        assert loaded.capacity == OpenAddressingHashTable.from_pairs(self.PAIRS).capacity
+
+    def test_snapshot_arrays_are_little_endian(self, monkeypatch):
+        table = OpenAddressingHashTable.from_pairs(self.PAIRS)
+        data = table.to_bytes()
+        offset = hash_table._SNAPSHOT_HEADER.size
+        slots = [index for index, key in enumerate(table._keys) if key is not hash_table._EMPTY]
+
+        assert list(struct.unpack_from(f"<{len(table)}Q", data, offset)) == slots
+
+        # a big-endian host swaps on save and on load, so it reads the same snapshot
+        monkeypatch.setattr(hash_table.sys, "byteorder", "big")
+        swapped = table.to_bytes()
+        assert swapped != data
+        assert OpenAddressingHashTable.from_bytes(swapped)._keys == table._keys
+
+    def test_invalid_snapshot(self):
+        with pytest.raises(ValueError):
+            OpenAddressingHashTable.from_bytes(b"x" * 64)
+
+
+class TestHashTableBenchmark:
+    def test_benchmark_reports_every_table(self, capsys):
+        results = run_hash_table_benchmarks([200], repeats=2)
+
+        assert set(results[0].insert_times) == {'chained', 'chained_fixed', 'open_addressing', 'dict'}
+        assert all(time >= 0 for time in results[0].delete_times.values())
+
+        print_hash_table_results(results)
+        assert "open / dict" in capsys.readouterr().out
+
+    def test_bulk_load_benchmark(self, capsys):
+        results = run_bulk_load_benchmarks([200], repeats=2)
+
+        assert results[0].snapshot_bytes > 0
+        print_bulk_load_results(results)
+        assert "snapshot load" in capsys.readouterr().out
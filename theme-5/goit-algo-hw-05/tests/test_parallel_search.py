@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from sources.sub_str_search.parallel_search import parallel_search, parallel_search_file, split_ranges
+
+
+def naive_find_all(text, pattern):
+    return [i for i in range(len(text) - len(pattern) + 1) if text[i:i + len(pattern)] == pattern]
+
+
+TEXT = ''.join(random.Random(1).choices("ab", k=5000))
+
+
+class TestSplitRanges:
+    def test_ranges_overlap_by_pattern_length_minus_one(self):
+        assert split_ranges(10, 3, 3) == [(0, 6), (4, 10)]
+
+    def test_text_shorter_than_pattern(self):
+        assert split_ranges(2, 3, 4) == []
+
+
+class TestParallelSearch:
+    @pytest.mark.parametrize("algorithm", ["kmp", "boyer_moore"])
+    @pytest.mark.parametrize("pattern", ["abba", "bbbbbbbb"])
+    def test_find_all_matches_sequential(self, algorithm, pattern):
+        result = parallel_search(TEXT, pattern, algorithm, find_all=True, workers=2, chunk_count=7)
+        assert result == naive_find_all(TEXT, pattern)
+
+    def test_first_match(self):
+        assert parallel_search(TEXT, "abba", workers=2, chunk_count=7) == TEXT.find("abba")
+        assert parallel_search(TEXT, "c", workers=2) == -1
+
+    @pytest.mark.parametrize("pattern", [b"abba", bytearray(b"abba"), memoryview(b"abba")])
+    @pytest.mark.parametrize("to_text", [bytes, bytearray, memoryview])
+    def test_bytes_like(self, pattern, to_text):
+        text = to_text(TEXT.encode())
+        result = parallel_search(text, pattern, find_all=True, workers=2, chunk_count=5)
+        assert result == naive_find_all(TEXT, "abba")
+        assert parallel_search(text, pattern, workers=2, chunk_count=5) == TEXT.find("abba")
+
+    def test_file(self, tmp_path):
+        path = tmp_path / "text.txt"
+        path.write_text(TEXT, encoding="utf-8")
+        result = parallel_search_file(path, "abba", find_all=True, workers=2, chunk_count=5)
+        assert result == naive_find_all(TEXT, "abba")
+        assert parallel_search_file(path, "abba", workers=2, chunk_count=5) == TEXT.find("abba")
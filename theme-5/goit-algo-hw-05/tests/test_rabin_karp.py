@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+from sources.sub_str_search.rabin_karp import (
+    LARGE_PRIME_MODULUS,
+    RabinKarpStats,
+    rabin_karp_multi_search,
+    rabin_karp_search,
+    rabin_karp_search_all,
+)
+
+
+class TestRabinKarp:
+    @pytest.mark.parametrize("modulus", [101, LARGE_PRIME_MODULUS])
+    def test_search_with_modulus(self, modulus):
+        assert rabin_karp_search("find the algorithm here", "algorithm", modulus=modulus) == 9
+        assert rabin_karp_search("nothing", "algorithm", modulus=modulus) == -1
+
+    def test_large_modulus_has_no_collisions(self):
+        rng = random.Random(5)
+        text = ''.join(rng.choices("abcdefgh ", k=20000)) + "needle"
+        small, large = RabinKarpStats(), RabinKarpStats()
+
+        assert list(rabin_karp_search_all(text, "needle", stats=small)) == [20000]
+        assert list(rabin_karp_search_all(text, "needle", modulus=LARGE_PRIME_MODULUS, stats=large)) == [20000]
+
+        assert small.windows == large.windows == 20001
+        assert small.matches == large.matches == 1
+        assert small.false_positives > 0
+        assert large.false_positives == 0
+        assert large.collision_rate == 0.0
+
+    def test_stats_when_search_all_stops_early(self):
+        stats = RabinKarpStats()
+        for offset in rabin_karp_search_all("xxabxxab", "ab", stats=stats):
+            break
+
+        assert offset == 2
+        assert (stats.windows, stats.matches) == (3, 1)
+
+        stats = RabinKarpStats()
+        list(rabin_karp_search_all("xxabxxab", "ab", stats=stats))
+        assert (stats.windows, stats.matches) == (7, 2)
+
+        stats = RabinKarpStats()
+        list(rabin_karp_search_all("a", "ab", stats=stats))
+        assert stats.windows == 0
+
+    def test_stats_on_first_match(self):
+        stats = RabinKarpStats()
+        assert rabin_karp_search("xxabxx", "ab", stats=stats) == 2
+        assert stats.windows == 3
+        assert stats.matches == 1
+
+
+class TestRabinKarpMultiSearch:
+    def test_finds_all_patterns(self):
+        result = rabin_karp_multi_search("the cat sat on the mat", ["cat", "mat", "dog", "the"])
+        assert result == [("the", 0), ("cat", 4), ("the", 15), ("mat", 19)]
+
+    @pytest.mark.parametrize("modulus", [101, LARGE_PRIME_MODULUS])
+    def test_matches_naive_search(self, modulus):
+        rng = random.Random(9)
+        text = ''.join(rng.choices("abc", k=3000))
+        patterns = [''.join(rng.choices("abc", k=5)) for _ in range(30)]
+        expected = sorted((p, i) for p in set(patterns) for i in range(len(text) - 4) if text[i:i + 5] == p)
+        stats = RabinKarpStats()
+        assert sorted(rabin_karp_multi_search(text, patterns, modulus=modulus, stats=stats)) == expected
+        assert stats.matches == len(expected)
+
+    def test_empty_patterns(self):
+        assert rabin_karp_multi_search("abc", []) == []
+
+    def test_different_lengths_raise(self):
+        with pytest.raises(ValueError):
+            rabin_karp_multi_search("abc", ["ab", "abc"])
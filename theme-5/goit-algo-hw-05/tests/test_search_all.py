@@ -0,0 +1,61 @@
+import io
+import random
+
+import pytest
+
+from sources.sub_str_search.boyer_moore import boyer_moore_search_all
+from sources.sub_str_search.knuth_morris_pratt import kmp_search_all
+from sources.sub_str_search.rabin_karp import rabin_karp_search_all
+from sources.sub_str_search.stream_search import search_stream
+
+SEARCH_ALL = [boyer_moore_search_all, kmp_search_all, rabin_karp_search_all]
+
+
+def naive_find_all(text, pattern):
+    return [i for i in range(len(text) - len(pattern) + 1) if text[i:i + len(pattern)] == pattern]
+
+
+class TestSearchAll:
+    @pytest.mark.parametrize("search", SEARCH_ALL)
+    @pytest.mark.parametrize("text,pattern,expected", [
+        ("abracadabra", "abra", [0, 7]),
+        ("aaaaa", "aa", [0, 1, 2, 3]),
+        ("abcabcabc", "cab", [2, 5]),
+        ("hello world", "xyz", []),
+        ("ab", "abc", []),
+        ("a", "a", [0]),
+    ])
+    def test_examples(self, search, text, pattern, expected):
+        assert list(search(text, pattern)) == expected
+
+    @pytest.mark.parametrize("search", SEARCH_ALL)
+    def test_matches_naive_search_on_dense_text(self, search):
+        rng = random.Random(3)
+        text = ''.join(rng.choices("ab", k=3000))
+        for _ in range(20):
+            pattern = ''.join(rng.choices("ab", k=rng.randint(1, 8)))
+            assert list(search(text, pattern)) == naive_find_all(text, pattern)
+
+
+class TestSearchStream:
+    @pytest.mark.parametrize("algorithm", ["kmp", "boyer_moore"])
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+    def test_matches_across_chunk_boundaries(self, algorithm, chunk_size):
+        rng = random.Random(chunk_size)
+        text = ''.join(rng.choices("abc", k=500))
+        for pattern in ["a", "ab", "abca", "cabcab"]:
+            result = list(search_stream(io.StringIO(text), pattern, algorithm, chunk_size=chunk_size))
+            assert result == naive_find_all(text, pattern)
+
+    @pytest.mark.parametrize("algorithm", ["kmp", "boyer_moore"])
+    def test_generator_of_bytes_chunks(self, algorithm):
+        chunks = (part for part in [b"xxab", b"", b"cxxa", b"bcab", b"c"])
+        assert list(search_stream(chunks, b"abc", algorithm)) == [2, 7, 10]
+
+    def test_unknown_algorithm_raises(self):
+        with pytest.raises(ValueError):
+            search_stream(io.StringIO("abc"), "a", "unknown")
+
+    def test_empty_pattern_raises(self):
+        with pytest.raises(ValueError):
+            list(search_stream(io.StringIO("abc"), ""))
@@ -0,0 +1,126 @@
+import threading
+
+import pytest
+
+from sources.compare_hash_tables import print_concurrency_results, run_concurrency_benchmarks
+from sources.sharded_hash_table import ShardedHashTable
+
+
+def run_threads(target, count):
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestShardedHashTable:
+    def test_basic_operations(self):
+        table = ShardedHashTable(shard_count=4)
+        table.update({"a": 1, "b": 2})
+        table.insert("c", 3)
+
+        assert table.get("a") == 1
+        assert table.get("missing", "default") == "default"
+        assert table.delete("b") is True
+        assert table.delete("b") is False
+        assert "b" not in table
+        assert len(table) == 2
+        assert dict(table.items()) == {"a": 1, "c": 3}
+        assert sorted(table) == ["a", "c"]
+
+    @pytest.mark.parametrize("stride", [1, 16, 1024, 2**32])
+    def test_strided_int_keys_spread_over_shards(self, stride):
+        table = ShardedHashTable(shard_count=16)
+        table.update((i * stride, i) for i in range(1600))
+
+        sizes = [len(shard.table) for shard in table.shards]
+        assert sum(sizes) == 1600
+        assert min(sizes) > 50
+        assert table.get(100 * stride) == 100
+
+    @pytest.mark.parametrize("shard_count", [0, 3, 12])
+    def test_shard_count_must_be_power_of_two(self, shard_count):
+        with pytest.raises(ValueError):
+            ShardedHashTable(shard_count=shard_count)
+
+    def test_get_or_insert(self):
+        table = ShardedHashTable()
+        assert table.get_or_insert("key", 1) == 1
+        assert table.get_or_insert("key", 2) == 1
+
+    def test_concurrent_inserts(self):
+        table = ShardedHashTable(shard_count=4)
+
+        def worker(thread):
+            for i in range(2000):
+                table.insert((thread, i), i)
+
+        run_threads(worker, 8)
+
+        assert len(table) == 16000
+        assert all(table.get((thread, i)) == i for thread in range(8) for i in range(2000))
+
+    def test_compute_if_absent_calls_factory_once_per_key(self):
+        table = ShardedHashTable(shard_count=2)
+        calls = []
+        lock = threading.Lock()
+
+        def factory(key):
+            with lock:
+                calls.append(key)
+            return object()
+
+        results = [[] for _ in range(8)]
+
+        def worker(thread):
+            for key in range(500):
+                results[thread].append(table.compute_if_absent(key, factory))
+
+        run_threads(worker, 8)
+
+        assert sorted(calls) == list(range(500))
+        # every thread got the same object for each key
+        assert all(result == results[0] for result in results)
+
+    def test_lock_free_reads_during_resizes(self):
+        # readers see either the stored value or nothing, never another key's value,
+        # while writers keep resizing and deleting in the same shard
+        table = ShardedHashTable(shard_count=1)
+        for key in range(0, 20000, 2):
+            table.insert(key, key)
+        stop = threading.Event()
+        errors = []
+
+        def writer():
+            for key in range(1, 80001, 2):
+                table.insert(key, key)
+                if key < 20000:
+                    table.delete(key - 1)
+            stop.set()
+
+        def reader(_):
+            while not stop.is_set():
+                for key in range(0, 20000, 7):
+                    value = table.get(key)
+                    if value is not None and value != key:
+                        errors.append((key, value))
+
+        writer_thread = threading.Thread(target=writer)
+        writer_thread.start()
+        run_threads(reader, 2)
+        writer_thread.join()
+
+        assert errors == []
+        assert table.get(79999) == 79999
+        assert table.shards[0].table.capacity > 2 ** 15
+
+
+class TestConcurrencyBenchmark:
+    def test_benchmark(self, capsys):
+        results = run_concurrency_benchmarks([1, 2], key_count=500, operations=2000, repeats=1)
+
+        assert [result.threads for result in results] == [1, 2]
+        assert all(value > 0 for result in results for value in result.throughput.values())
+        print_concurrency_results(results)
+        assert "sharded / global" in capsys.readouterr().out
@@ -5,6 +5,7 @@ from sources.graph_view import visualize_graph, analyze_graph
 from sources.dijkstra_algorithm import paths_dijkstra
 from sources.graph_paths import bfs, dfs
 from sources.graph_generator import create_transportation_network
+from sources.compare_graph_representations import print_representation_results, run_representation_benchmarks
 
 
 def compare_bfs_dfs():
@@ -88,7 +89,8 @@ if __name__ == "__main__":
         print("1. Visualize and Analyze Transportation Network")
         print("2. Compare BFS and DFS Path Finding")
         print("3. Dijkstra's Shortest Path Algorithm")
-        print("4. Exit")
+        print("4. Graph Representation Benchmark (networkx vs CSR)")
+        print("5. Exit")
         print("******************************")
 
         choice = input("Select an option: ")
@@ -117,6 +119,9 @@ if __name__ == "__main__":
                 print(f"  To {station}: Distance = {distance}, Path = {' -> '.join(path)}")
 
         elif choice == '4':
+            print_representation_results(run_representation_benchmarks([10**4, 10**5]))
+
+        elif choice == '5':
             print("Exiting the program.")
             break
         else:
@@ -0,0 +1,250 @@
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+
+class AddressableHeap:
+    """
+    d-ary min-heap of items keyed by priority, with an item -> position index.
+
+    An item that is already queued gets a smaller priority in place (decrease_key)
+    instead of being pushed a second time, so every item is in the heap at most once
+    and len() is the number of distinct queued items, with no stale entries left to
+    skip. arity=2 is a binary heap; a wider heap is shallower, which makes
+    decrease_key (sift up) cheaper and pop (sift down over more children) dearer.
+    """
+
+    def __init__(self, arity: int = 2):
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self.arity = arity
+        self._items: List[Hashable] = []
+        self._priorities: List[Any] = []
+        self._positions: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item) -> bool:
+        return item in self._positions
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(arity={self.arity}, size={len(self)})"
+
+    def priority(self, item):
+        """Current priority of a queued item; KeyError if it is not queued."""
+        return self._priorities[self._positions[item]]
+
+    def peek(self) -> Tuple[Hashable, Any]:
+        if not self._items:
+            raise IndexError("peek from an empty heap")
+        return self._items[0], self._priorities[0]
+
+    def push(self, item, priority) -> None:
+        if item in self._positions:
+            raise ValueError(f"Item {item!r} is already in the heap, use decrease_key")
+        self._items.append(item)
+        self._priorities.append(priority)
+        self._sift_up(len(self._items) - 1, item, priority)
+
+    def pop(self) -> Tuple[Hashable, Any]:
+        """Remove and return (item, priority) with the smallest priority."""
+        if not self._items:
+            raise IndexError("pop from an empty heap")
+        item, priority = self._items[0], self._priorities[0]
+        del self._positions[item]
+
+        last_item, last_priority = self._items.pop(), self._priorities.pop()
+        if self._items:
+            self._sift_down(0, last_item, last_priority)
+        return item, priority
+
+    def decrease_key(self, item, priority) -> None:
+        position = self._positions[item]
+        if priority > self._priorities[position]:
+            raise ValueError(f"New priority {priority!r} is larger than the current {self._priorities[position]!r}")
+        self._sift_up(position, item, priority)
+
+    def push_or_decrease(self, item, priority) -> bool:
+        """
+        Queue item, or lower its priority if it is already queued with a larger one.
+        Returns False when nothing changed. This is the relaxation step of Dijkstra.
+        """
+        position = self._positions.get(item)
+        if position is None:
+            self.push(item, priority)
+            return True
+        if priority < self._priorities[position]:
+            self._sift_up(position, item, priority)
+            return True
+        return False
+
+    def _sift_up(self, position: int, item, priority) -> None:
+        # move the hole up past larger parents, then drop the item into it
+        items, priorities, positions, arity = self._items, self._priorities, self._positions, self.arity
+        while position > 0:
+            parent = (position - 1) // arity
+            if priorities[parent] <= priority:
+                break
+            items[position] = items[parent]
+            priorities[position] = priorities[parent]
+            positions[items[position]] = position
+            position = parent
+
+        items[position] = item
+        priorities[position] = priority
+        positions[item] = position
+
+    def _sift_down(self, position: int, item, priority) -> None:
+        items, priorities, positions, arity = self._items, self._priorities, self._positions, self.arity
+        size = len(items)
+        while True:
+            first = arity * position + 1
+            if first >= size:
+                break
+            best, best_priority = first, priorities[first]
+            for child in range(first + 1, min(first + arity, size)):
+                if priorities[child] < best_priority:
+                    best, best_priority = child, priorities[child]
+            if best_priority >= priority:
+                break
+            items[position] = items[best]
+            priorities[position] = best_priority
+            positions[items[position]] = position
+            position = best
+
+        items[position] = item
+        priorities[position] = priority
+        positions[item] = position
+
+
+class _PairingNode:
+    __slots__ = ('item', 'priority', 'child', 'sibling', 'previous')
+
+    def __init__(self, item, priority):
+        self.item = item
+        self.priority = priority
+        self.child = None
+        self.sibling = None
+        self.previous = None  # parent for a leftmost child, left sibling otherwise
+
+
+class PairingHeap:
+    """
+    Pairing heap with the same interface as AddressableHeap.
+
+    A heap-ordered multiway tree: push and decrease_key are O(1) (decrease_key cuts the
+    node's subtree off and melds it with the root), pop is amortized O(log n) and pairs
+    up the root's children in two passes. It suits graphs where most relaxations are
+    decrease_key calls, i.e. dense graphs.
+    """
+
+    def __init__(self):
+        self._root: _PairingNode | None = None
+        self._nodes: Dict[Hashable, _PairingNode] = {}
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, item) -> bool:
+        return item in self._nodes
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(size={len(self)})"
+
+    def priority(self, item):
+        return self._nodes[item].priority
+
+    def peek(self) -> Tuple[Hashable, Any]:
+        if self._root is None:
+            raise IndexError("peek from an empty heap")
+        return self._root.item, self._root.priority
+
+    def push(self, item, priority) -> None:
+        if item in self._nodes:
+            raise ValueError(f"Item {item!r} is already in the heap, use decrease_key")
+        node = self._nodes[item] = _PairingNode(item, priority)
+        self._root = node if self._root is None else self._meld(self._root, node)
+
+    def pop(self) -> Tuple[Hashable, Any]:
+        root = self._root
+        if root is None:
+            raise IndexError("pop from an empty heap")
+        del self._nodes[root.item]
+
+        # first pass: meld the children in pairs from left to right
+        pairs = []
+        node = root.child
+        while node is not None:
+            second = node.sibling
+            if second is None:
+                node.previous = None
+                pairs.append(node)
+                break
+            following = second.sibling
+            node.sibling = node.previous = second.sibling = second.previous = None
+            pairs.append(self._meld(node, second))
+            node = following
+
+        # second pass: meld the pairs from right to left into one tree
+        new_root = pairs.pop() if pairs else None
+        while pairs:
+            new_root = self._meld(pairs.pop(), new_root)
+        self._root = new_root
+        return root.item, root.priority
+
+    def decrease_key(self, item, priority) -> None:
+        node = self._nodes[item]
+        if priority > node.priority:
+            raise ValueError(f"New priority {priority!r} is larger than the current {node.priority!r}")
+        self._decrease(node, priority)
+
+    def push_or_decrease(self, item, priority) -> bool:
+        node = self._nodes.get(item)
+        if node is None:
+            self.push(item, priority)
+            return True
+        if priority < node.priority:
+            self._decrease(node, priority)
+            return True
+        return False
+
+    def _decrease(self, node: _PairingNode, priority) -> None:
+        node.priority = priority
+        if node is self._root:
+            return
+
+        # cut the subtree out of its sibling list and meld it with the root
+        previous = node.previous
+        if previous.child is node:
+            previous.child = node.sibling
+        else:
+            previous.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.previous = previous
+        node.sibling = node.previous = None
+        self._root = self._meld(self._root, node)
+
+    @staticmethod
+    def _meld(first: _PairingNode, second: _PairingNode) -> _PairingNode:
+        """Make the root with the larger priority the leftmost child of the other; both must be detached."""
+        if second.priority < first.priority:
+            first, second = second, first
+        second.sibling = first.child
+        if first.child is not None:
+            first.child.previous = second
+        second.previous = first
+        first.child = second
+        return first
+
+
+# name -> factory of an empty queue, for the `queue` argument of paths_dijkstra
+PRIORITY_QUEUES: Dict[str, Callable[[], Any]] = {
+    'binary': AddressableHeap,
+    '4-ary': lambda: AddressableHeap(4),
+    'pairing': PairingHeap,
+}
+
+
+def make_priority_queue(name: str):
+    if name not in PRIORITY_QUEUES:
+        raise ValueError(f"Unknown priority queue {name!r}, expected one of {sorted(PRIORITY_QUEUES)}")
+    return PRIORITY_QUEUES[name]()
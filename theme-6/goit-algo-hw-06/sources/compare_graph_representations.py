@@ -0,0 +1,80 @@
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, List
+
+from .benchmark_runner import run_benchmark
+from .csr_graph import CSRGraph, csr_bfs, csr_dfs, csr_dijkstra
+from .dijkstra_algorithm import paths_dijkstra
+from .graph_generator import create_transportation_network
+from .graph_paths import bfs, dfs
+
+
+@dataclass
+class RepresentationBenchmarkResult:
+    stations: int
+    connections: int
+    conversion_time: float  # seconds for CSRGraph.from_networkx
+    networkx_times: Dict[str, float]  # seconds per call, nan when the call failed
+    csr_times: Dict[str, float]
+
+
+def _time(func, repeats: int) -> float:
+    try:
+        return run_benchmark(func, repeats=repeats, warmup=0, number=1).median
+    except RecursionError:  # the recursive dfs cannot go as deep as a large graph needs
+        return float('nan')
+
+
+def run_representation_benchmarks(sizes: List[int], average_degree: int = 3, repeats: int = 3,
+                                  seed: int = 42) -> List[RepresentationBenchmarkResult]:
+    """
+    bfs, dfs and Dijkstra on a random weighted network of each size, walking the nx.Graph
+    and walking its CSRGraph conversion. Searches go from Station_1 to the last station.
+    """
+    results = []
+
+    for stations in sizes:
+        random.seed(seed)
+        graph = create_transportation_network(stations, stations * average_degree // 2, weights=True)
+        start, goal = "Station_1", f"Station_{stations}"
+
+        conversion_start = time.perf_counter()
+        csr = CSRGraph.from_networkx(graph)
+        conversion_time = time.perf_counter() - conversion_start
+
+        networkx_times = {
+            'bfs': _time(lambda: bfs(graph, start, goal), repeats),
+            'dfs': _time(lambda: dfs(graph, start, goal), repeats),
+            'dijkstra': _time(lambda: paths_dijkstra(graph, start), repeats),
+        }
+        csr_times = {
+            'bfs': _time(lambda: csr_bfs(csr, start, goal), repeats),
+            'dfs': _time(lambda: csr_dfs(csr, start, goal), repeats),
+            'dijkstra': _time(lambda: csr_dijkstra(csr, start), repeats),
+        }
+        results.append(RepresentationBenchmarkResult(stations, graph.number_of_edges(), conversion_time,
+                                                     networkx_times, csr_times))
+
+    return results
+
+
+def print_representation_results(results: List[RepresentationBenchmarkResult]) -> None:
+    print("\n" + "=" * 100)
+    print("NETWORKX GRAPH vs CSR ARRAYS (seconds per call, networkx / csr)")
+    print("=" * 100)
+    names = list(results[0].csr_times)
+    print(f"{'Stations':>9} | {'Edges':>9} | {'convert':>8} | " + " | ".join(f"{name:>22}" for name in names))
+    print("-" * 100)
+
+    for result in results:
+        cells = []
+        for name in names:
+            networkx_time, csr_time = result.networkx_times[name], result.csr_times[name]
+            networkx_cell = "n/a" if networkx_time != networkx_time else f"{networkx_time:.3f}s"
+            cells.append(f"{networkx_cell:>8} / {csr_time:>7.3f}s".rjust(22))
+        print(f"{result.stations:>9} | {result.connections:>9} | {result.conversion_time:>7.3f}s | " + " | ".join(cells))
+
+
+if __name__ == "__main__":
+    print_representation_results(run_representation_benchmarks([10**4, 10**5, 10**6]))
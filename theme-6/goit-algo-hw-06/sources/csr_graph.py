@@ -0,0 +1,189 @@
+import heapq
+from array import array
+from typing import Dict, Hashable, Iterable, List, Sequence, Tuple
+
+import networkx as nx
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional: the graph itself only needs the array module
+    np = None
+
+
+class CSRGraph:
+    """
+    Compressed sparse row graph: nodes are the integers 0..n-1, and the neighbors of
+    node u are targets[offsets[u]:offsets[u + 1]], with the edge weights at the same
+    positions in weights. The three arrays are flat and unboxed, so walking the edges
+    of a node is a slice of one array instead of a dict-of-dict lookup per edge.
+
+    names[i] is the original node of id i and ids maps it back. Undirected edges are
+    stored in both directions.
+    """
+
+    def __init__(self, names: List[Hashable], offsets: array, targets: array, weights: array):
+        self.names = names
+        self.ids: Dict[Hashable, int] = {name: node_id for node_id, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_networkx(cls, graph: nx.Graph, weight: str = 'weight') -> 'CSRGraph':
+        """One-time conversion; neighbors keep the order of graph.neighbors(), missing weights are 1."""
+        names = list(graph.nodes)
+        ids = {name: node_id for node_id, name in enumerate(names)}
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = array('d')
+
+        for name in names:
+            for neighbor, data in graph[name].items():
+                targets.append(ids[neighbor])
+                weights.append(data.get(weight, 1))
+            offsets.append(len(targets))
+
+        return cls(names, offsets, targets, weights)
+
+    @classmethod
+    def from_edges(cls, names: Sequence[Hashable], edges: Iterable[Tuple[Hashable, Hashable, float]],
+                   directed: bool = False) -> 'CSRGraph':
+        """Build from (u, v, weight) triples without going through networkx."""
+        ids = {name: node_id for node_id, name in enumerate(names)}
+        adjacency: List[List[Tuple[int, float]]] = [[] for _ in names]
+        for u, v, w in edges:
+            adjacency[ids[u]].append((ids[v], w))
+            if not directed:
+                adjacency[ids[v]].append((ids[u], w))
+
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = array('d')
+        for neighbors in adjacency:
+            for target, w in neighbors:
+                targets.append(target)
+                weights.append(w)
+            offsets.append(len(targets))
+
+        return cls(list(names), offsets, targets, weights)
+
+    def number_of_nodes(self) -> int:
+        return len(self.names)
+
+    def number_of_edges(self) -> int:
+        """Stored (directed) edges: an undirected edge counts twice."""
+        return len(self.targets)
+
+    def neighbors(self, node_id: int) -> array:
+        return self.targets[self.offsets[node_id]:self.offsets[node_id + 1]]
+
+    def as_numpy(self):
+        """(offsets, targets, weights) as NumPy arrays sharing memory with the graph."""
+        if np is None:
+            raise ImportError("numpy is required for as_numpy: pip install numpy")
+        return (np.frombuffer(self.offsets, dtype=np.int64), np.frombuffer(self.targets, dtype=np.int64),
+                np.frombuffer(self.weights, dtype=np.float64))
+
+    def path_names(self, predecessors: array, target_id: int) -> List[Hashable]:
+        """Follow predecessors (-1 marks the start) back from target_id and return the node names."""
+        path = []
+        node_id = target_id
+        while node_id >= 0:
+            path.append(self.names[node_id])
+            node_id = predecessors[node_id]
+        path.reverse()
+        return path
+
+
+def csr_bfs(graph: CSRGraph, start: Hashable, goal: Hashable) -> List[Hashable] | None:
+    """bfs on a CSRGraph: the same path as graph_paths.bfs, kept as parent ids instead of path copies."""
+    offsets, targets = graph.offsets, graph.targets
+    start_id, goal_id = graph.ids[start], graph.ids[goal]
+    parents = array('q', [-2]) * graph.number_of_nodes()  # -2: not visited, -1: the start
+    parents[start_id] = -1
+
+    queue = [start_id]
+    for u in queue:  # the list grows while it is walked, which makes it a FIFO queue
+        if u == goal_id:
+            return graph.path_names(parents, goal_id)
+        for v in targets[offsets[u]:offsets[u + 1]]:
+            if parents[v] == -2:
+                parents[v] = u
+                queue.append(v)
+    return None
+
+
+def csr_dfs(graph: CSRGraph, start: Hashable, goal: Hashable) -> List[Hashable] | None:
+    """
+    dfs on a CSRGraph with an explicit stack of (node, next edge position), so it finds
+    the same path as the recursive graph_paths.dfs without its recursion limit.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    start_id, goal_id = graph.ids[start], graph.ids[goal]
+    visited = bytearray(graph.number_of_nodes())
+    visited[start_id] = 1
+    path = [start_id]
+    positions = [offsets[start_id]]
+
+    while path:
+        u = path[-1]
+        if u == goal_id:
+            return [graph.names[node_id] for node_id in path]
+
+        position, end = positions[-1], offsets[u + 1]
+        while position < end and visited[targets[position]]:
+            position += 1
+        if position == end:
+            path.pop()
+            positions.pop()
+            continue
+
+        positions[-1] = position + 1
+        v = targets[position]
+        visited[v] = 1
+        path.append(v)
+        positions.append(offsets[v])
+
+    return None
+
+
+def csr_dijkstra(graph: CSRGraph, start: Hashable) -> Tuple[array, array]:
+    """
+    Dijkstra on a CSRGraph. Returns (distances, predecessors) indexed by node id, with
+    inf for unreachable nodes and -1 as the predecessor of the start and of unreachable
+    nodes; graph.path_names(predecessors, id) rebuilds a path on demand.
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    n = graph.number_of_nodes()
+    start_id = graph.ids[start]
+    distances = array('d', [float('inf')]) * n
+    predecessors = array('q', [-1]) * n
+    distances[start_id] = 0.0
+    heap = [(0.0, start_id)]
+
+    while heap:
+        current_distance, u = heapq.heappop(heap)
+        if current_distance > distances[u]:
+            continue
+
+        first, last = offsets[u], offsets[u + 1]
+        for v, weight in zip(targets[first:last], weights[first:last]):
+            distance = current_distance + weight
+            if distance < distances[v]:
+                distances[v] = distance
+                predecessors[v] = u
+                heapq.heappush(heap, (distance, v))
+
+    return distances, predecessors
+
+
+def csr_paths_dijkstra(graph: CSRGraph, start: Hashable) -> Dict[Hashable, Tuple[float, List[Hashable]]]:
+    """
+    Same result format as dijkstra_algorithm.paths_dijkstra, computed on the CSR arrays.
+    Distances are equal; where several shortest paths tie, the one returned may differ,
+    since the heap here breaks ties by node id.
+    """
+    distances, predecessors = csr_dijkstra(graph, start)
+    return {name: (distances[node_id], graph.path_names(predecessors, node_id) if distances[node_id] < float('inf')
+                   else [])
+            for node_id, name in enumerate(graph.names)}
@@ -2,10 +2,23 @@ import networkx as nx
 import heapq
 from typing import Dict, Tuple, List
 
+from .addressable_heap import make_priority_queue
 
-def paths_dijkstra(graph: nx.Graph, start: str) -> Dict[str, Tuple[float, List[str]]]:
+
+def paths_dijkstra(graph: nx.Graph, start: str, queue: str | None = None) -> Dict[str, Tuple[float, List[str]]]:
+    """
+    Shortest distance and path from start to every node.
+
+    queue=None uses heapq with lazy deletion (outdated entries are skipped when popped).
+    'binary', '4-ary' or 'pairing' (see PRIORITY_QUEUES) use an addressable heap where an
+    improved distance is a decrease_key, so the queue holds at most one entry per node.
+    """
     distances = {node: (float('inf'), []) for node in graph.nodes}
     distances[start] = (0, [start])
+
+    if queue is not None:
+        return _paths_dijkstra_addressable(graph, start, distances, make_priority_queue(queue))
+
     priority_queue = [(0, start, [start])]
 
     while priority_queue:
@@ -22,3 +35,20 @@ def paths_dijkstra(graph: nx.Graph, start: str) -> Dict[str, Tuple[float, List[s
                 heapq.heappush(priority_queue, (distance, neighbor, path + [neighbor]))
 
     return distances
+
+
+def _paths_dijkstra_addressable(graph: nx.Graph, start: str, distances, priority_queue):
+    priority_queue.push(start, 0)
+
+    while priority_queue:
+        current_node, current_distance = priority_queue.pop()
+        path = distances[current_node][1]
+
+        for neighbor in graph.neighbors(current_node):
+            weight = graph[current_node][neighbor].get('weight', 1)
+            distance = current_distance + weight
+            if distance < distances[neighbor][0]:
+                distances[neighbor] = (distance, path + [neighbor])
+                priority_queue.push_or_decrease(neighbor, distance)
+
+    return distances
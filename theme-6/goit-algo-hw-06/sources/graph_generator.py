@@ -8,10 +8,14 @@ def create_transportation_network(num_stations: int, num_connections: int, weigh
     for i in range(num_stations):
         graph.add_node(f"Station_{i+1}")
 
-    while graph.number_of_edges() < num_connections:
+    # number_of_edges() walks every node, so keep the count here instead
+    edges = 0
+    while edges < num_connections:
         station_a = f"Station_{random.randint(1, num_stations)}"
         station_b = f"Station_{random.randint(1, num_stations)}"
         if station_a != station_b:
+            if not graph.has_edge(station_a, station_b):
+                edges += 1
             graph.add_edge(station_a, station_b, weight=random.randint(1, 10) if weights else 1)
 
     return graph
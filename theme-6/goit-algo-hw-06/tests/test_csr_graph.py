@@ -0,0 +1,132 @@
+import random
+
+import pytest
+
+nx = pytest.importorskip("networkx")
+
+from sources.csr_graph import CSRGraph, csr_bfs, csr_dfs, csr_dijkstra, csr_paths_dijkstra
+from sources.dijkstra_algorithm import paths_dijkstra
+from sources.graph_generator import create_transportation_network
+from sources.graph_paths import bfs, dfs
+
+
+def random_graphs():
+    random.seed(7)
+    yield create_transportation_network(30, 45, weights=True)
+    yield create_transportation_network(80, 240, weights=True)
+    graph = create_transportation_network(40, 40, weights=True)
+    graph.add_nodes_from(["Isolated_1", "Isolated_2"])
+    yield graph
+
+
+def graph_with_isolated_vertices():
+    graph = nx.Graph()
+    graph.add_nodes_from(["Lonely", "A"])
+    graph.add_weighted_edges_from([("A", "B", 2), ("B", "C", 1), ("A", "C", 4), ("D", "E", 1)])
+    graph.add_node("Also lonely")
+    return graph
+
+
+class TestCSRGraph:
+    def test_from_networkx(self):
+        graph = graph_with_isolated_vertices()
+        csr = CSRGraph.from_networkx(graph)
+        assert csr.names == list(graph.nodes)
+        assert csr.number_of_nodes() == graph.number_of_nodes()
+        assert csr.number_of_edges() == 2 * graph.number_of_edges()
+        for name in graph.nodes:
+            node_id = csr.ids[name]
+            assert [csr.names[v] for v in csr.neighbors(node_id)] == list(graph.neighbors(name))
+        assert list(csr.neighbors(csr.ids["Lonely"])) == []
+
+    def test_missing_weight_is_one(self):
+        graph = nx.Graph([("A", "B")])
+        assert list(CSRGraph.from_networkx(graph).weights) == [1.0, 1.0]
+
+    def test_from_edges_matches_from_networkx(self):
+        graph = graph_with_isolated_vertices()
+        from_graph = CSRGraph.from_networkx(graph)
+        from_edges = CSRGraph.from_edges(list(graph.nodes), graph.edges(data='weight'))
+        assert from_edges.names == from_graph.names
+        assert from_edges.offsets == from_graph.offsets
+        for node_id in range(from_graph.number_of_nodes()):
+            assert sorted(from_edges.neighbors(node_id)) == sorted(from_graph.neighbors(node_id))
+
+    def test_from_edges_directed(self):
+        csr = CSRGraph.from_edges(["A", "B"], [("A", "B", 3.0)], directed=True)
+        assert csr.number_of_edges() == 1
+        assert list(csr.neighbors(csr.ids["B"])) == []
+
+    def test_as_numpy(self):
+        np = pytest.importorskip("numpy")
+        csr = CSRGraph.from_networkx(graph_with_isolated_vertices())
+        offsets, targets, weights = csr.as_numpy()
+        assert offsets.tolist() == list(csr.offsets)
+        assert targets.tolist() == list(csr.targets)
+        assert weights.dtype == np.float64
+
+
+class TestCSRSearch:
+    def test_bfs_and_dfs_match(self):
+        for graph in random_graphs():
+            csr = CSRGraph.from_networkx(graph)
+            nodes = list(graph.nodes)
+            for goal in nodes:
+                assert csr_bfs(csr, nodes[0], goal) == bfs(graph, nodes[0], goal)
+                assert csr_dfs(csr, nodes[0], goal) == dfs(graph, nodes[0], goal)
+
+    def test_isolated_vertices(self):
+        graph = graph_with_isolated_vertices()
+        csr = CSRGraph.from_networkx(graph)
+        for search in (csr_bfs, csr_dfs):
+            assert search(csr, "A", "Lonely") is None
+            assert search(csr, "Lonely", "A") is None
+            assert search(csr, "A", "E") is None
+            assert search(csr, "Lonely", "Lonely") == ["Lonely"]
+        assert csr_bfs(csr, "A", "C") == bfs(graph, "A", "C")
+        assert csr_dfs(csr, "A", "C") == dfs(graph, "A", "C")
+
+    def test_dfs_deep_path(self):
+        # deeper than the recursion limit of graph_paths.dfs
+        graph = nx.path_graph(5000)
+        csr = CSRGraph.from_networkx(graph)
+        assert csr_dfs(csr, 0, 4999) == list(range(5000))
+
+    def test_dijkstra_matches(self):
+        for graph in random_graphs():
+            csr = CSRGraph.from_networkx(graph)
+            start = next(iter(graph.nodes))
+            expected = paths_dijkstra(graph, start)
+            result = csr_paths_dijkstra(csr, start)
+            assert result.keys() == expected.keys()
+            for node, (distance, path) in result.items():
+                assert distance == expected[node][0]
+                if distance == float('inf'):
+                    assert path == []
+                else:
+                    assert path[0] == start and path[-1] == node
+                    assert sum(graph[u][v]['weight'] for u, v in zip(path, path[1:])) == distance
+
+    def test_dijkstra_ties_give_an_equal_cost_path(self):
+        # two routes of cost 2 to D; the node ids order them differently than the names do
+        graph = nx.Graph()
+        graph.add_nodes_from(["D", "C", "B", "A"])
+        graph.add_weighted_edges_from([("A", "C", 1), ("C", "D", 1), ("A", "B", 1), ("B", "D", 1)])
+        csr = CSRGraph.from_networkx(graph)
+        expected = paths_dijkstra(graph, "A")["D"]
+        distance, path = csr_paths_dijkstra(csr, "A")["D"]
+
+        assert distance == expected[0] == 2
+        assert path in (["A", "B", "D"], ["A", "C", "D"])
+        assert sum(graph[u][v]['weight'] for u, v in zip(path, path[1:])) == distance
+
+    def test_dijkstra_isolated_vertices(self):
+        csr = CSRGraph.from_networkx(graph_with_isolated_vertices())
+        distances, predecessors = csr_dijkstra(csr, "A")
+        for name in ("Lonely", "Also lonely", "D", "E"):
+            assert distances[csr.ids[name]] == float('inf')
+            assert predecessors[csr.ids[name]] == -1
+        result = csr_paths_dijkstra(csr, "A")
+        assert result["C"] == (3.0, ["A", "B", "C"])
+        assert result["Lonely"] == (float('inf'), [])
+        assert csr_paths_dijkstra(csr, "Lonely")["Lonely"] == (0.0, ["Lonely"])
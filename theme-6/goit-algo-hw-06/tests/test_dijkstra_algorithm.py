@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+nx = pytest.importorskip("networkx")
+
+from sources.addressable_heap import PRIORITY_QUEUES
+from sources.dijkstra_algorithm import paths_dijkstra
+from sources.graph_generator import create_transportation_network
+
+QUEUES = [None, *sorted(PRIORITY_QUEUES)]
+
+
+def path_weight(graph, path):
+    return sum(graph[u][v].get('weight', 1) for u, v in zip(path, path[1:]))
+
+
+def random_graphs():
+    random.seed(42)
+    yield create_transportation_network(30, 60, weights=True)
+    yield create_transportation_network(100, 150, weights=True)
+    yield create_transportation_network(60, 1000, weights=True)  # dense: many decrease_key calls
+    graph = create_transportation_network(40, 50, weights=True)
+    graph.add_nodes_from(["Isolated_1", "Isolated_2"])
+    yield graph
+
+
+@pytest.mark.parametrize("queue", QUEUES)
+class TestPathsDijkstra:
+    def test_matches_networkx(self, queue):
+        for graph in random_graphs():
+            start = "Station_1"
+            expected = nx.single_source_dijkstra_path_length(graph, start)
+            result = paths_dijkstra(graph, start, queue)
+
+            assert set(result) == set(graph.nodes)
+            for node, (distance, path) in result.items():
+                if node not in expected:
+                    assert distance == float('inf')
+                    assert path == []
+                    continue
+                assert distance == expected[node]
+                assert path[0] == start and path[-1] == node
+                assert path_weight(graph, path) == distance
+
+    def test_start_only(self, queue):
+        graph = nx.Graph()
+        graph.add_node("A")
+        assert paths_dijkstra(graph, "A", queue) == {"A": (0, ["A"])}
+
+    def test_unweighted_edges_count_as_one(self, queue):
+        graph = nx.path_graph(["A", "B", "C"])
+        graph.add_edge("A", "C", weight=5)
+        result = paths_dijkstra(graph, "A", queue)
+        assert result["C"] == (2, ["A", "B", "C"])
+
+    def test_zero_weight_edges(self, queue):
+        graph = nx.Graph()
+        graph.add_weighted_edges_from([("A", "B", 0), ("B", "C", 0), ("A", "C", 1)])
+        result = paths_dijkstra(graph, "A", queue)
+        assert result["C"][0] == 0
@@ -1,6 +1,8 @@
 from random import randint
-from sources.cables_sort import minimize_cable_cost
-from sources.lists_merge import merge_k_lists
+from sources.cables_sort import minimize_cable_cost, plan_cable_joins
+from sources.compare_cables_sort import print_cable_results, run_cable_benchmarks
+from sources.lists_merge import merge_k_lists, merge_k_lists_loser_tree
+from sources.compare_lists_merge import print_merge_results, run_merge_benchmarks
 
 
 def main():
@@ -8,6 +10,8 @@ def main():
         print("\n************ MENU ************")
         print("1. Minimize Cable Connection Cost")
         print("2. Merge K Sorted Lists")
+        print("3. Merge K Sorted Lists Benchmark")
+        print("4. Cable Cost Benchmark")
         print("0. Exit")
         print("******************************")
 
@@ -26,6 +30,8 @@ def main():
 
             total_cost = minimize_cable_cost(cables)
             print(f"Minimum cost to connect cables: {total_cost}")
+            for first_id, second_id, length in plan_cable_joins(cables).joins():
+                print(f"  join #{first_id} + #{second_id} -> length {length}")
 
         elif choice == '2':
             lists_input = input("Enter sorted lists separated by semicolons (e.g., 1,4,5;1,3,4;2,6) or press Enter for default: ")
@@ -41,6 +47,13 @@ def main():
 
             merged_list = merge_k_lists(lists)
             print(f"Merged Sorted List: {merged_list}")
+            print(f"Merged with a loser tree: {merge_k_lists_loser_tree(lists)}")
+
+        elif choice == '3':
+            print_merge_results(run_merge_benchmarks([2, 10, 100, 1000]))
+
+        elif choice == '4':
+            print_cable_results(run_cable_benchmarks([10**5, 10**6]))
 
         elif choice == '0':
             print("Exiting the program.")
@@ -1,6 +1,41 @@
 import heapq
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple
 
-def minimize_cable_cost(cables: list[int]) -> int:
+
+@dataclass
+class CableJoinPlan:
+    """
+    Order of joins with the minimum total cost, as a merge tree.
+
+    Node ids 0..n-1 are the input cables (by their index in the input); join t creates
+    node n + t out of nodes first[t] and second[t], of length lengths[t]. The last join
+    is the root: the single finished cable.
+    """
+    total_cost: int
+    cable_count: int
+    first: List[int]
+    second: List[int]
+    lengths: List[int]
+
+    def joins(self) -> Iterator[Tuple[int, int, int]]:
+        """(first_id, second_id, joined_length) for every join, in the order they are made."""
+        return zip(self.first, self.second, self.lengths)
+
+
+def minimize_cable_cost(cables: list[int], presorted: bool = False) -> int:
+    """
+    Minimum cost of joining all cables into one, joining two at a time for the sum of
+    their lengths. The caller's list is left unchanged.
+
+    With presorted=True the lengths must already be in ascending order (e.g. coming from
+    a sorted source or a linear-time integer sort) and the two-queue method runs in O(n)
+    instead of the O(n log n) heap.
+    """
+    if presorted:
+        return _two_queue_cost(cables)
+
+    cables = list(cables)
     heapq.heapify(cables)
     total_cost: int = 0
 
@@ -16,6 +51,80 @@ def minimize_cable_cost(cables: list[int]) -> int:
     return total_cost
 
 
+def _two_queue_cost(lengths: list[int]) -> int:
+    """
+    Two-queue Huffman merge over ascending lengths: the joined cables are created in
+    ascending order too, so the two smallest cables are always at the fronts of the
+    input and of the queue of joins, and no heap is needed.
+    """
+    n = len(lengths)
+    joined: List[int] = []
+    i = j = 0
+    total_cost = 0
+
+    for _ in range(n - 1):
+        if j == len(joined) or (i < n and lengths[i] <= joined[j]):
+            first = lengths[i]
+            i += 1
+        else:
+            first = joined[j]
+            j += 1
+        if j == len(joined) or (i < n and lengths[i] <= joined[j]):
+            second = lengths[i]
+            i += 1
+        else:
+            second = joined[j]
+            j += 1
+
+        cost = first + second
+        total_cost += cost
+        joined.append(cost)
+
+    return total_cost
+
+
+def plan_cable_joins(cables: list[int], presorted: bool = False) -> CableJoinPlan:
+    """
+    Minimum-cost join order as a CableJoinPlan, without changing cables.
+    Unsorted input is ordered first (O(n log n)); with presorted=True the plan is built
+    in O(n) by the two-queue method.
+    """
+    n = len(cables)
+    order = range(n) if presorted else sorted(range(n), key=cables.__getitem__)
+    first: List[int] = []
+    second: List[int] = []
+    lengths: List[int] = []
+    i = j = 0
+    total_cost = 0
+
+    for _ in range(n - 1):
+        if j == len(lengths) or (i < n and cables[order[i]] <= lengths[j]):
+            first_id = order[i]
+            first_length = cables[first_id]
+            i += 1
+        else:
+            first_id = n + j
+            first_length = lengths[j]
+            j += 1
+        if j == len(lengths) or (i < n and cables[order[i]] <= lengths[j]):
+            second_id = order[i]
+            second_length = cables[second_id]
+            i += 1
+        else:
+            second_id = n + j
+            second_length = lengths[j]
+            j += 1
+
+        cost = first_length + second_length
+        total_cost += cost
+        first.append(first_id)
+        second.append(second_id)
+        lengths.append(cost)
+
+    return CableJoinPlan(total_cost, n, first, second, lengths)
+
+
 if __name__ == "__main__":
     cables = [4, 3, 2, 6]
     print("Minimum cost to connect cables:", minimize_cable_cost(cables))  # 29
+    print("Joins:", list(plan_cable_joins(cables).joins()))
@@ -0,0 +1,60 @@
+import random
+from dataclasses import dataclass
+from typing import Dict, List
+
+from .benchmark_runner import run_benchmark
+from .cables_sort import minimize_cable_cost, plan_cable_joins
+
+
+@dataclass
+class CableBenchmarkResult:
+    size: int
+    times: Dict[str, float]  # seconds per call
+
+
+def generate_cables(size: int, max_length: int = 1000, seed: int = 42) -> List[int]:
+    rng = random.Random(seed)
+    return [rng.randint(1, max_length) for _ in range(size)]
+
+
+def run_cable_benchmarks(sizes: List[int], repeats: int = 3) -> List[CableBenchmarkResult]:
+    """
+    Time the heap on unsorted and on sorted lengths against the two-queue method on
+    sorted lengths, with and without the sort, and building the full join plan.
+    """
+    results = []
+
+    for size in sizes:
+        cables = generate_cables(size, seed=size)
+        sorted_cables = sorted(cables)
+
+        benchmarks = {
+            'heap': lambda: minimize_cable_cost(cables),
+            'heap (sorted input)': lambda: minimize_cable_cost(sorted_cables),
+            'two-queue': lambda: minimize_cable_cost(sorted_cables, presorted=True),
+            'sort + two-queue': lambda: minimize_cable_cost(sorted(cables), presorted=True),
+            'plan (two-queue)': lambda: plan_cable_joins(sorted_cables, presorted=True),
+        }
+        times = {name: run_benchmark(func, name=name, repeats=repeats, warmup=0, number=1).median
+                 for name, func in benchmarks.items()}
+        results.append(CableBenchmarkResult(size, times))
+
+    return results
+
+
+def print_cable_results(results: List[CableBenchmarkResult]) -> None:
+    print("\n" + "=" * 100)
+    print("MINIMUM CABLE JOIN COST: HEAP vs TWO QUEUES (seconds per call)")
+    print("=" * 100)
+    names = list(results[0].times)
+    print(f"{'Cables':>10} | " + " | ".join(f"{name:>19}" for name in names) + f" | {'speedup':>7}")
+    print("-" * 100)
+
+    for result in results:
+        speedup = result.times['heap'] / result.times['two-queue']
+        print(f"{result.size:>10} | " + " | ".join(f"{result.times[name]:>18.3f}s" for name in names)
+              + f" | {speedup:>6.1f}x")
+
+
+if __name__ == "__main__":
+    print_cable_results(run_cable_benchmarks([10**6, 10**7, 10**8], repeats=2))
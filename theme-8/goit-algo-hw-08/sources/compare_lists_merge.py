@@ -0,0 +1,77 @@
+import heapq
+import random
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+from .benchmark_runner import run_benchmark
+from .lists_merge import merge_k_lists, merge_k_lists_loser_tree
+
+
+@dataclass
+class MergeBenchmarkResult:
+    input_kind: str
+    k: int
+    total: int
+    times: Dict[str, float]  # seconds per merge
+
+
+def generate_random_lists(k: int, total: int, rng: random.Random) -> List[List[int]]:
+    """k sorted lists of random values: the heads interleave, runs are about one element long."""
+    size = max(total // k, 1)
+    return [sorted(rng.randrange(total) for _ in range(size)) for _ in range(k)]
+
+
+def generate_clustered_lists(k: int, total: int, rng: random.Random, run_length: int = 1000) -> List[List[int]]:
+    """
+    k sorted lists built from blocks of run_length consecutive values, each block
+    dealt to a random list (like time-partitioned logs): long runs win one after another.
+    """
+    lists = [[] for _ in range(k)]
+    for start in range(0, total, run_length):
+        lists[rng.randrange(k)].extend(range(start, min(start + run_length, total)))
+    return lists
+
+
+INPUT_KINDS: Dict[str, Callable[[int, int, random.Random], List[List[int]]]] = {
+    'random': generate_random_lists,
+    'clustered': generate_clustered_lists,
+}
+
+MERGES: Dict[str, Callable[[List[List[int]]], List[int]]] = {
+    'heap': merge_k_lists,
+    'heapq.merge': lambda lists: list(heapq.merge(*lists)),
+    'loser tree': lambda lists: merge_k_lists_loser_tree(lists, copy_runs=False),
+    'loser tree + runs': merge_k_lists_loser_tree,
+}
+
+
+def run_merge_benchmarks(ks: List[int], total: int = 10**6, repeats: int = 3) -> List[MergeBenchmarkResult]:
+    """Time every merge in MERGES on each input kind for every number of lists k."""
+    results = []
+
+    for input_kind, generate in INPUT_KINDS.items():
+        for k in ks:
+            lists = generate(k, total, random.Random(k))
+            times = {name: run_benchmark(lambda: merge(lists), name=name, repeats=repeats, warmup=0, number=1).median
+                     for name, merge in MERGES.items()}
+            results.append(MergeBenchmarkResult(input_kind, k, sum(map(len, lists)), times))
+
+    return results
+
+
+def print_merge_results(results: List[MergeBenchmarkResult]) -> None:
+    print("\n" + "=" * 100)
+    print(f"MERGING K SORTED LISTS ({results[0].total} elements in total, seconds per merge)")
+    print("=" * 100)
+    names = list(results[0].times)
+    print(f"{'Input':<10} | {'k':>6} | " + " | ".join(f"{name:>17}" for name in names) + f" | {'vs heap':>7}")
+    print("-" * 100)
+
+    for result in results:
+        best = min(result.times.values())
+        print(f"{result.input_kind:<10} | {result.k:>6} | " + " | ".join(f"{result.times[name]:>16.4f}s" for name in names)
+              + f" | {result.times['heap'] / best:>6.1f}x")
+
+
+if __name__ == "__main__":
+    print_merge_results(run_merge_benchmarks([2, 10, 100, 1000]))
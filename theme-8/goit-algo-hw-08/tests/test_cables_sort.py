@@ -0,0 +1,96 @@
+import heapq
+import random
+
+import pytest
+
+from sources.cables_sort import minimize_cable_cost, plan_cable_joins
+
+
+def reference_cost(cables):
+    heap = list(cables)
+    heapq.heapify(heap)
+    total = 0
+    while len(heap) > 1:
+        cost = heapq.heappop(heap) + heapq.heappop(heap)
+        total += cost
+        heapq.heappush(heap, cost)
+    return total
+
+
+def random_cables(rng, count):
+    return [rng.randint(1, rng.choice([3, 100, 10**6])) for _ in range(count)]
+
+
+class TestMinimizeCableCost:
+    def test_example(self):
+        assert minimize_cable_cost([4, 3, 2, 6]) == 29
+        assert minimize_cable_cost([2, 3, 4, 6], presorted=True) == 29
+
+    @pytest.mark.parametrize("cables", [[], [5]])
+    def test_nothing_to_join(self, cables):
+        assert minimize_cable_cost(cables) == 0
+        assert minimize_cable_cost(cables, presorted=True) == 0
+
+    def test_two_queue_matches_heap(self):
+        rng = random.Random(42)
+        for _ in range(300):
+            cables = random_cables(rng, rng.randint(0, 60))
+            expected = reference_cost(cables)
+            assert minimize_cable_cost(cables) == expected
+            assert minimize_cable_cost(sorted(cables), presorted=True) == expected
+
+    def test_equal_lengths(self):
+        cables = [7] * 33
+        assert minimize_cable_cost(cables, presorted=True) == reference_cost(cables)
+
+    def test_input_not_modified(self):
+        cables = [4, 3, 2, 6]
+        minimize_cable_cost(cables)
+        assert cables == [4, 3, 2, 6]
+
+
+class TestPlanCableJoins:
+    @staticmethod
+    def node_lengths(cables, plan):
+        return list(cables) + plan.lengths
+
+    @pytest.mark.parametrize("cables", [[], [5]])
+    def test_nothing_to_join(self, cables):
+        plan = plan_cable_joins(cables)
+        assert plan.total_cost == 0
+        assert plan.cable_count == len(cables)
+        assert list(plan.joins()) == []
+
+    def test_example(self):
+        plan = plan_cable_joins([4, 3, 2, 6])
+        assert plan.total_cost == 29
+        assert list(plan.joins()) == [(2, 1, 5), (0, 4, 9), (3, 5, 15)]
+
+    @pytest.mark.parametrize("presorted", [False, True])
+    def test_steps_add_up_to_total(self, presorted):
+        rng = random.Random(7)
+        for _ in range(200):
+            cables = random_cables(rng, rng.randint(2, 60))
+            if presorted:
+                cables.sort()
+            plan = plan_cable_joins(cables, presorted=presorted)
+            n = len(cables)
+
+            assert plan.total_cost == sum(plan.lengths) == reference_cost(cables)
+            assert len(plan.lengths) == n - 1
+
+            lengths = self.node_lengths(cables, plan)
+            for t, (first_id, second_id, length) in enumerate(plan.joins()):
+                # a join only uses nodes made before it
+                assert first_id < n + t and second_id < n + t
+                assert length == lengths[first_id] + lengths[second_id]
+
+            # every node except the root is joined exactly once
+            used = sorted(plan.first + plan.second)
+            assert used == list(range(2 * n - 2))
+            assert lengths[-1] == sum(cables)
+
+    def test_input_not_modified(self):
+        cables = [4, 3, 2, 6]
+        plan_cable_joins(cables)
+        assert cables == [4, 3, 2, 6]
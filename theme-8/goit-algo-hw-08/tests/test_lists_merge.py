@@ -0,0 +1,88 @@
+import heapq
+import random
+
+import pytest
+
+from sources.lists_merge import RUN_COPY_MIN_WINS, merge_k_lists, merge_k_lists_loser_tree
+
+
+def reference(lists):
+    return list(heapq.merge(*lists))
+
+
+@pytest.fixture(params=[True, False], ids=["copy_runs", "no_runs"])
+def copy_runs(request):
+    return request.param
+
+
+class TestMergeKListsLoserTree:
+    @pytest.mark.parametrize("lists", [[], [[]], [[], [], []]])
+    def test_empty_inputs(self, lists, copy_runs):
+        assert merge_k_lists_loser_tree(lists, copy_runs) == []
+
+    def test_single_list(self, copy_runs):
+        lst = [1, 2, 2, 5, 9]
+        result = merge_k_lists_loser_tree([lst], copy_runs)
+        assert result == lst
+        assert result is not lst
+
+    def test_single_list_among_empty(self, copy_runs):
+        assert merge_k_lists_loser_tree([[], [3, 4], []], copy_runs) == [3, 4]
+
+    def test_example(self, copy_runs):
+        lists = [[1, 4, 5], [1, 3, 4], [2, 6]]
+        assert merge_k_lists_loser_tree(lists, copy_runs) == reference(lists) == merge_k_lists(lists)
+
+    def test_duplicates(self, copy_runs):
+        lists = [[1, 1, 1, 2], [1, 1, 2, 2], [2, 2, 2], [1]]
+        assert merge_k_lists_loser_tree(lists, copy_runs) == reference(lists)
+
+    def test_all_equal(self, copy_runs):
+        lists = [[7] * 50 for _ in range(5)]
+        assert merge_k_lists_loser_tree(lists, copy_runs) == [7] * 250
+
+    def test_long_runs_from_one_source(self, copy_runs):
+        # one list supplies long stretches between single values of the others
+        long_list = list(range(0, 1000)) + list(range(2000, 3000))
+        lists = [long_list, [1500], [999, 3500], []]
+        assert merge_k_lists_loser_tree(lists, copy_runs) == reference(lists)
+
+    def test_run_ending_on_equal_values(self, copy_runs):
+        lists = [list(range(100)), [50, 50, 99], [99]]
+        assert merge_k_lists_loser_tree(lists, copy_runs) == reference(lists)
+
+    def test_run_just_over_trigger(self, copy_runs):
+        run = list(range(RUN_COPY_MIN_WINS + 1))
+        lists = [run, [RUN_COPY_MIN_WINS - 1]]
+        assert merge_k_lists_loser_tree(lists, copy_runs) == reference(lists)
+
+    def test_clustered_blocks(self, copy_runs):
+        rng = random.Random(3)
+        lists = [[] for _ in range(7)]
+        for start in range(0, 5000, 100):
+            lists[rng.randrange(7)].extend(range(start, start + 100))
+        assert merge_k_lists_loser_tree(lists, copy_runs) == list(range(5000))
+
+    @pytest.mark.parametrize("k", [2, 3, 5, 17, 64, 100])
+    def test_unbalanced_k(self, k, copy_runs):
+        rng = random.Random(k)
+        # lengths from empty to very long, so the tree gets uneven depths and early exhaustion
+        lists = [sorted(rng.randint(0, 50) for _ in range(rng.choice([0, 1, 3, 200])))
+                 for _ in range(k)]
+        assert merge_k_lists_loser_tree(lists, copy_runs) == reference(lists)
+
+    def test_random(self, copy_runs):
+        rng = random.Random(42)
+        for _ in range(300):
+            lists = [sorted(rng.randint(0, rng.choice([5, 30, 1000])) for _ in range(rng.randint(0, 40)))
+                     for _ in range(rng.randint(0, 12))]
+            assert merge_k_lists_loser_tree(lists, copy_runs) == reference(lists)
+
+    def test_floats_and_strings(self, copy_runs):
+        assert merge_k_lists_loser_tree([[0.5, 2.5], [1.0]], copy_runs) == [0.5, 1.0, 2.5]
+        assert merge_k_lists_loser_tree([["a", "c"], ["b"]], copy_runs) == ["a", "b", "c"]
+
+    def test_inputs_not_modified(self, copy_runs):
+        lists = [[1, 3], [2, 4]]
+        merge_k_lists_loser_tree(lists, copy_runs)
+        assert lists == [[1, 3], [2, 4]]
@@ -1,11 +1,26 @@
+from pathlib import Path
+
+from sources import benchmark_runner
 from sources.compare_find import compare_find
 
+RESULTS_PATH = "benchmark_results.json"
+BASELINE_PATH = "benchmark_baseline.json"
+
 
 def main():
     coins = [50, 25, 10, 5, 2, 1]
     test_amounts = [113, 500, 1000, 5000, 10000]
 
-    compare_find(coins, test_amounts)
+    results = compare_find(coins, test_amounts)
+
+    stats = [r[key] for r in results for key in ('greedy_stats', 'dp_stats')]
+    benchmark_runner.save_results(stats, RESULTS_PATH)
+    print(f"\nResults saved to {RESULTS_PATH}")
+
+    if Path(BASELINE_PATH).exists():
+        print(f"\nComparison with {BASELINE_PATH}:")
+        comparisons = benchmark_runner.compare_with_baseline(stats, benchmark_runner.load_results(BASELINE_PATH))
+        benchmark_runner.print_baseline_comparison(comparisons)
 
 
 if __name__ == "__main__":
@@ -1,14 +1,16 @@
-import time
+from .benchmark_runner import run_benchmark
+from .complexity_fit import fit_complexity, print_fit
 from .find_dynamic import find_min_coins
 from .find_greedy import find_coins_greedy
 
 
-def compare_find(coins: list[int], test_amounts: list[int]) -> list[dict[str, float]]:
+def compare_find(coins: list[int], test_amounts: list[int]) -> list[dict]:
     """
     Compare the performance of greedy and dynamic programming algorithms
     for finding minimum number of coins.
 
-    Tests both algorithms with various amounts and measures their execution time.
+    Tests both algorithms with various amounts and measures their execution time
+    (median of repeated, automatically calibrated measurements).
     """
 
     print("=" * 80)
@@ -24,26 +26,26 @@ def compare_find(coins: list[int], test_amounts: list[int]) -> list[dict[str, fl
         print("-" * 80)
 
         # greedy algorithm
-        start_time = time.perf_counter()
         greedy_result = find_coins_greedy(coins, amount)
-        greedy_time = time.perf_counter() - start_time
+        greedy_stats = run_benchmark(lambda: find_coins_greedy(coins, amount), name=f"greedy/{amount}")
+        greedy_time = greedy_stats.median
         greedy_total_coins = sum(greedy_result.values())
 
         print(f"Greedy Algorithm:")
         print(f"  Result: {greedy_result}")
         print(f"  Number of coins: {greedy_total_coins}")
-        print(f"  Execution time: {greedy_time:.8f} seconds")
+        print(f"  Execution time: {greedy_time:.8f} seconds (IQR {greedy_stats.iqr:.8f})")
 
         # dynamic programming algorithm
-        start_time = time.perf_counter()
         dp_result = find_min_coins(coins, amount)
-        dp_time = time.perf_counter() - start_time
+        dp_stats = run_benchmark(lambda: find_min_coins(coins, amount), name=f"dynamic/{amount}")
+        dp_time = dp_stats.median
         dp_total_coins = sum(dp_result.values())
 
         print(f"Dynamic Programming:")
         print(f"  Result: {dp_result}")
         print(f"  Number of coins: {dp_total_coins}")
-        print(f"  Execution time: {dp_time:.8f} seconds")
+        print(f"  Execution time: {dp_time:.8f} seconds (IQR {dp_stats.iqr:.8f})")
 
         # compare results
         speedup = dp_time / greedy_time if greedy_time > 0 else 0
@@ -57,7 +59,9 @@ def compare_find(coins: list[int], test_amounts: list[int]) -> list[dict[str, fl
             'dp_time': dp_time,
             'greedy_coins': greedy_total_coins,
             'dp_coins': dp_total_coins,
-            'speedup': speedup
+            'speedup': speedup,
+            'greedy_stats': greedy_stats,
+            'dp_stats': dp_stats
         })
 
     print("\n" + "=" * 80)
@@ -69,6 +73,13 @@ def compare_find(coins: list[int], test_amounts: list[int]) -> list[dict[str, fl
     for r in results:
         print(f"{r['amount']:>10} | {r['greedy_time']:>15.8f} | {r['dp_time']:>15.8f} | {r['speedup']:>12.2f}x")
 
+    if len(results) >= 2:
+        amounts = [r['amount'] for r in results]
+        print("-" * 80)
+        print("Empirical complexity in the amount (least-squares fit):")
+        print_fit("Greedy", fit_complexity(amounts, [r['greedy_time'] for r in results]))
+        print_fit("Dynamic Programming", fit_complexity(amounts, [r['dp_time'] for r in results]))
+
     print("=" * 80)
 
     return results